@@ -0,0 +1,64 @@
+"""Construction time and memory of chunks as pydantic models and as slotted records.
+
+Each chunk gets a fresh embedding list, as the embedding client returns
+them. Memory is what construction allocates on top of those lists and keeps
+(a validated `Chunk` holds its own copy of every float). Times include
+tracemalloc overhead, so compare them with each other only.
+
+    python -m benchmarks.chunk_record_benchmark --chunks 10000 --dimension 1024
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.domain.entities.chunk import Chunk, ChunkRecord
+
+
+def _fields(index: int, dimension: int) -> dict:
+    return {
+        "content": f"Seli ni kitengo cha msingi cha uhai {index}. " * 10,
+        "embedding": [index * 1e-3 + position * 1e-6 for position in range(dimension)],
+        "page_number": index // 4,
+        "chapter_number": index // 400 + 1,
+    }
+
+
+CONSTRUCTORS = {
+    "Chunk (validated)": lambda fields: Chunk(**fields),
+    "Chunk.model_construct": lambda fields: Chunk.model_construct(**fields),
+    "ChunkRecord": lambda fields: ChunkRecord(**fields),
+}
+
+
+def _measure(construct, count: int, dimension: int) -> tuple[float, float]:
+    inputs = [_fields(index, dimension) for index in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    started = time.perf_counter()
+    chunks = [construct(fields) for fields in inputs]
+    elapsed = time.perf_counter() - started
+
+    del inputs
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del chunks
+    return elapsed, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=10000)
+    parser.add_argument("--dimension", type=int, default=1024)
+    args = parser.parse_args()
+
+    for name, construct in CONSTRUCTORS.items():
+        elapsed, retained = _measure(construct, args.chunks, args.dimension)
+        print(f"{name:<22} {elapsed:7.3f}s {retained / 2**20:9.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Start-up cost of the CLI and the Dagster code location.
+
+Each entry point is imported in a fresh interpreter with `-X importtime`;
+the script prints the wall time and the slowest top-level imports, and
+flags any provider SDK that was loaded although no chunker was selected.
+
+    python -m benchmarks.import_time_benchmark --runs 5
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+
+ENTRY_POINTS = {
+    "src.main --help": [sys.executable, "-m", "src.main", "--help"],
+    "import src.dagster_defs": [sys.executable, "-c", "import src.dagster_defs"],
+}
+LAZY_MODULES = (
+    "langchain_community",
+    "langchain_google_genai",
+    "langchain_openai",
+    "together",
+    "mistralai",
+    "pypdf",
+)
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _run(command: list[str]) -> tuple[float, str]:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [command[0], "-X", "importtime", *command[1:]],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    return time.perf_counter() - started, completed.stderr
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    for name, command in ENTRY_POINTS.items():
+        timings: list[float] = []
+        for _ in range(args.runs):
+            elapsed, stderr = _run(command)
+            timings.append(elapsed)
+
+        if "ModuleNotFoundError" in stderr:
+            print(f"{name}: skipped, {stderr.strip().splitlines()[-1]}")
+            continue
+
+        top_level: list[tuple[int, str]] = []
+        loaded: set[str] = set()
+        for match in IMPORT_TIME_LINE.finditer(stderr):
+            cumulative, indent, module = int(match.group(2)), match.group(3), match.group(4)
+            loaded.add(module.split(".")[0])
+            if len(indent) == 1:
+                top_level.append((cumulative, module))
+
+        print(f"{name}: median {statistics.median(timings):.3f}s over {args.runs} runs")
+        for cumulative, module in sorted(top_level, reverse=True)[:args.top]:
+            print(f"  {cumulative / 1e6:.3f}s  {module}")
+        eager = sorted(loaded.intersection(LAZY_MODULES))
+        print(f"  provider SDKs loaded eagerly: {', '.join(eager) if eager else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Math-aware merge on adversarial inputs with unbalanced <math> tags.
+
+Compares the current merge over text spans with the previous `+=`
+implementation over LangChain documents, which grew a single buffer for
+the rest of the book after one unclosed tag.
+
+    python -m benchmarks.math_merge_benchmark --documents 20000
+"""
+import argparse
+import re
+import time
+
+from langchain_core.documents import Document
+
+from src.infrastructure.chunker.mathematical_chunker import MathematicalChunker
+from src.infrastructure.chunker.page_stages import merge_math_aware_spans
+from src.infrastructure.splitter.text_splitter import TextSpan
+
+
+MATH_TAG_PATTERN = re.compile(r"</?math>")
+
+
+def legacy_merge(documents: list[Document]) -> list[Document]:
+    merged_documents: list[Document] = []
+    buffer_text = ""
+    buffer_metadata = None
+    math_balance = 0
+
+    for doc in documents:
+        if buffer_metadata is None:
+            buffer_metadata = {**doc.metadata}
+
+        buffer_text += doc.page_content
+        for tag in MATH_TAG_PATTERN.findall(doc.page_content):
+            math_balance += 1 if tag == "<math>" else -1
+
+        if math_balance == 0:
+            merged_documents.append(Document(page_content=buffer_text, metadata=buffer_metadata))
+            buffer_text = ""
+            buffer_metadata = None
+
+    if buffer_text:
+        merged_documents.append(Document(page_content=buffer_text, metadata=buffer_metadata or {}))
+
+    return merged_documents
+
+
+def adversarial_documents(count: int, size: int) -> dict[str, list[Document]]:
+    body = "x" * (size - 20)
+    return {
+        "unclosed tag at start": [
+            Document(page_content=("<math>" if i == 0 else "") + body, metadata={"page_label": i})
+            for i in range(count)
+        ],
+        "stray closing tag at start": [
+            Document(page_content=("</math>" if i == 0 else "") + body, metadata={"page_label": i})
+            for i in range(count)
+        ],
+        "every 50th chunk opens a tag": [
+            Document(page_content=("<math>" if i % 50 == 0 else "") + body, metadata={"page_label": i})
+            for i in range(count)
+        ],
+    }
+
+
+def _timed(func, documents):
+    started = time.perf_counter()
+    result = func(documents)
+    return time.perf_counter() - started, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=MathematicalChunker.CHUNK_SIZE)
+    args = parser.parse_args()
+
+    for name, documents in adversarial_documents(args.documents, args.size).items():
+        legacy_time, legacy_result = _timed(legacy_merge, documents)
+        spans = [
+            TextSpan(page=doc.metadata["page_label"], start=0, end=len(doc.page_content), text=doc.page_content)
+            for doc in documents
+        ]
+        new_time, new_result = _timed(
+            lambda spans: merge_math_aware_spans(spans, MathematicalChunker.MAX_MERGED_CHUNK_SIZE),
+            spans,
+        )
+        print(name)
+        print(
+            f"  legacy:  {legacy_time:.3f}s, {len(legacy_result)} chunks, "
+            f"largest {max(len(doc.page_content) for doc in legacy_result)} chars"
+        )
+        print(
+            f"  current: {new_time:.3f}s, {len(new_result)} chunks, "
+            f"largest {max(len(span.text) for span in new_result)} chars"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Math expression wrapping on OCR-like pages with stray delimiters.
+
+Compares the single-pass scanner with the backtracking regex it replaced.
+Pages with an unmatched `$` or an unterminated `\\begin{align}` made the
+regex rescan the rest of the page from every candidate position.
+
+    python -m benchmarks.math_scanner_benchmark --pages 200 --size 20000
+"""
+import argparse
+import re
+import time
+
+from src.infrastructure.preprocessing.math_expressions import MATH_ENVIRONMENT_NAMES, wrap_math_expressions
+
+
+LEGACY_MATH_EXPRESSION_PATTERN = re.compile(
+    r"""
+    (\\begin\{(?P<env>""" + "|".join(re.escape(name) for name in MATH_ENVIRONMENT_NAMES) + r""")\}.*?\\end\{(?P=env)\})
+    |
+    (\$\$.*?\$\$)
+    |
+    (\\\[.*?\\\])
+    |
+    (\\\(.*?\\\))
+    |
+    (\$(?:\\.|[^$\\])+\$)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+
+def legacy_wrap(text: str) -> str:
+    def replacer(match: re.Match) -> str:
+        expression = match.group(0)
+        if "<math>" in expression or "</math>" in expression:
+            return expression
+        return f"<math>{expression}</math>"
+
+    return LEGACY_MATH_EXPRESSION_PATTERN.sub(replacer, text)
+
+
+def adversarial_pages(count: int, size: int) -> dict[str, list[str]]:
+    prose = "The price rose to 5 shillings while $x = 2$ held. "
+    body = (prose * (size // len(prose) + 1))[:size]
+    return {
+        "well-formed math": [body for _ in range(count)],
+        "stray dollar signs": [("$" + "word " * 20) * (size // 101) for _ in range(count)],
+        "unterminated environments": [("\\begin{align} " + "a &= b " * 10) * (size // 84) for _ in range(count)],
+        "unterminated display math": [("$$ " + "y " * 40) * (size // 83) for _ in range(count)],
+    }
+
+
+def _timed(func, pages):
+    started = time.perf_counter()
+    result = [func(page) for page in pages]
+    return time.perf_counter() - started, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--size", type=int, default=20000)
+    args = parser.parse_args()
+
+    for name, pages in adversarial_pages(args.pages, args.size).items():
+        legacy_time, legacy_result = _timed(legacy_wrap, pages)
+        new_time, new_result = _timed(wrap_math_expressions, pages)
+        print(name)
+        print(f"  legacy:  {legacy_time:.3f}s")
+        print(f"  current: {new_time:.3f}s, identical output: {legacy_result == new_result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Write time and file size of every output format for a synthetic book.
+
+Chunks carry random embeddings, which is the worst case for compression and
+the bulk of every real output. Formats whose optional package is missing
+are skipped.
+
+    python -m benchmarks.output_writer_benchmark --chunks 5000 --dimension 1024
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.application.pipeline_runner import write_output
+from src.domain.entities.book import OutputCompression, OutputFormat
+from src.domain.entities.chunk import Chunk
+from src.infrastructure.output.json_writer import StreamingJsonWriter
+
+
+def synthetic_payload(count: int, dimension: int) -> dict:
+    generator = np.random.default_rng(0)
+    return {
+        "resource": {"name": "Synthetic", "type": "textbook", "authors": []},
+        "chunks": [
+            Chunk(
+                content="Seli ni kitengo cha msingi cha uhai katika viumbe hai vyote. " * 15,
+                embedding=generator.normal(size=dimension).tolist(),
+                page_number=index // 4,
+                chapter_number=index // 400 + 1,
+            )
+            for index in range(count)
+        ],
+    }
+
+
+def _json_backend(backend: str, compression: OutputCompression = OutputCompression.NONE):
+    def write(output_path: Path, payload: dict) -> Path:
+        with StreamingJsonWriter(output_path, compression=compression, backend=backend) as writer:
+            writer.write_payload(payload)
+        return output_path
+
+    return write
+
+
+CASES = {
+    "json (stdlib)": _json_backend("json"),
+    "json (orjson)": _json_backend("orjson"),
+    "json + gzip": _json_backend("auto", OutputCompression.GZIP),
+    "json + zstd": _json_backend("auto", OutputCompression.ZSTD),
+    "parquet": lambda output_path, payload: write_output(output_path, payload, output_format=OutputFormat.PARQUET),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=5000)
+    parser.add_argument("--dimension", type=int, default=1024)
+    args = parser.parse_args()
+
+    payload = synthetic_payload(args.chunks, args.dimension)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for index, (name, write) in enumerate(CASES.items()):
+            started = time.perf_counter()
+            try:
+                written_path = write(Path(directory) / f"book_{index}.json", payload)
+            except ImportError as exc:
+                print(f"{name:<15} skipped: {exc}")
+                continue
+            elapsed = time.perf_counter() - started
+            print(f"{name:<15} {elapsed:7.2f}s {written_path.stat().st_size / 2**20:9.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Throughput of the in-house splitter against LangChain's RecursiveCharacterTextSplitter.
+
+Run from the repository root:
+
+    python -m benchmarks.text_splitter_benchmark --pages 300
+"""
+import argparse
+import random
+import time
+
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from src.infrastructure.splitter.text_splitter import DEFAULT_SEPARATORS, RecursiveTextSplitter
+
+
+WORDS = (
+    "the plant cell uses photosynthesis to convert light energy into chemical energy "
+    "mitochondria release energy during respiration in the Tanzanian highlands"
+).split()
+
+
+def make_pages(page_count: int, words_per_page: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    pages = []
+    for _ in range(page_count):
+        parts = []
+        for index in range(words_per_page):
+            parts.append(rng.choice(WORDS))
+            parts.append("\n\n" if index % 120 == 119 else "\n" if index % 15 == 14 else " ")
+        pages.append("".join(parts))
+    return pages
+
+
+def _best_of(repeats: int, func) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--words_per_page", type=int, default=450)
+    parser.add_argument("--chunk_size", type=int, default=800)
+    parser.add_argument("--chunk_overlap", type=int, default=134)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = make_pages(args.pages, args.words_per_page)
+    total_characters = sum(len(page) for page in pages)
+    documents = [Document(page_content=page, metadata={"page_label": i}) for i, page in enumerate(pages, 1)]
+
+    langchain_splitter = RecursiveCharacterTextSplitter(
+        separators=list(DEFAULT_SEPARATORS),
+        keep_separator=False,
+        chunk_size=args.chunk_size,
+        chunk_overlap=args.chunk_overlap,
+    )
+    native_splitter = RecursiveTextSplitter(
+        separators=DEFAULT_SEPARATORS,
+        chunk_size=args.chunk_size,
+        chunk_overlap=args.chunk_overlap,
+    )
+
+    langchain_time = _best_of(args.repeats, lambda: langchain_splitter.split_documents(documents))
+    native_time = _best_of(args.repeats, lambda: list(native_splitter.split_pages(pages)))
+
+    million_characters = total_characters / 1_000_000
+    print(f"{args.pages} pages, {million_characters:.2f}M characters")
+    print(f"langchain split_documents: {langchain_time:.3f}s ({million_characters / langchain_time:.2f} M chars/s)")
+    print(f"RecursiveTextSplitter:     {native_time:.3f}s ({million_characters / native_time:.2f} M chars/s)")
+    print(f"speedup: {langchain_time / native_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -258,6 +258,7 @@ class Chunk(SQLModel, table=True):
             postgresql_with={"m": 16, "ef_construction": 64},
             postgresql_ops={"embedding": "vector_cosine_ops"},
         ),
+        Index("chunk_resource_content_hash_idx", "resource_id", "content_hash"),
     )
     model_config = {"arbitrary_types_allowed": True}  # type: ignore
 
@@ -279,6 +280,8 @@ class Chunk(SQLModel, table=True):
     embedding: Any = Field(sa_column=Column(Vector(1024)))
     top_level_section_index: Optional[str] = Field(max_length=10, default=None)
     top_level_section_title: Optional[str] = Field(max_length=100, default=None)
+    # sha256 of content, used to sync a resource's chunks without comparing vectors
+    content_hash: Optional[str] = Field(max_length=64, default=None)
     created_at: Optional[datetime] = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         sa_type=DateTime(timezone=True),  # type: ignore
@@ -0,0 +1,330 @@
+import hashlib
+import logging
+import re
+import struct
+from dataclasses import dataclass
+from itertools import islice
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import asyncpg
+
+logger = logging.getLogger(__name__)
+
+COPY_BATCH_SIZE = 5000
+
+# Columns filled by COPY; id and created_at come from their server defaults.
+CHUNK_COLUMNS = (
+    "resource_id",
+    "content",
+    "page_number",
+    "chunk_type",
+    "embedding",
+    "top_level_section_index",
+    "top_level_section_title",
+    "content_hash",
+)
+STAGING_TABLE = "chunks_staging"
+
+VECTOR_HEADER = struct.Struct(">HH")
+MEMORY_SETTING_PATTERN = re.compile(r"^\d+\s*(kB|MB|GB|TB)?$")
+
+
+@dataclass(frozen=True)
+class HnswIndex:
+    """Build settings of the chunks table's HNSW index; the defaults match `models.Chunk`"""
+
+    m: int = 16
+    ef_construction: int = 64
+    # e.g. "2GB"; the graph builds much faster when it fits in memory.
+    maintenance_work_mem: Optional[str] = None
+    # Parallel build workers (pgvector 0.6+), besides the leader.
+    parallel_workers: Optional[int] = None
+    name: str = "chunk_embedding_idx"
+    table_name: str = "chunks"
+
+    def __post_init__(self):
+        if self.maintenance_work_mem and not MEMORY_SETTING_PATTERN.match(
+            self.maintenance_work_mem
+        ):
+            raise ValueError(
+                f"Invalid maintenance_work_mem {self.maintenance_work_mem!r}, expected e.g. '2GB'"
+            )
+
+    def drop_sql(self) -> str:
+        return f"DROP INDEX IF EXISTS {self.name}"
+
+    def settings_sql(self) -> list[str]:
+        """SET statements for the build's session; undo them with `reset_sql`"""
+        statements = []
+        if self.maintenance_work_mem:
+            statements.append(f"SET maintenance_work_mem = '{self.maintenance_work_mem}'")
+        if self.parallel_workers is not None:
+            statements.append(
+                f"SET max_parallel_maintenance_workers = {int(self.parallel_workers)}"
+            )
+        return statements
+
+    def reset_sql(self) -> list[str]:
+        return ["RESET maintenance_work_mem", "RESET max_parallel_maintenance_workers"]
+
+    def create_sql(self) -> str:
+        # CONCURRENTLY keeps reads and writes of the table going during the build.
+        return (
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {self.name} ON {self.table_name} "
+            f"USING hnsw (embedding vector_cosine_ops) "
+            f"WITH (m = {int(self.m)}, ef_construction = {int(self.ef_construction)})"
+        )
+
+
+def content_hash(content: str) -> str:
+    """sha256 of the chunk text, as written by the pipeline in each chunk's `content_hash`"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def encode_vector(value: Sequence[float]) -> bytes:
+    """pgvector binary format: uint16 dimension, uint16 unused, then big-endian float32s"""
+    array = np.asarray(value, dtype=">f4")
+    return VECTOR_HEADER.pack(len(array), 0) + array.tobytes()
+
+
+def decode_vector(data: bytes) -> np.ndarray:
+    dimension, _ = VECTOR_HEADER.unpack_from(data)
+    return np.frombuffer(data, dtype=">f4", count=dimension, offset=VECTOR_HEADER.size).astype(np.float32)
+
+
+async def register_vector_codec(connection: "asyncpg.Connection") -> None:
+    """Send and receive `vector` values in binary instead of their text form"""
+    await connection.set_type_codec(
+        "vector",
+        schema="public",
+        encoder=encode_vector,
+        decoder=decode_vector,
+        format="binary",
+    )
+
+
+async def copy_chunks(
+    connection: "asyncpg.Connection",
+    rows: Iterable[tuple[Any, ...]],
+    batch_size: int = COPY_BATCH_SIZE,
+    total: Optional[int] = None,
+    table_name: str = "chunks",
+) -> int:
+    """Stream rows (in `CHUNK_COLUMNS` order) into the chunks table with binary COPY.
+
+    Each batch is one `COPY ... FROM STDIN`; run it inside a transaction to make
+    the whole load atomic. Returns the number of rows copied.
+    """
+    rows = iter(rows)
+    copied = 0
+    started = perf_counter()
+
+    while batch := list(islice(rows, batch_size)):
+        await connection.copy_records_to_table(
+            table_name, records=batch, columns=CHUNK_COLUMNS
+        )
+        copied += len(batch)
+        elapsed = perf_counter() - started
+        logger.info(
+            f"Copied {copied}{f' of {total}' if total is not None else ''} chunks "
+            f"({copied / elapsed if elapsed else 0:.0f} rows/s)"
+        )
+
+    return copied
+
+
+async def drop_index(connection: "asyncpg.Connection", index: HnswIndex) -> None:
+    """Drop the HNSW index so the following COPY does not maintain the graph row by row
+
+    Holds an ACCESS EXCLUSIVE lock on the table until the transaction ends, so
+    only use it in a maintenance window.
+    """
+    await connection.execute(index.drop_sql())
+    logger.info(f"Dropped {index.name}; it is rebuilt after the load")
+
+
+async def index_is_valid(connection: "asyncpg.Connection", index: HnswIndex) -> Optional[bool]:
+    """`pg_index.indisvalid` of the index, or None when it does not exist"""
+    return await connection.fetchval(
+        """
+        SELECT i.indisvalid FROM pg_index AS i
+        JOIN pg_class AS c ON c.oid = i.indexrelid
+        WHERE c.relname = $1
+        """,
+        index.name,
+    )
+
+
+async def build_index(connection: "asyncpg.Connection", index: HnswIndex) -> float:
+    """Build the HNSW index in one pass over the table; returns the build time in seconds
+
+    CREATE INDEX CONCURRENTLY cannot run in a transaction, so `connection`
+    must not be in one. A failed concurrent build leaves an invalid index with
+    the same name, which IF NOT EXISTS would keep, so it is dropped first.
+    """
+    started = perf_counter()
+    if await index_is_valid(connection, index) is False:
+        logger.warning(f"{index.name} is invalid (an earlier build failed); dropping it")
+        await connection.execute(index.drop_sql())
+    for statement in index.settings_sql():
+        await connection.execute(statement)
+    try:
+        await connection.execute(index.create_sql())
+    finally:
+        for statement in index.reset_sql():
+            await connection.execute(statement)
+    elapsed = perf_counter() - started
+    logger.info(
+        f"Built {index.name} (m={index.m}, ef_construction={index.ef_construction}) in {elapsed:.1f}s"
+    )
+    return elapsed
+
+
+async def create_staging_table(connection: "asyncpg.Connection") -> None:
+    """Temporary, unindexed copy of the chunk columns, dropped at commit"""
+    await connection.execute(
+        f"CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS "
+        f"SELECT {', '.join(CHUNK_COLUMNS)} FROM chunks WITH NO DATA"
+    )
+
+
+async def stage_chunks(
+    connection: "asyncpg.Connection",
+    rows: Iterable[tuple[Any, ...]],
+    batch_size: int = COPY_BATCH_SIZE,
+    total: Optional[int] = None,
+) -> int:
+    """COPY rows into the staging table, then move them into chunks with one INSERT ... SELECT
+
+    The COPY touches no index and chunks only sees the rows once they have all
+    arrived. The insert still maintains the HNSW index row by row, like a direct
+    COPY would; it only takes row locks, so reads of chunks carry on. To build
+    the index once instead, drop and rebuild it (`drop_index`/`build_index`).
+    Must run in a transaction. Returns the number of rows inserted.
+    """
+    columns = ", ".join(CHUNK_COLUMNS)
+    await create_staging_table(connection)
+
+    started = perf_counter()
+    staged = await copy_chunks(
+        connection, rows, batch_size=batch_size, total=total, table_name=STAGING_TABLE
+    )
+    copy_time = perf_counter() - started
+
+    started = perf_counter()
+    await connection.execute(
+        f"INSERT INTO chunks ({columns}) SELECT {columns} FROM {STAGING_TABLE}"
+    )
+    insert_time = perf_counter() - started
+
+    logger.info(
+        f"Staged {staged} chunks in {copy_time:.1f}s, "
+        f"inserted them with index maintenance in {insert_time:.1f}s"
+    )
+    return staged
+
+
+def _row_count(status: str) -> int:
+    # Command tags look like "DELETE 3" or "INSERT 0 5".
+    return int(status.rsplit(" ", 1)[-1])
+
+
+async def add_content_hash_column(connection: "asyncpg.Connection") -> bool:
+    """Add `content_hash` and its index to a chunks table created before they existed
+
+    Checked first so that loads into an up-to-date table do not queue for the
+    ACCESS EXCLUSIVE lock of ALTER TABLE. Returns whether the column was added.
+    """
+    has_column = await connection.fetchval(
+        """
+        SELECT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND table_name = 'chunks' AND column_name = 'content_hash'
+        )
+        """
+    )
+    if has_column:
+        return False
+
+    await connection.execute("ALTER TABLE chunks ADD COLUMN IF NOT EXISTS content_hash varchar(64)")
+    await connection.execute(
+        "CREATE INDEX IF NOT EXISTS chunk_resource_content_hash_idx ON chunks (resource_id, content_hash)"
+    )
+    logger.info("Added chunks.content_hash and chunk_resource_content_hash_idx")
+    return True
+
+
+async def sync_chunks(
+    connection: "asyncpg.Connection",
+    rows: Iterable[tuple[Any, ...]],
+    resource_id: int,
+    batch_size: int = COPY_BATCH_SIZE,
+    total: Optional[int] = None,
+) -> tuple[int, int, int]:
+    """Make the resource's chunks match `rows` by content hash, comparing server-side.
+
+    The rows are copied into a temporary staging table and compared as
+    multisets: the n-th copy of a text matches the n-th chunk with its hash, so
+    a text repeated in the book keeps one row per copy. Unmatched chunks are
+    deleted and unmatched staged rows inserted; unchanged rows, and their HNSW
+    entries, are left alone. Rows loaded before hashes existed have none, so
+    they are replaced. Must run in a transaction. Returns the number of
+    inserted, deleted and unchanged chunks.
+    """
+    columns = ", ".join(CHUNK_COLUMNS)
+    await create_staging_table(connection)
+    staged = await copy_chunks(
+        connection, rows, batch_size=batch_size, total=total, table_name=STAGING_TABLE
+    )
+
+    deleted = _row_count(
+        await connection.execute(
+            f"""
+            DELETE FROM chunks
+            WHERE id IN (
+                SELECT c.id FROM (
+                    SELECT id, content_hash,
+                           row_number() OVER (PARTITION BY content_hash ORDER BY id) AS copy
+                    FROM chunks WHERE resource_id = $1
+                ) AS c
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM (
+                        SELECT content_hash, count(*) AS copies
+                        FROM {STAGING_TABLE} GROUP BY content_hash
+                    ) AS s
+                    WHERE s.content_hash = c.content_hash AND s.copies >= c.copy
+                )
+            )
+            """,
+            resource_id,
+        )
+    )
+    inserted = _row_count(
+        await connection.execute(
+            f"""
+            INSERT INTO chunks ({columns})
+            SELECT {columns} FROM (
+                SELECT *, row_number() OVER (PARTITION BY content_hash) AS copy
+                FROM {STAGING_TABLE}
+            ) AS s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM (
+                    SELECT content_hash, count(*) AS copies
+                    FROM chunks WHERE resource_id = $1 GROUP BY content_hash
+                ) AS c
+                WHERE c.content_hash = s.content_hash AND c.copies >= s.copy
+            )
+            """,
+            resource_id,
+        )
+    )
+
+    logger.info(
+        f"Synced {staged} chunks: {inserted} inserted, {deleted} deleted, {staged - inserted} unchanged"
+    )
+    return inserted, deleted, staged - inserted
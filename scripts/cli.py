@@ -7,9 +7,12 @@ from scripts.new_subject import create_subject
 from scripts.new_resource import (
     create_resource,
     create_chunks,
+    create_chunks_from_output,
     connect_resource_to_class,
 )
 from scripts.new_class import create_class
+from scripts.bulk_load import HnswIndex
+from scripts.load_library import load_library
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -17,6 +20,33 @@ logger = logging.getLogger(__name__)
 app = typer.Typer()
 
 
+def rebuilt_hnsw_index(
+    staging: bool,
+    rebuild_index: bool,
+    bulk: bool,
+    sync: bool,
+    hnsw_m: int,
+    hnsw_ef_construction: int,
+    maintenance_work_mem: Optional[str],
+    parallel_workers: Optional[int],
+) -> Optional[HnswIndex]:
+    """Check the index options of a load; returns the settings for --rebuild-index"""
+    if (staging or rebuild_index) and not bulk:
+        raise typer.BadParameter("--staging and --rebuild-index need --bulk")
+    if (staging or rebuild_index) and sync:
+        raise typer.BadParameter(
+            "--sync already stages rows and leaves the index alone; drop --staging/--rebuild-index"
+        )
+    if not rebuild_index:
+        return None
+    return HnswIndex(
+        m=hnsw_m,
+        ef_construction=hnsw_ef_construction,
+        maintenance_work_mem=maintenance_work_mem,
+        parallel_workers=parallel_workers,
+    )
+
+
 @app.command()
 def create_new_subject(
     yaml_path: str = typer.Option(..., help="Path to YAML file with subject data"),
@@ -64,13 +94,62 @@ def create_new_resource(
     class_identifier: Optional[str] = typer.Option(
         None, help="Identifier for the class in YAML file"
     ),
+    bulk: bool = typer.Option(
+        False, help="Load chunks with binary COPY instead of ORM inserts"
+    ),
+    batch_size: Optional[int] = typer.Option(
+        None, help="Chunks per commit (ORM, default 30) or per COPY (bulk, default 5000)"
+    ),
+    sync: bool = typer.Option(
+        False,
+        help="Update existing chunks by content hash: insert new, delete removed, keep unchanged",
+    ),
+    staging: bool = typer.Option(
+        False,
+        help="COPY into an unindexed staging table, then insert all rows in one statement (the index is still updated per row)",
+    ),
+    rebuild_index: bool = typer.Option(
+        False,
+        help="Maintenance windows only: drop the HNSW index for the load (blocking reads) and rebuild it concurrently",
+    ),
+    hnsw_m: int = typer.Option(16, help="HNSW m of the rebuilt index"),
+    hnsw_ef_construction: int = typer.Option(
+        64, help="HNSW ef_construction of the rebuilt index"
+    ),
+    maintenance_work_mem: Optional[str] = typer.Option(
+        None, help="maintenance_work_mem for the index build, e.g. 2GB"
+    ),
+    parallel_workers: Optional[int] = typer.Option(
+        None, help="max_parallel_maintenance_workers for the index build"
+    ),
 ) -> None:
     """Createdda new resource and optionally add chunks and connect to class"""
+    hnsw_index = rebuilt_hnsw_index(
+        staging,
+        rebuild_index,
+        bulk,
+        sync,
+        hnsw_m,
+        hnsw_ef_construction,
+        maintenance_work_mem,
+        parallel_workers,
+    )
     try:
         asyncio.run(create_resource(yaml_path, resource_identifier))
 
         if chunks_path:
-            asyncio.run(create_chunks(yaml_path, resource_identifier, chunks_path))
+            asyncio.run(
+                create_chunks(
+                    yaml_path,
+                    resource_identifier,
+                    chunks_path,
+                    bulk=bulk,
+                    batch_size=batch_size,
+                    staging=staging,
+                    rebuild_index=hnsw_index,
+                    sync=sync,
+                )
+            )
 
         if class_identifier:
             asyncio.run(
@@ -85,6 +164,111 @@ def create_new_resource(
         raise typer.Exit(1)
 
 
+@app.command()
+def load_pipeline_output(
+    yaml_path: str = typer.Option(..., help="Path to YAML file with resource data"),
+    resource_identifier: str = typer.Option(
+        ..., help="Identifier for resource in YAML file"
+    ),
+    output_path: str = typer.Option(
+        ...,
+        help="Pipeline output: the output path given to src.main, or one of its files (.json.zst, .parquet, manifest.json)",
+    ),
+    bulk: bool = typer.Option(
+        False, help="Load chunks with binary COPY instead of ORM inserts"
+    ),
+    batch_size: Optional[int] = typer.Option(
+        None, help="Chunks per commit (ORM, default 30) or per COPY (bulk, default 5000)"
+    ),
+    sync: bool = typer.Option(
+        False,
+        help="Update existing chunks by content hash: insert new, delete removed, keep unchanged",
+    ),
+    staging: bool = typer.Option(
+        False,
+        help="COPY into an unindexed staging table, then insert all rows in one statement (the index is still updated per row)",
+    ),
+    rebuild_index: bool = typer.Option(
+        False,
+        help="Maintenance windows only: drop the HNSW index for the load (blocking reads) and rebuild it concurrently",
+    ),
+    hnsw_m: int = typer.Option(16, help="HNSW m of the rebuilt index"),
+    hnsw_ef_construction: int = typer.Option(
+        64, help="HNSW ef_construction of the rebuilt index"
+    ),
+    maintenance_work_mem: Optional[str] = typer.Option(
+        None, help="maintenance_work_mem for the index build, e.g. 2GB"
+    ),
+    parallel_workers: Optional[int] = typer.Option(
+        None, help="max_parallel_maintenance_workers for the index build"
+    ),
+) -> None:
+    """Load the chunks of a pipeline output into an existing resource"""
+    hnsw_index = rebuilt_hnsw_index(
+        staging,
+        rebuild_index,
+        bulk,
+        sync,
+        hnsw_m,
+        hnsw_ef_construction,
+        maintenance_work_mem,
+        parallel_workers,
+    )
+    try:
+        asyncio.run(
+            create_chunks_from_output(
+                yaml_path,
+                resource_identifier,
+                output_path,
+                bulk=bulk,
+                batch_size=batch_size,
+                staging=staging,
+                rebuild_index=hnsw_index,
+                sync=sync,
+            )
+        )
+        logger.info(f"Successfully loaded {output_path} into {resource_identifier}")
+    except Exception as e:
+        logger.error(f"Failed to load pipeline output: {str(e)}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def load_new_library(
+    manifest_path: str = typer.Option(
+        ..., help="Path to YAML manifest listing the resources to load"
+    ),
+    concurrency: int = typer.Option(
+        4, help="Resources loaded at the same time (and database connections)"
+    ),
+    bulk: bool = typer.Option(
+        False, help="Load chunks with binary COPY instead of ORM inserts"
+    ),
+    batch_size: Optional[int] = typer.Option(
+        None, help="Chunks per commit (ORM, default 30) or per COPY (bulk, default 5000)"
+    ),
+    sync: bool = typer.Option(
+        False,
+        help="Update existing chunks by content hash: insert new, delete removed, keep unchanged",
+    ),
+) -> None:
+    """Create and fill many resources from a manifest, then connect them to their classes"""
+    try:
+        asyncio.run(
+            load_library(
+                manifest_path,
+                concurrency=concurrency,
+                bulk=bulk,
+                batch_size=batch_size,
+                sync=sync,
+            )
+        )
+        logger.info(f"Successfully loaded library from {manifest_path}")
+    except Exception as e:
+        logger.error(f"Failed to load library: {str(e)}")
+        raise typer.Exit(1)
+
+
 if __name__ == "__main__":
     app()
 
@@ -96,4 +280,22 @@ python -m scripts.cli create-new-class --yaml-path /Users/victoroldensand/Docume
 To create a new resource for a specific class
 python -m scripts.cli create-new-resource --yaml-path assets/data.yaml --resource-identifier geography_resource_form6 --chunks-path assets/chunks/geography_form_6_wiki_content_chunks.json --class-identifier geography_class_form6
 
+To load the chunks of a large resource with binary COPY instead of ORM inserts
+python -m scripts.cli create-new-resource --yaml-path assets/data.yaml --resource-identifier geography_resource_form6 --chunks-path assets/chunks/geography_form_6_wiki_content_chunks.json --bulk --batch-size 5000
+
+To load the chunks written by the pipeline (src.main) into an existing resource
+python -m scripts.cli load-pipeline-output --yaml-path assets/data.yaml --resource-identifier geography_resource_form6 --output-path data/output/geography_form_6.json.zst --bulk
+
+To bulk-load a large book through an unindexed staging table
+python -m scripts.cli load-pipeline-output --yaml-path assets/data.yaml --resource-identifier geography_resource_form6 --output-path data/output/geography_form_6.json.zst --bulk --staging
+
+In a maintenance window, to drop the HNSW index for the load and rebuild it once with new parameters
+python -m scripts.cli load-pipeline-output --yaml-path assets/data.yaml --resource-identifier geography_resource_form6 --output-path data/output/geography_form_6.json.zst --bulk --rebuild-index --hnsw-m 24 --maintenance-work-mem 2GB --parallel-workers 4
+
+To update a resource after its book was processed again, touching only the chunks that changed
+python -m scripts.cli load-pipeline-output --yaml-path assets/data.yaml --resource-identifier geography_resource_form6 --output-path data/output/geography_form_6.json.zst --sync
+
+To onboard every textbook of a form at once (see scripts/load_library.py for the manifest layout)
+python -m scripts.cli load-new-library --manifest-path assets/form6_library.yaml --concurrency 4 --bulk
+
 """
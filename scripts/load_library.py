@@ -0,0 +1,144 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Optional
+
+import yaml
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
+
+from database.utils import get_database_url
+from scripts.new_resource import (
+    connect_resources_to_classes,
+    create_chunks,
+    create_chunks_from_output,
+    create_resource,
+    upgrade_chunks_table,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LibraryEntry:
+    """One resource of a library manifest"""
+
+    resource_identifier: str
+    output_path: Optional[str] = None
+    chunks_path: Optional[str] = None
+    class_identifier: Optional[str] = None
+
+
+def read_library_manifest(manifest_path: str) -> tuple[str, list[LibraryEntry]]:
+    """Read a manifest with the YAML data file and the resources to load
+
+    yaml_path: assets/data.yaml
+    resources:
+      - resource_identifier: geography_resource_form6
+        output_path: data/output/geography_form_6.json.zst  # or chunks_path
+        class_identifier: geography_class_form6
+    """
+    with open(manifest_path) as f:
+        manifest = yaml.safe_load(f)
+
+    entries = [LibraryEntry(**resource) for resource in manifest["resources"]]
+    for entry in entries:
+        if entry.output_path and entry.chunks_path:
+            raise ValueError(
+                f"{entry.resource_identifier}: give output_path or chunks_path, not both"
+            )
+    return manifest["yaml_path"], entries
+
+
+async def load_resource(
+    engine: AsyncEngine,
+    yaml_path: str,
+    entry: LibraryEntry,
+    bulk: bool,
+    batch_size: Optional[int],
+    sync: bool,
+):
+    started = perf_counter()
+    await create_resource(yaml_path, entry.resource_identifier, engine=engine)
+
+    if entry.output_path:
+        await create_chunks_from_output(
+            yaml_path,
+            entry.resource_identifier,
+            entry.output_path,
+            bulk=bulk,
+            batch_size=batch_size,
+            sync=sync,
+            engine=engine,
+        )
+    elif entry.chunks_path:
+        await create_chunks(
+            yaml_path,
+            entry.resource_identifier,
+            entry.chunks_path,
+            bulk=bulk,
+            batch_size=batch_size,
+            sync=sync,
+            engine=engine,
+        )
+
+    logger.info(f"Loaded {entry.resource_identifier} in {perf_counter() - started:.1f}s")
+
+
+async def load_library(
+    manifest_path: str,
+    concurrency: int = 4,
+    bulk: bool = False,
+    batch_size: Optional[int] = None,
+    sync: bool = False,
+):
+    """Load every resource of a manifest on one pooled engine, `concurrency` at a time
+
+    Class links of the resources that loaded are created together at the end;
+    a failed resource does not stop the others, but makes the load fail.
+    """
+    yaml_path, entries = read_library_manifest(manifest_path)
+    engine = create_async_engine(
+        get_database_url(), pool_size=concurrency, max_overflow=0, pool_pre_ping=True
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def load(entry: LibraryEntry):
+        async with semaphore:
+            await load_resource(engine, yaml_path, entry, bulk, batch_size, sync)
+
+    try:
+        started = perf_counter()
+        # Once up front, so concurrent loads never queue behind an ALTER TABLE.
+        async with AsyncSession(engine) as session:
+            await upgrade_chunks_table(session)
+
+        results = await asyncio.gather(
+            *(load(entry) for entry in entries), return_exceptions=True
+        )
+
+        failed = [
+            (entry, result)
+            for entry, result in zip(entries, results)
+            if isinstance(result, Exception)
+        ]
+        for entry, error in failed:
+            logger.error(f"Failed to load {entry.resource_identifier}: {str(error)}")
+
+        links = [
+            (entry.class_identifier, entry.resource_identifier)
+            for entry, result in zip(entries, results)
+            if entry.class_identifier and not isinstance(result, Exception)
+        ]
+        if links:
+            await connect_resources_to_classes(yaml_path, links, engine=engine)
+
+        logger.info(
+            f"Loaded {len(entries) - len(failed)} of {len(entries)} resources "
+            f"in {perf_counter() - started:.1f}s"
+        )
+        if failed:
+            raise RuntimeError(f"{len(failed)} of {len(entries)} resources failed to load")
+    finally:
+        await engine.dispose()
@@ -1,25 +1,52 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-import json
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
+from pathlib import Path
+from itertools import islice
+from time import perf_counter
+from sqlalchemy import exists, tuple_
 from sqlmodel import select
 import logging
-from typing import Any
+from typing import Any, Iterable, Optional
 import yaml
 
 # Import all your models
+import database.enums as enums
 import database.models as models
 from database.utils import get_database_url
+from scripts.bulk_load import (
+    CHUNK_COLUMNS,
+    COPY_BATCH_SIZE,
+    HnswIndex,
+    add_content_hash_column,
+    build_index,
+    content_hash,
+    copy_chunks,
+    drop_index,
+    register_vector_codec,
+    stage_chunks,
+    sync_chunks,
+)
+from scripts.pipeline_output import OutputChunkRows, iter_output_chunks
+from src.infrastructure.output.json_writer import read_json_output
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-async def create_resource(file_path: str, resource_identifier: str):
+def load_json_file(path: str) -> Any:
+    """Load a JSON file, transparently decompressing gzip (.gz) or zstd (.zst) files"""
+    return read_json_output(Path(path))
+
+
+async def create_resource(
+    file_path: str, resource_identifier: str, engine: Optional[AsyncEngine] = None
+):
+    owns_engine = engine is None
     try:
         with open(file_path) as f:
             data = yaml.safe_load(f)
 
-        engine = create_async_engine(get_database_url())
+        engine = engine or create_async_engine(get_database_url())
 
         async with AsyncSession(engine) as session:
             resource_data = data[resource_identifier]
@@ -45,7 +72,8 @@ async def create_resource(file_path: str, resource_identifier: str):
         logger.error(f"Error injecting sample data: {str(e)}")
         raise
     finally:
-        await engine.dispose()
+        if owns_engine:
+            await engine.dispose()
 
 
 async def process_chunks(
@@ -70,6 +98,7 @@ async def process_chunks(
                     top_level_section_index=metadata["chapter_number"],
                     top_level_section_title=metadata["chapter"],
                     embedding=item["embedding"],
+                    content_hash=content_hash(item["chunk"]),
                 )
                 session.add(chunk)
 
@@ -83,9 +112,175 @@ async def process_chunks(
         raise
 
 
-async def create_chunks(file_path: str, resource_identifier: str, chunks_path: str):
+def chunk_type_label(value: Optional[str]) -> Optional[str]:
+    """Label of the chunktype enum for a chunk type given by value ("text") or name ("TEXT")"""
+    if value is None:
+        return None
+    try:
+        return enums.ChunkType(value).name
+    except ValueError:
+        return enums.ChunkType[value].name
+
+
+def json_chunk_rows(
+    json_data: list[dict[str, Any]], resource_id: int
+) -> Iterable[tuple[Any, ...]]:
+    """Rows in `CHUNK_COLUMNS` order for items shaped like {"chunk", "metadata", "embedding"}"""
+    for item in json_data:
+        metadata = item["metadata"]
+        yield (
+            resource_id,
+            item["chunk"],
+            None,
+            chunk_type_label(metadata["chunk_type"]),
+            item["embedding"],
+            metadata["chapter_number"],
+            metadata["chapter"],
+            content_hash(item["chunk"]),
+        )
+
+
+async def copy_process_chunks(
+    session: AsyncSession,
+    rows: Iterable[tuple[Any, ...]],
+    batch_size: int = COPY_BATCH_SIZE,
+    total: Optional[int] = None,
+    staging: bool = False,
+    rebuild_index: Optional[HnswIndex] = None,
+) -> int:
+    """Bulk-load chunk rows with binary COPY on the session's connection, in its transaction
+
+    With `staging`, rows are copied into an unindexed temporary table and
+    inserted with one statement, which still maintains the index per row. With `rebuild_index` (maintenance windows
+    only), the HNSW index is dropped in the load transaction, which blocks
+    reads of chunks until it commits, and built concurrently afterwards.
+    """
+    try:
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        asyncpg_connection = raw_connection.driver_connection
+        await register_vector_codec(asyncpg_connection)
+
+        if rebuild_index:
+            await drop_index(asyncpg_connection, rebuild_index)
+
+        started = perf_counter()
+        if staging:
+            copied = await stage_chunks(
+                asyncpg_connection, rows, batch_size=batch_size, total=total
+            )
+        else:
+            copied = await copy_chunks(
+                asyncpg_connection, rows, batch_size=batch_size, total=total
+            )
+        await session.commit()
+        load_time = perf_counter() - started
+
+        index_time = None
+        if rebuild_index:
+            index_time = await build_index_outside_transaction(
+                session.bind, rebuild_index
+            )
+
+        logger.info(
+            f"Copied {copied} chunks into the database: load {load_time:.1f}s"
+            + (f", index build {index_time:.1f}s" if index_time is not None else "")
+        )
+        return copied
+
+    except Exception as e:
+        logger.error(f"Error copying chunks: {str(e)}")
+        raise
+
+
+async def build_index_outside_transaction(engine: AsyncEngine, index: HnswIndex) -> float:
+    """Run the concurrent index build on its own autocommit connection"""
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        raw_connection = await connection.get_raw_connection()
+        return await build_index(raw_connection.driver_connection, index)
+
+
+async def process_chunk_rows(
+    session: AsyncSession,
+    rows: Iterable[tuple[Any, ...]],
+    batch_size: int = 30,
+) -> int:
+    """Insert chunk rows through the ORM, committing every `batch_size` rows"""
+    try:
+        rows = iter(rows)
+        saved = 0
+        while batch := list(islice(rows, batch_size)):
+            session.add_all(
+                models.Chunk(**dict(zip(CHUNK_COLUMNS, row))) for row in batch
+            )
+            await session.commit()
+            saved += len(batch)
+            logger.info(f"Processed and saved {saved} chunks")
+        return saved
+
+    except Exception as e:
+        logger.error(f"Error processing chunks: {str(e)}")
+        raise
+
+
+async def sync_process_chunks(
+    session: AsyncSession,
+    rows: Iterable[tuple[Any, ...]],
+    resource_id: int,
+    batch_size: int = COPY_BATCH_SIZE,
+    total: Optional[int] = None,
+) -> tuple[int, int, int]:
+    """Delta-sync a resource's chunks by content hash, in the session's transaction"""
+    try:
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        asyncpg_connection = raw_connection.driver_connection
+        await register_vector_codec(asyncpg_connection)
+
+        counts = await sync_chunks(
+            asyncpg_connection,
+            rows,
+            resource_id,
+            batch_size=batch_size,
+            total=total,
+        )
+
+        await session.commit()
+        return counts
+
+    except Exception as e:
+        logger.error(f"Error syncing chunks: {str(e)}")
+        raise
+
+
+async def upgrade_chunks_table(session: AsyncSession) -> None:
+    """Add the columns newer loads write to a chunks table created before them"""
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    if await add_content_hash_column(raw_connection.driver_connection):
+        await session.commit()
+
+
+async def resource_has_chunks(session: AsyncSession, resource_id: int) -> bool:
+    stmt = select(exists().where(models.Chunk.resource_id == resource_id))
+    return bool((await session.execute(stmt)).scalar())
+
+
+async def create_chunks(
+    file_path: str,
+    resource_identifier: str,
+    chunks_path: str,
+    bulk: bool = False,
+    batch_size: Optional[int] = None,
+    staging: bool = False,
+    rebuild_index: Optional[HnswIndex] = None,
+    sync: bool = False,
+    engine: Optional[AsyncEngine] = None,
+):
+    owns_engine = engine is None
     try:
-        engine = create_async_engine(get_database_url())
+        engine = engine or create_async_engine(get_database_url())
         with open(file_path) as f:
             yaml_data = yaml.safe_load(f)
             resource_name = yaml_data[resource_identifier]["name"]
@@ -100,40 +295,132 @@ async def create_chunks(file_path: str, resource_identifier: str, chunks_path: s
                     "Resource not found. Please create it before adding chunks."
                 )
 
-            # Check for existing chunks
-            chunks_stmt = select(models.Chunk).where(
-                models.Chunk.resource_id == resource.id
-            )
-            chunks_result = await session.execute(chunks_stmt)
-            existing_chunks = chunks_result.scalars().all()
+            await upgrade_chunks_table(session)
 
-            if existing_chunks:
+            # Check for existing chunks
+            if not sync and await resource_has_chunks(session, resource.id):
                 logger.info(
-                    f"Found {len(existing_chunks)} existing chunks for resource {resource_name}"
+                    f"Found existing chunks for resource {resource_name}; use --sync to update them"
                 )
                 return
 
             # Load and process chunks if none exist
-            with open(chunks_path, "r") as f:
-                chunks_data = json.load(f)
+            chunks_data = load_json_file(chunks_path)
+
+            if sync:
+                await sync_process_chunks(
+                    session=session,
+                    rows=json_chunk_rows(chunks_data, resource.id),
+                    resource_id=resource.id,
+                    batch_size=batch_size or COPY_BATCH_SIZE,
+                    total=len(chunks_data),
+                )
+            elif bulk:
+                await copy_process_chunks(
+                    session=session,
+                    rows=json_chunk_rows(chunks_data, resource.id),
+                    batch_size=batch_size or COPY_BATCH_SIZE,
+                    total=len(chunks_data),
+                    staging=staging,
+                    rebuild_index=rebuild_index,
+                )
+            else:
+                await process_chunks(
+                    session=session,
+                    json_data=chunks_data,
+                    resource_id=resource.id,
+                    batch_size=batch_size or 30,
+                )
+            logger.info("Vector data injection complete.")
 
-            await process_chunks(
-                session=session, json_data=chunks_data, resource_id=resource.id
-            )
+    except Exception as e:
+        logger.error(f"Error injecting vector data: {str(e)}")
+        raise
+    finally:
+        if owns_engine:
+            await engine.dispose()
+
+
+async def create_chunks_from_output(
+    file_path: str,
+    resource_identifier: str,
+    output_path: str,
+    bulk: bool = False,
+    batch_size: Optional[int] = None,
+    staging: bool = False,
+    rebuild_index: Optional[HnswIndex] = None,
+    sync: bool = False,
+    engine: Optional[AsyncEngine] = None,
+):
+    """Load the chunks of a pipeline output (JSON, sharded or Parquet) without reading it whole"""
+    owns_engine = engine is None
+    try:
+        engine = engine or create_async_engine(get_database_url())
+        with open(file_path) as f:
+            yaml_data = yaml.safe_load(f)
+            resource_name = yaml_data[resource_identifier]["name"]
+
+        async with AsyncSession(engine) as session:
+            stmt = select(models.Resource).where(models.Resource.name == resource_name)
+            result = await session.execute(stmt)
+            resource = result.scalar_one_or_none()
+
+            if not resource:
+                raise ValueError(
+                    "Resource not found. Please create it before adding chunks."
+                )
+
+            await upgrade_chunks_table(session)
+
+            if not sync and await resource_has_chunks(session, resource.id):
+                logger.info(
+                    f"Found existing chunks for resource {resource_name}; use --sync to update them"
+                )
+                return
+
+            rows = OutputChunkRows(iter_output_chunks(output_path), resource.id)
+            if sync:
+                await sync_process_chunks(
+                    session=session,
+                    rows=rows,
+                    resource_id=resource.id,
+                    batch_size=batch_size or COPY_BATCH_SIZE,
+                )
+            elif bulk:
+                await copy_process_chunks(
+                    session=session,
+                    rows=rows,
+                    batch_size=batch_size or COPY_BATCH_SIZE,
+                    staging=staging,
+                    rebuild_index=rebuild_index,
+                )
+            else:
+                await process_chunk_rows(
+                    session=session, rows=rows, batch_size=batch_size or 30
+                )
+            if rows.skipped:
+                logger.warning(
+                    f"Skipped {rows.skipped} chunks without an embedding (failed embedding requests)"
+                )
             logger.info("Vector data injection complete.")
 
     except Exception as e:
         logger.error(f"Error injecting vector data: {str(e)}")
         raise
     finally:
-        await engine.dispose()
+        if owns_engine:
+            await engine.dispose()
 
 
 async def connect_resource_to_class(
-    yaml_path: str, class_identifier: str, resource_identifier: str
+    yaml_path: str,
+    class_identifier: str,
+    resource_identifier: str,
+    engine: Optional[AsyncEngine] = None,
 ):
+    owns_engine = engine is None
     try:
-        engine = create_async_engine(get_database_url())
+        engine = engine or create_async_engine(get_database_url())
 
         # Load data from YAML
         with open(yaml_path) as f:
@@ -187,4 +474,93 @@ async def connect_resource_to_class(
         logger.error(f"Error connecting resource to class: {str(e)}")
         raise
     finally:
-        await engine.dispose()
+        if owns_engine:
+            await engine.dispose()
+
+
+async def connect_resources_to_classes(
+    yaml_path: str,
+    links: list[tuple[str, str]],
+    engine: Optional[AsyncEngine] = None,
+):
+    """Create many (class_identifier, resource_identifier) links with a few queries and one commit"""
+    owns_engine = engine is None
+    try:
+        engine = engine or create_async_engine(get_database_url())
+
+        with open(yaml_path) as f:
+            data = yaml.safe_load(f)
+
+        resource_names = {
+            resource_identifier: data[resource_identifier]["name"]
+            for _, resource_identifier in links
+        }
+        grade_levels = {
+            class_identifier: data[class_identifier]["grade_level"]
+            for class_identifier, _ in links
+        }
+
+        async with AsyncSession(engine) as session:
+            resource_stmt = select(models.Resource).where(
+                models.Resource.name.in_(set(resource_names.values()))
+            )
+            resources = {
+                resource.name: resource
+                for resource in (await session.execute(resource_stmt)).scalars()
+            }
+            class_stmt = select(models.Class).where(
+                models.Class.grade_level.in_(set(grade_levels.values()))
+            )
+            # Keyed by value and name, whichever the YAML file uses.
+            classes: dict[str, list[models.Class]] = {}
+            for class_obj in (await session.execute(class_stmt)).scalars():
+                for key in {class_obj.grade_level.value, class_obj.grade_level.name}:
+                    classes.setdefault(key, []).append(class_obj)
+
+            pairs = set()
+            for class_identifier, resource_identifier in links:
+                resource = resources.get(resource_names[resource_identifier])
+                if not resource:
+                    raise ValueError(
+                        f"Resource {resource_names[resource_identifier]} not found"
+                    )
+                matches = classes.get(grade_levels[class_identifier], [])
+                if not matches:
+                    raise ValueError(
+                        f"Class with grade level {grade_levels[class_identifier]} not found"
+                    )
+                if len(matches) > 1:
+                    raise ValueError(
+                        f"{len(matches)} classes have grade level {grade_levels[class_identifier]} "
+                        f"(IDs {', '.join(str(class_obj.id) for class_obj in matches)}); cannot tell which one "
+                        f"{class_identifier} is"
+                    )
+                class_obj = matches[0]
+                pairs.add((class_obj.id, resource.id))
+
+            rel_stmt = select(
+                models.ClassResource.class_id, models.ClassResource.resource_id
+            ).where(
+                tuple_(
+                    models.ClassResource.class_id, models.ClassResource.resource_id
+                ).in_(pairs)
+            )
+            existing = set((await session.execute(rel_stmt)).all())
+
+            new_pairs = pairs - {tuple(row) for row in existing}
+            session.add_all(
+                models.ClassResource(class_id=class_id, resource_id=resource_id)
+                for class_id, resource_id in sorted(new_pairs)
+            )
+            await session.commit()
+            logger.info(
+                f"Created {len(new_pairs)} class-resource relationships "
+                f"({len(pairs) - len(new_pairs)} already existed)"
+            )
+
+    except Exception as e:
+        logger.error(f"Error connecting resources to classes: {str(e)}")
+        raise
+    finally:
+        if owns_engine:
+            await engine.dispose()
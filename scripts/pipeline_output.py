@@ -0,0 +1,60 @@
+import logging
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import database.enums as enums
+from scripts.bulk_load import content_hash
+from src.infrastructure.output.reader import open_output
+
+logger = logging.getLogger(__name__)
+
+# Column lengths of `models.Chunk`.
+SECTION_INDEX_LENGTH = 10
+SECTION_TITLE_LENGTH = 100
+
+
+def iter_output_chunks(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Yield the chunks of a pipeline output one at a time, in book order.
+
+    `path` is the output path given to the pipeline or one of the files it
+    wrote; every output format (JSON, sharded, Parquet) is read through
+    `src.infrastructure.output.reader`, so only one chunk is parsed at a time.
+    """
+    with open_output(Path(path)) as reader:
+        yield from reader.iter_chunks()
+
+
+def output_chunk_row(chunk: dict[str, Any], resource_id: int) -> tuple[Any, ...]:
+    """A pipeline output chunk as a row in `scripts.bulk_load.CHUNK_COLUMNS` order"""
+    chapter_number = chunk.get("chapter_number")
+    chapter_title = chunk.get("chapter_title")
+    return (
+        resource_id,
+        chunk["content"],
+        chunk.get("page_number"),
+        enums.ChunkType.TEXT.name,
+        chunk["embedding"],
+        None if chapter_number is None else str(chapter_number)[:SECTION_INDEX_LENGTH],
+        chapter_title[:SECTION_TITLE_LENGTH] if chapter_title else None,
+        chunk.get("content_hash") or content_hash(chunk["content"]),
+    )
+
+
+class OutputChunkRows:
+    """Rows of the chunks that have an embedding, counting the ones skipped
+
+    Chunks whose embedding request failed are kept by some chunkers with an
+    empty embedding, which the vector column rejects (aborting a COPY).
+    """
+
+    def __init__(self, chunks: Iterable[dict[str, Any]], resource_id: int):
+        self.chunks = chunks
+        self.resource_id = resource_id
+        self.skipped = 0
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        for chunk in self.chunks:
+            if not chunk.get("embedding"):
+                self.skipped += 1
+                continue
+            yield output_chunk_row(chunk, self.resource_id)
@@ -1,6 +1,32 @@
+from importlib import import_module
+
 from src.domain.entities.chunker import Chunker, ChunkerConfig, ChunkerType
-from src.infrastructure.chunker.langchain_chunker import LangchainChunker
-from src.infrastructure.chunker.mathematical_chunker import MathematicalChunker
+
+
+# Chunker modules are imported only when selected, so the CLI and Dagster code
+# location do not load LangChain, pypdf or provider SDKs for unused chunkers.
+CHUNKER_REGISTRY: dict[ChunkerType, str] = {
+    ChunkerType.LANGCHAIN: "src.infrastructure.chunker.langchain_chunker:LangchainChunker",
+    ChunkerType.MATHEMATICAL: "src.infrastructure.chunker.mathematical_chunker:MathematicalChunker",
+    ChunkerType.SEMANTIC: "src.infrastructure.chunker.semantic_chunker:SemanticChunker",
+    ChunkerType.MARKDOWN: "src.infrastructure.chunker.markdown_chunker:MarkdownChunker",
+}
+
+DEPRECATED_CHUNKERS = {
+    ChunkerType.UNSTRUCTURED: "Unstructured chunker is deprecated. Choose other.",
+    ChunkerType.LLM: "LLM chunker is deprecated. Choose other.",
+}
+
+
+def load_chunker_class(chunker_type: ChunkerType) -> type[Chunker]:
+    if chunker_type in DEPRECATED_CHUNKERS:
+        raise ValueError(DEPRECATED_CHUNKERS[chunker_type])
+
+    if chunker_type not in CHUNKER_REGISTRY:
+        raise ChunkerNotImplementedError(chunker_type)
+
+    module_name, class_name = CHUNKER_REGISTRY[chunker_type].split(":")
+    return getattr(import_module(module_name), class_name)
 
 
 class ChunkerFactory:
@@ -8,20 +34,7 @@ class ChunkerFactory:
         self.config = config
 
     def get_chunker(self) -> Chunker:
-        if self.config.chunker_type == ChunkerType.UNSTRUCTURED:
-            raise ValueError("Unstructured chunker is deprecated. Choose other.")
-        
-        if self.config.chunker_type == ChunkerType.LANGCHAIN:
-            return LangchainChunker(config=self.config)
-
-        if self.config.chunker_type == ChunkerType.LLM:
-            raise ValueError("LLM chunker is deprecated. Choose other.")
-        
-        if self.config.chunker_type == ChunkerType.MATHEMATICAL:
-            return MathematicalChunker(config=self.config)
-
-        else:
-            raise ChunkerNotImplementedError(self.config.chunker_type)
+        return load_chunker_class(self.config.chunker_type)(config=self.config)
 
 
 class ChunkerNotImplementedError(Exception):
@@ -1,6 +1,6 @@
 from langchain_core.documents import Document
 
-from src.domain.entities.chunk import Chunk
+from src.domain.entities.chunk import ChunkRecord
 
 
 class LLMMapper:
@@ -10,8 +10,8 @@ class LLMMapper:
         text_initial_page: int,
         content_text: str,
         content_embedding: list[float],
-    ) -> Chunk:
-        return Chunk(
+    ) -> ChunkRecord:
+        return ChunkRecord(
             content=content_text,
             embedding=content_embedding,
             page_number=page_number + text_initial_page - 1,
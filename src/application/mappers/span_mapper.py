@@ -0,0 +1,21 @@
+from src.domain.entities.chunk import ChunkRecord
+
+
+class SpanMapper:
+    def map(
+        text: str,
+        page_label: int,
+        content_embedding: list[float],
+        chapter_number: int,
+        text_initial_page: int,
+        chapter_title: str | None = None,
+        section_title: str | None = None,
+    ) -> ChunkRecord:
+        return ChunkRecord(
+            content=text,
+            embedding=content_embedding,
+            page_number=page_label - text_initial_page + 1,
+            chapter_number=chapter_number,
+            chapter_title=chapter_title,
+            section_title=section_title,
+        )
@@ -1,21 +1,40 @@
-import json
 import logging
 import subprocess
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import yaml
 
 from src.application.factories.chunker_factory import ChunkerFactory
-from src.config.settings import settings
-from src.domain.entities.book import BookConfig, ClassConfig, ResourceConfig, SubjectConfig
-from src.domain.entities.chunk import Chunk
+from src.config.settings import get_settings
+from src.domain.entities.book import BookConfig, OutputCompression, OutputFormat, ClassConfig, ResourceConfig, SubjectConfig
+from src.domain.entities.chunk import ChunkRecord, compute_content_hash
 from src.domain.entities.chunker import Chunker, ChunkerConfig, ChunkerType, EmbedderProvider
 from src.domain.entities.table_of_contents import (
     TableOfContents,
     TableOfContentsParserConfig,
     TableOfContentsParserType,
 )
+from src.infrastructure.output.json_writer import (
+    StreamingJsonWriter,
+    compressed_output_path,
+    json_index_path,
+    output_stem,
+    read_json_output,
+)
+from src.infrastructure.output.parquet_writer import (
+    parquet_output_paths,
+    read_parquet_output,
+    write_parquet_output,
+)
+from src.infrastructure.output.sharded_writer import (
+    MANIFEST_NAME,
+    read_sharded_output,
+    sharded_output_dir,
+    write_sharded_output,
+)
+from src.infrastructure.preprocessing.repeated_lines import DEFAULT_REPEATED_LINE_PAGE_FRACTION
 from src.infrastructure.table_of_contents.table_of_contents import get_table_of_contents
 
 
@@ -52,8 +71,8 @@ def resolve_book_paths(
     input_root: Path | None = None,
     output_root: Path | None = None,
 ) -> tuple[Path, Path, Path]:
-    books_root = input_root or Path(settings.INPUT_BOOKS_PATH)
-    output_root = output_root or Path(settings.OUTPUT_BOOKS_PATH)
+    books_root = input_root or Path(get_settings().INPUT_BOOKS_PATH)
+    output_root = output_root or Path(get_settings().OUTPUT_BOOKS_PATH)
 
     book_dir = books_root / input_dir
     info_path = book_dir / "info.yaml"
@@ -96,6 +115,13 @@ def _default_toc_parser_for_embedder_provider(
     return TableOfContentsParserType.OLLAMA
 
 
+def _repeated_line_page_fraction(value: float | bool | None) -> float | None:
+    """Repeated-line stripping is opt-in: `true` uses the default share of pages, a number sets it."""
+    if value is True:
+        return DEFAULT_REPEATED_LINE_PAGE_FRACTION
+    return value or None
+
+
 def build_book_config(
     info_path: Path,
     input_path: Path,
@@ -106,7 +132,24 @@ def build_book_config(
     embedding_model_name: str | None = None,
     embedding_provider: EmbedderProvider = DEFAULT_EMBEDDING_PROVIDER,
     page_batch_size: int | None = None,
+    tokenizer_path: str | None = None,
+    chunk_size: int | None = None,
+    chunk_overlap: int | None = None,
+    max_merged_chunk_size: int | None = None,
+    near_duplicate_threshold: float | None = None,
+    max_workers: int | None = None,
+    incremental: bool = False,
+    pretty_output: bool = False,
+    output_format: OutputFormat = OutputFormat.JSON,
+    output_compression: OutputCompression = OutputCompression.NONE,
 ) -> BookConfig:
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if chunk_overlap is not None and chunk_overlap < 0:
+        raise ValueError(f"chunk_overlap must not be negative, got {chunk_overlap}")
+    if chunk_size is not None and chunk_overlap is not None and chunk_overlap >= chunk_size:
+        raise ValueError(f"chunk_overlap ({chunk_overlap}) must be smaller than chunk_size ({chunk_size})")
+
     yaml_data = load_info_yaml(info_path)
     resolved_llm_model = llm_model_name or DEFAULT_LLM_MODEL
     resolved_embedding_model = embedding_model_name or DEFAULT_EMBEDDING_MODEL
@@ -118,6 +161,16 @@ def build_book_config(
         llm_model_name=resolved_llm_model,
         embedding_model_name=resolved_embedding_model,
         embedding_provider=embedding_provider,
+        boilerplate_patterns=yaml_data["book_config"].get("boilerplate_patterns") or [],
+        repeated_line_page_fraction=_repeated_line_page_fraction(
+            yaml_data["book_config"].get("repeated_line_page_fraction")
+        ),
+        tokenizer_path=tokenizer_path,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        max_merged_chunk_size=max_merged_chunk_size,
+        near_duplicate_threshold=near_duplicate_threshold,
+        max_workers=max_workers,
     )
 
     resource_config, class_config, subject_config = get_resource_class_and_subject_config(yaml_data)
@@ -143,12 +196,16 @@ def build_book_config(
         ),
         table_of_contents_parser=toc_parser_config,
         first_page_number=yaml_data["book_config"]["first_page_number"],
+        incremental=incremental,
+        pretty_output=pretty_output,
+        output_format=output_format,
+        output_compression=output_compression,
     )
 
 
 def create_output_payload(
     config: BookConfig,
-    chunks: list[Chunk],
+    chunks: list[ChunkRecord],
     table_of_contents: TableOfContents,
 ) -> dict[str, Any]:
     return {
@@ -157,7 +214,88 @@ def create_output_payload(
         "subject": config.subject.model_dump(),
         "table_of_contents": table_of_contents.model_dump(),
         "chunker_config": config.chunker_config.model_dump(),
-        "chunks": [chunk.model_dump() for chunk in chunks],
+        # Kept as records; write_output serializes them one at a time.
+        "chunks": chunks,
+    }
+
+
+def load_reusable_embeddings(config: BookConfig) -> tuple[dict[str, list[float]], list[str]] | None:
+    """Reads the previous output for this book; returns its vectors by content hash and its chunk hashes.
+
+    Returns None when there is no previous output or it was embedded with a
+    different model, in which case every chunk is embedded again.
+    """
+    if config.output_format == OutputFormat.PARQUET:
+        previous_path = parquet_output_paths(config.output_path)[1]
+    elif config.output_format == OutputFormat.SHARDED:
+        previous_path = sharded_output_dir(config.output_path) / MANIFEST_NAME
+    else:
+        previous_path = compressed_output_path(config.output_path, config.output_compression)
+
+    if not previous_path.exists():
+        logging.info("No previous output at %s; embedding every chunk.", previous_path)
+        return None
+
+    if config.output_format == OutputFormat.PARQUET:
+        previous_payload = read_parquet_output(config.output_path)
+    elif config.output_format == OutputFormat.SHARDED:
+        previous_payload = read_sharded_output(config.output_path)
+    else:
+        previous_payload = read_json_output(previous_path)
+
+    previous_config = previous_payload.get("chunker_config", {})
+    current_config = config.chunker_config
+    if (
+        previous_config.get("embedding_model_name") != current_config.embedding_model_name
+        or previous_config.get("embedding_provider") != current_config.embedding_provider
+    ):
+        logging.warning("Previous output used a different embedding model; embedding every chunk.")
+        return None
+
+    reusable: dict[str, list[float]] = {}
+    previous_hashes: list[str] = []
+    for chunk in previous_payload.get("chunks", []):
+        content_hash = chunk.get("content_hash") or compute_content_hash(chunk["content"])
+        previous_hashes.append(content_hash)
+        if chunk.get("embedding"):
+            reusable[content_hash] = chunk["embedding"]
+
+    return reusable, previous_hashes
+
+
+def sentence_embeddings_path(output_path: Path) -> Path:
+    """Sidecar with the sentence vectors of the semantic chunker (`book.json` -> `book.sentence_embeddings.npz`)."""
+    stem = output_stem(output_path)
+    return stem.with_name(f"{stem.name}.sentence_embeddings.npz")
+
+
+def load_sentence_embeddings(path: Path) -> dict[str, list[float]]:
+    if not path.exists():
+        return {}
+    with np.load(path) as data:
+        return dict(zip(data["content_hashes"].tolist(), data["embeddings"].tolist()))
+
+
+def save_sentence_embeddings(path: Path, embeddings: dict[str, list[float]]) -> None:
+    # Written through a file handle so numpy does not append its own .npz suffix.
+    with path.open("wb") as handle:
+        np.savez(
+            handle,
+            content_hashes=np.asarray(list(embeddings), dtype=str),
+            embeddings=np.asarray(list(embeddings.values()), dtype=np.float32),
+        )
+
+
+def summarize_changes(previous_hashes: list[str], chunks: list[ChunkRecord]) -> dict[str, Any]:
+    """Diffs chunk content hashes against the previous run, as a delta for the DB loader."""
+    previous = set(previous_hashes)
+    current_hashes = [chunk.content_hash for chunk in chunks]
+    current = set(current_hashes)
+
+    return {
+        "added": list(dict.fromkeys(content_hash for content_hash in current_hashes if content_hash not in previous)),
+        "removed": list(dict.fromkeys(content_hash for content_hash in previous_hashes if content_hash not in current)),
+        "unchanged": len(previous & current),
     }
 
 
@@ -165,27 +303,79 @@ def run_pipeline(config: BookConfig) -> dict[str, Any]:
     chunker_factory = ChunkerFactory(config.chunker_config)
     chunker: Chunker = chunker_factory.get_chunker()
 
-    toc: TableOfContents = get_table_of_contents(
-        pdf_path=config.input_path,
-        toc_page_number=config.table_of_contents_page_number,
-        parser_config=config.table_of_contents_parser,
-    )
-
-    logging.info("Table of contents:\n%s", toc)
-
-    chunks: list[Chunk] = chunker.chunk(
+    previous = load_reusable_embeddings(config) if config.incremental else None
+    if previous is not None:
+        # Sentence vectors only exist for the semantic chunker; chunk vectors win on a shared hash.
+        chunker.reusable_embeddings = {
+            **load_sentence_embeddings(sentence_embeddings_path(config.output_path)),
+            **previous[0],
+        }
+
+    if chunker.USES_TABLE_OF_CONTENTS:
+        toc: TableOfContents = get_table_of_contents(
+            pdf_path=config.input_path,
+            toc_page_number=config.table_of_contents_page_number,
+            parser_config=config.table_of_contents_parser,
+        )
+        logging.info("Table of contents:\n%s", toc)
+    else:
+        toc = TableOfContents(chapters=[])
+
+    chunks: list[ChunkRecord] = chunker.chunk(
         book_path=config.input_path,
         table_of_contents=toc,
         text_initial_page=config.first_page_number,
     )
 
-    return create_output_payload(config=config, chunks=chunks, table_of_contents=toc)
+    if chunker.derived_table_of_contents is not None:
+        toc = chunker.derived_table_of_contents
+        logging.info("Table of contents derived from headings:\n%s", toc)
+
+    if chunker.sentence_embeddings:
+        save_sentence_embeddings(sentence_embeddings_path(config.output_path), chunker.sentence_embeddings)
+
+    payload = create_output_payload(config=config, chunks=chunks, table_of_contents=toc)
 
+    if previous is not None:
+        payload["changes"] = summarize_changes(previous[1], chunks)
+        logging.info(
+            "Changes since the previous run: %d added, %d removed, %d unchanged",
+            len(payload["changes"]["added"]),
+            len(payload["changes"]["removed"]),
+            payload["changes"]["unchanged"],
+        )
 
-def write_output(output_path: Path, payload: dict[str, Any]) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=False, indent=4)
+    return payload
+
+
+def write_output(
+    output_path: Path,
+    payload: dict[str, Any],
+    *,
+    pretty: bool = False,
+    output_format: OutputFormat = OutputFormat.JSON,
+    compression: OutputCompression = OutputCompression.NONE,
+) -> Path:
+    """Writes the payload in `output_format`; returns the chunk file, or the manifest of a sharded output."""
+    if output_format == OutputFormat.PARQUET:
+        if compression != OutputCompression.NONE:
+            logging.warning(
+                "output_compression=%s is ignored for Parquet outputs, whose row groups are always zstd-compressed.",
+                compression.value,
+            )
+        return write_parquet_output(output_path, payload)[0]
+    if output_format == OutputFormat.SHARDED:
+        return write_sharded_output(output_path, payload, compression=compression)
+
+    output_path = compressed_output_path(output_path, compression)
+    with StreamingJsonWriter(
+        output_path,
+        indent=4 if pretty else None,
+        compression=compression,
+        index_path=json_index_path(output_path),
+    ) as writer:
+        writer.write_payload(payload)
+    return output_path
 
 
 def ensure_ocr_pdf(
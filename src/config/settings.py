@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -5,11 +6,11 @@ from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
-    TOGETHER_AI_API_KEY: Optional[str]
-    GOOGLE_AI_API_KEY: Optional[str]
-    MISTRAL_API_KEY: Optional[str]
-    UNSTRUCTURED_API_KEY: Optional[str]
-    UNSTRUCTURED_API_URL: Optional[str]
+    TOGETHER_AI_API_KEY: Optional[str] = None
+    GOOGLE_AI_API_KEY: Optional[str] = None
+    MISTRAL_API_KEY: Optional[str] = None
+    UNSTRUCTURED_API_KEY: Optional[str] = None
+    UNSTRUCTURED_API_URL: Optional[str] = None
     INPUT_BOOKS_PATH: str
     OUTPUT_BOOKS_PATH: str
 
@@ -18,4 +19,14 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Reads the environment and `.env` on first use, so importing modules never requires them."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Keeps `from src.config.settings import settings` working; it now resolves on access.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,10 +14,16 @@ from src.application.pipeline_runner import (
     run_pipeline,
     write_output,
 )
+from src.domain.entities.book import OutputCompression, OutputFormat
 from src.domain.entities.chunker import ChunkerType, EmbedderProvider
 
 
-SUPPORTED_CHUNKERS = (ChunkerType.LANGCHAIN, ChunkerType.MATHEMATICAL)
+SUPPORTED_CHUNKERS = (
+    ChunkerType.LANGCHAIN,
+    ChunkerType.MATHEMATICAL,
+    ChunkerType.SEMANTIC,
+    ChunkerType.MARKDOWN,
+)
 
 
 @dataclass
@@ -33,6 +39,16 @@ class PipelineParams:
     page_batch_size: int | None
     input_file_name: str | None
     ocr_output_file_name: str | None
+    tokenizer_path: str | None
+    chunk_size: int | None
+    chunk_overlap: int | None
+    max_merged_chunk_size: int | None
+    near_duplicate_threshold: float | None
+    max_workers: int | None
+    incremental: bool
+    pretty_output: bool
+    output_format: OutputFormat
+    output_compression: OutputCompression
 
 
 @dataclass
@@ -54,6 +70,16 @@ class PipelineRunConfig(Config):
     page_batch_size: int | None = None
     input_file_name: str | None = None
     ocr_output_file_name: str | None = None
+    tokenizer_path: str | None = None
+    chunk_size: int | None = None
+    chunk_overlap: int | None = None
+    max_merged_chunk_size: int | None = None
+    near_duplicate_threshold: float | None = None
+    max_workers: int | None = None
+    incremental: bool = False
+    pretty_output: bool = False
+    output_format: OutputFormat = OutputFormat.JSON
+    output_compression: OutputCompression = OutputCompression.NONE
 
 
 @op
@@ -75,6 +101,16 @@ def collect_params(config: PipelineRunConfig) -> PipelineParams:
         page_batch_size=config.page_batch_size,
         input_file_name=config.input_file_name,
         ocr_output_file_name=config.ocr_output_file_name,
+        tokenizer_path=config.tokenizer_path,
+        chunk_size=config.chunk_size,
+        chunk_overlap=config.chunk_overlap,
+        max_merged_chunk_size=config.max_merged_chunk_size,
+        near_duplicate_threshold=config.near_duplicate_threshold,
+        max_workers=config.max_workers,
+        incremental=config.incremental,
+        pretty_output=config.pretty_output,
+        output_format=config.output_format,
+        output_compression=config.output_compression,
     )
 
 
@@ -122,6 +158,16 @@ def build_config_op(params: PipelineParams, paths: PathBundle, input_path: Path)
         embedding_model_name=params.embedding_parser,
         embedding_provider=params.embedding_provider,
         page_batch_size=params.page_batch_size,
+        tokenizer_path=params.tokenizer_path,
+        chunk_size=params.chunk_size,
+        chunk_overlap=params.chunk_overlap,
+        max_merged_chunk_size=params.max_merged_chunk_size,
+        near_duplicate_threshold=params.near_duplicate_threshold,
+        max_workers=params.max_workers,
+        incremental=params.incremental,
+        pretty_output=params.pretty_output,
+        output_format=params.output_format,
+        output_compression=params.output_compression,
     )
 
 
@@ -132,8 +178,14 @@ def run_pipeline_op(book_config):
 
 @op
 def write_output_op(book_config, payload: dict) -> str:
-    write_output(book_config.output_path, payload)
-    return str(book_config.output_path)
+    written_path = write_output(
+        book_config.output_path,
+        payload,
+        pretty=book_config.pretty_output,
+        output_format=book_config.output_format,
+        compression=book_config.output_compression,
+    )
+    return str(written_path)
 
 
 @job
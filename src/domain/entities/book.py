@@ -1,3 +1,4 @@
+from enum import Enum
 from pathlib import Path
 from typing import Union
 
@@ -7,6 +8,18 @@ from src.domain.entities.chunker import ChunkerConfig
 from src.domain.entities.table_of_contents import TableOfContentsParserConfig
 
 
+class OutputFormat(str, Enum):
+    JSON = "json"
+    PARQUET = "parquet"
+    SHARDED = "sharded"
+
+
+class OutputCompression(str, Enum):
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
 class ResourceConfig(BaseModel):
     name: str
     type: str
@@ -33,3 +46,12 @@ class BookConfig(BaseModel):
     table_of_contents_page_number: Union[int|list[int]]
     table_of_contents_parser: TableOfContentsParserConfig
     first_page_number: int
+    # Reuse embeddings from the previous output at `output_path` and report what changed.
+    incremental: bool = False
+    # Indented JSON for inspection; production runs write compact JSON.
+    pretty_output: bool = False
+    # Parquet writes chunks to `<stem>.parquet` and the other sections to `<stem>.metadata.json`;
+    # sharded writes one JSON Lines file per chapter and a manifest under `<stem>/`.
+    output_format: OutputFormat = OutputFormat.JSON
+    # JSON and sharded only; appends `.gz` or `.zst` to the output (or shard) file names.
+    output_compression: OutputCompression = OutputCompression.NONE
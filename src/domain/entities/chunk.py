@@ -1,4 +1,12 @@
-from pydantic import BaseModel
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from pydantic import BaseModel, computed_field
+
+
+def compute_content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
 class Chunk(BaseModel):
@@ -6,3 +14,43 @@ class Chunk(BaseModel):
     embedding: list[float]
     page_number: int
     chapter_number: int
+    chapter_title: str | None = None
+    section_title: str | None = None
+
+    @computed_field
+    @property
+    def content_hash(self) -> str:
+        return compute_content_hash(self.content)
+
+
+@dataclass(slots=True)
+class ChunkRecord:
+    """Chunk as produced by the chunkers, with the fields of `Chunk` and no validation.
+
+    Building a `Chunk` validates and copies every float of the embedding; a
+    record just holds a reference to it. Chunkers and writers pass records
+    around; `to_dict` matches `Chunk.model_dump()`.
+    """
+
+    content: str
+    embedding: Sequence[float]
+    page_number: int
+    chapter_number: int
+    chapter_title: str | None = None
+    section_title: str | None = None
+
+    @property
+    def content_hash(self) -> str:
+        return compute_content_hash(self.content)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Same keys, in the same order, as `Chunk.model_dump()`."""
+        return {
+            "content": self.content,
+            "embedding": self.embedding,
+            "page_number": self.page_number,
+            "chapter_number": self.chapter_number,
+            "chapter_title": self.chapter_title,
+            "section_title": self.section_title,
+            "content_hash": self.content_hash,
+        }
@@ -4,7 +4,7 @@ from enum import Enum
 
 from pydantic import BaseModel
 
-from src.domain.entities.chunk import Chunk
+from src.domain.entities.chunk import ChunkRecord
 from src.domain.entities.table_of_contents import TableOfContents
 
 
@@ -13,6 +13,8 @@ class ChunkerType(str, Enum):
     LANGCHAIN = "langchain"
     LLM = "llm"
     MATHEMATICAL = "mathematical"
+    SEMANTIC = "semantic"
+    MARKDOWN = "markdown"
 
 
 class EmbedderProvider(str, Enum):
@@ -27,19 +29,63 @@ class ChunkerConfig(BaseModel):
     embedding_model_name: str | None = None
     embedding_provider: EmbedderProvider = EmbedderProvider.TOGETHER
     page_batch_size: int | None = None
+    boilerplate_patterns: list[str] = []
+    repeated_line_page_fraction: float | None = None
+    tokenizer_path: str | None = None
+    chunk_size: int | None = None
+    chunk_overlap: int | None = None
+    max_merged_chunk_size: int | None = None
+    near_duplicate_threshold: float | None = None
+    max_workers: int | None = None
 
 
 class Chunker:
+    # Default sizes in characters, and in tokens when a tokenizer is configured.
+    CHUNK_SIZE: int | None = None
+    CHUNK_OVERLAP: int = 0
+    TOKEN_CHUNK_SIZE: int | None = None
+    TOKEN_CHUNK_OVERLAP: int = 0
+    # Chunkers that find chapters in the document itself skip the table of
+    # contents LLM call and set `derived_table_of_contents` while chunking.
+    USES_TABLE_OF_CONTENTS: bool = True
+    derived_table_of_contents: TableOfContents | None = None
+    # Content hash -> stored vector from a previous run, set for incremental runs.
+    reusable_embeddings: dict[str, list[float]] | None = None
+    # Content hash -> vector of texts embedded besides the chunks (the semantic
+    # chunker's sentences), stored for the next incremental run.
+    sentence_embeddings: dict[str, list[float]] | None = None
+
     def __init__(self, config: ChunkerConfig):
         self.config = config
 
+    def get_chunk_size_and_overlap(self) -> tuple[int, int]:
+        if self.config.tokenizer_path:
+            chunk_size, chunk_overlap = self.TOKEN_CHUNK_SIZE, self.TOKEN_CHUNK_OVERLAP
+        else:
+            chunk_size, chunk_overlap = self.CHUNK_SIZE, self.CHUNK_OVERLAP
+
+        if self.config.chunk_size is not None:
+            if self.config.chunk_overlap is None and chunk_size:
+                # Keep the default overlap's share of the chunk, so a smaller size never ends up under it.
+                chunk_overlap = chunk_overlap * self.config.chunk_size // chunk_size
+            chunk_size = self.config.chunk_size
+        if self.config.chunk_overlap is not None:
+            chunk_overlap = self.config.chunk_overlap
+
+        if chunk_size is not None and chunk_overlap >= chunk_size:
+            raise ValueError(
+                f"chunk_overlap ({chunk_overlap}) must be smaller than chunk_size ({chunk_size}) "
+                f"for the {self.config.chunker_type.value} chunker"
+            )
+        return chunk_size, chunk_overlap
+
     @abstractmethod
     def chunk(
         self,
         book_path: Path,
         table_of_contents: TableOfContents = None,
         text_initial_page: int = None,
-    ) -> list[Chunk]:
+    ) -> list[ChunkRecord]:
         pass
 
 
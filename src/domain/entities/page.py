@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Page:
+    """A parsed page: its position in the file, printed page label and text."""
+
+    index: int
+    label: int
+    text: str
@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from enum import Enum
 
 from pydantic import BaseModel, Field, SecretStr
@@ -13,6 +14,42 @@ class TableOfContents(BaseModel):
     chapters: list[Chapter] = Field(description="List of chapters in the table of contents")
 
 
+class ChapterIndex:
+    """Page-to-chapter lookup built once per run from a table of contents.
+
+    Chapter start pages are shifted by `text_initial_page` into absolute PDF
+    pages and stored as a sorted boundary array, so each lookup is a bisect
+    instead of a scan over every chapter.
+    """
+
+    def __init__(self, table_of_contents: TableOfContents | None, text_initial_page: int):
+        chapters = table_of_contents.chapters if table_of_contents else []
+
+        self._chapter_numbers: list[int] = []
+        self._boundaries: list[int] = []
+
+        for chapter in chapters:
+            boundary = chapter.start_page + text_initial_page - 1
+            # A chapter listed after one with a later start page can never be
+            # reached by an ordered scan, so the running maximum keeps the
+            # boundaries sorted without changing which chapter a page maps to.
+            if self._boundaries:
+                boundary = max(boundary, self._boundaries[-1])
+
+            self._boundaries.append(boundary)
+            self._chapter_numbers.append(chapter.number)
+
+    @property
+    def first_chapter_page(self) -> int | None:
+        """Absolute page where the first chapter starts, if there is one."""
+        return self._boundaries[0] if self._boundaries else None
+
+    def chapter_for_page(self, page: int) -> int:
+        """Returns the chapter number for an absolute page, or 0 before the first chapter."""
+        position = bisect_right(self._boundaries, page)
+        return self._chapter_numbers[position - 1] if position else 0
+
+
 class TableOfContentsParserType(str, Enum):
     GEMINI = "gemini"
     TOGETHER = "together"
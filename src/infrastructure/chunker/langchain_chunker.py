@@ -2,123 +2,105 @@ import math
 from pathlib import Path
 
 from langchain_community.document_loaders import PyPDFLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_core.documents import Document
 import logging
 from tqdm import tqdm
 
-from src.application.mappers.langchain_mapper import LangchainMapper
-from src.config.settings import settings
-from src.domain.entities.chunk import Chunk
+from src.application.mappers.span_mapper import SpanMapper
+from src.domain.entities.chunk import ChunkRecord
 from src.domain.entities.chunker import Chunker, EmptyChunkerResponse
-from src.domain.entities.table_of_contents import TableOfContents
+from src.domain.entities.table_of_contents import ChapterIndex, TableOfContents
+from src.infrastructure.chunker.page_stages import PageStages, run_page_stages
 from src.infrastructure.embedder.embedding_router import get_embeddings
+from src.infrastructure.parser.pages import pages_from_documents
+from src.infrastructure.preprocessing.near_duplicates import NearDuplicateFilter
+from src.infrastructure.splitter.text_splitter import TextSpan
 
 
 logging.basicConfig(level=logging.INFO)
 
 
 class LangchainChunker(Chunker):
+    CHUNK_SIZE = 250
+    CHUNK_OVERLAP = 30
+    TOKEN_CHUNK_SIZE = 64
+    TOKEN_CHUNK_OVERLAP = 8
+
     def chunk(
         self,
         book_path: Path,
         table_of_contents: TableOfContents,
         text_initial_page: int = None,
         min_length_to_be_included: int = 10,
-    ) -> list[Chunk]:
-        loader = PyPDFLoader(book_path)
-        docs = loader.load()
-        
+    ) -> list[ChunkRecord]:
+        pages = pages_from_documents(PyPDFLoader(book_path).load())
+
         page_of_initial_chapter = (
             table_of_contents.chapters[0].start_page + text_initial_page
             if table_of_contents.chapters and text_initial_page
             else 0
         )
 
-        separators = [
-            "FOR ONLINE USE ONLY",
-            "DO NOT DUPLICATE",
-            "PROPERTY OF THE UNITED REPUBLIC OF TANZANIA GOBVERNMENT",
-            "Ministry of Education, Science and Technology",
-            "For Online Use Only",
-            "Student’s Book Form Two",
-            "Geography for Secondary Schools",
-        ]
-
-        default_separators = [
-            "\n\n",
-            "\n",
-            " ",
-            "",
-        ]
-
-        text_splitter = RecursiveCharacterTextSplitter(
-            separators=separators + default_separators,
-            keep_separator=False,
-            chunk_size=250,
-            chunk_overlap=30,
+        chunk_size, chunk_overlap = self.get_chunk_size_and_overlap()
+        stages = PageStages(
+            boilerplate_patterns=tuple(self.config.boilerplate_patterns),
+            repeated_line_page_fraction=self.config.repeated_line_page_fraction,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            tokenizer_path=self.config.tokenizer_path,
+        )
+        chapter_index = ChapterIndex(table_of_contents, text_initial_page)
+
+        initial_spans = run_page_stages(
+            stages,
+            [page.text for page in pages],
+            [page.label for page in pages],
+            chapter_index,
+            max_workers=self.config.max_workers,
         )
 
-        initial_documents: list[Document] = text_splitter.split_documents(docs)
-
-        documents: list[Document] = []
-        document_chapters: list[int] = []
-        parsed_text: list[str] = []
+        spans: list[TextSpan] = []
+        span_chapters: list[int] = []
 
-        for doc in initial_documents:
-            doc_page = int(doc.metadata["page_label"])
-            if doc_page < page_of_initial_chapter - 1:
+        for span in initial_spans:
+            page_label = pages[span.page].label
+            if page_label < page_of_initial_chapter - 1:
                 continue
 
-            page_content: str = doc.page_content
-
-            for unwanted_text in separators:  # just in case
-                page_content = page_content.replace(unwanted_text, "")
-
-            if len(page_content) < min_length_to_be_included:
+            if len(span.text) < min_length_to_be_included:
                 continue
 
-            doc.page_content = page_content
-            doc_chapter = self.get_document_chapter(
-                doc_page=doc_page,
-                text_initial_page=text_initial_page,
-                table_of_contents=table_of_contents,
-            )
+            spans.append(span)
+            span_chapters.append(chapter_index.chapter_for_page(page_label))
+
+        parsed_text = [span.text for span in spans]
 
-            documents.append(doc)
-            document_chapters.append(doc_chapter)
-            parsed_text.append(page_content)
+        if self.config.near_duplicate_threshold:
+            kept, _ = NearDuplicateFilter(self.config.near_duplicate_threshold).filter(parsed_text)
+            spans = [spans[index] for index in kept]
+            span_chapters = [span_chapters[index] for index in kept]
+            parsed_text = [parsed_text[index] for index in kept]
 
-        chunks: list[Chunk] = []        
+        chunks: list[ChunkRecord] = []
 
-        print(f"Getting embeddings from {len(documents)} documents...\n")
+        print(f"Getting embeddings from {len(spans)} documents...\n")
 
         embeddings = get_embeddings(
             parsed_text,
             provider=self.config.embedding_provider,
             model_name=self.config.embedding_model_name,
+            reusable=self.reusable_embeddings,
         )
-        for doc, chapter_number, embedding in zip(documents, document_chapters, embeddings):
-            chunk = LangchainMapper.map(
-                document=doc,
+        for span, chapter_number, embedding in zip(spans, span_chapters, embeddings):
+            chunk = SpanMapper.map(
+                text=span.text,
+                page_label=pages[span.page].label,
                 content_embedding=embedding,
                 chapter_number=chapter_number,
                 text_initial_page=text_initial_page,
             )
             chunks.append(chunk)
-        
+
         if not chunks:
             raise EmptyChunkerResponse(book_path, self.config)
 
         return chunks
-
-    @staticmethod
-    def get_document_chapter(doc_page: int, text_initial_page: int, table_of_contents: TableOfContents) -> int:
-        doc_chapter = 0
-        for chapter in table_of_contents.chapters:
-            if doc_page < chapter.start_page + text_initial_page - 1:
-                break
-            
-            doc_chapter = chapter.number
-        
-        return doc_chapter
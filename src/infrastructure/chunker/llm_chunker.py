@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 from pathlib import Path
 
 import logging
@@ -10,8 +11,8 @@ from together.types import ChatCompletionResponse
 from tqdm import tqdm
 
 from src.application.mappers.llm_mapper import LLMMapper
-from src.config.settings import settings
-from src.domain.entities.chunk import Chunk
+from src.config.settings import get_settings
+from src.domain.entities.chunk import Chunk, ChunkRecord
 from src.domain.entities.chunker import Chunker, EmptyChunkerResponse
 from src.domain.entities.table_of_contents import TableOfContents
 from src.domain.entities.chunk import Chunk
@@ -20,7 +21,12 @@ from src.domain.entities.table_of_contents import TableOfContents
 
 
 logging.basicConfig(level=logging.INFO)
-together = Together(api_key=settings.TOGETHER_AI_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def _get_together_client() -> Together:
+    # Built on first use instead of at import time, when the API key may not be configured yet.
+    return Together(api_key=get_settings().TOGETHER_AI_API_KEY)
 
 
 class LLMChunk(BaseModel):
@@ -41,7 +47,7 @@ class LLMChunker(Chunker):
         book_path: Path,
         table_of_contents: TableOfContents,
         text_initial_page: int = None,
-    ) -> list[Chunk]:
+    ) -> list[ChunkRecord]:
         chunk_page_numbers: list[int] = []
         chunk_chapter_numbers: list[int] = []
         chunk_parsed_texts: list[str] = []
@@ -90,7 +96,7 @@ class LLMChunker(Chunker):
  
         logging.info(f"Getting embeddings from {len(chunk_parsed_texts)} documents...\n")
         
-        chunks: list[Chunk] = []
+        chunks: list[ChunkRecord] = []
         embeddings = self.get_embeddings(chunk_parsed_texts)
 
         for page_number, chapter_number, parsed_text, embedding in zip(
@@ -114,7 +120,7 @@ class LLMChunker(Chunker):
         return chunks
 
     def get_llm_response(self, text: str) -> ChatCompletionResponse:
-        extract = together.chat.completions.create(
+        extract = _get_together_client().chat.completions.create(
             messages=[
                 {
                     "role": "system",
@@ -153,7 +159,7 @@ class LLMChunker(Chunker):
         for i in tqdm(range(num_batches)):
             batch = texts[i * batch_size : (i + 1) * batch_size]
 
-            response = together.embeddings.create(
+            response = _get_together_client().embeddings.create(
                 model=self.config.embedding_model_name,
                 input=batch,
             )
@@ -0,0 +1,137 @@
+import logging
+from pathlib import Path
+
+from src.application.mappers.span_mapper import SpanMapper
+from src.domain.entities.chunk import ChunkRecord
+from src.domain.entities.chunker import Chunker, EmptyChunkerResponse
+from src.domain.entities.table_of_contents import Chapter, TableOfContents
+from src.infrastructure.chunker.mathematical_chunker import MathematicalChunker
+from src.infrastructure.chunker.page_stages import clean_pages, merge_math_aware_spans, strip_image_references
+from src.infrastructure.embedder.embedding_router import get_embeddings
+from src.infrastructure.parser.mistral_parser import MistralParser
+from src.infrastructure.preprocessing.markdown_sections import MarkdownSection, split_markdown_sections
+from src.infrastructure.preprocessing.math_expressions import wrap_math_expressions
+from src.infrastructure.preprocessing.near_duplicates import NearDuplicateFilter
+from src.infrastructure.splitter.text_splitter import TextSpan, create_text_splitter
+
+logging.basicConfig(level=logging.INFO)
+
+
+def _derive_table_of_contents(
+    sections: list[MarkdownSection],
+    page_labels: list[int],
+    text_initial_page: int,
+) -> TableOfContents:
+    """Builds chapters from the first section of each chapter, with book (not PDF) page numbers."""
+    chapters: dict[int, Chapter] = {}
+    for section in sections:
+        if section.chapter_number == 0:
+            continue
+        chapter = chapters.get(section.chapter_number)
+        if chapter is None:
+            chapters[section.chapter_number] = Chapter(
+                name=section.chapter_title or f"Chapter {section.chapter_number}",
+                number=section.chapter_number,
+                start_page=page_labels[section.page] - text_initial_page + 1,
+            )
+        elif section.chapter_title and chapter.name == f"Chapter {section.chapter_number}":
+            chapter.name = section.chapter_title
+
+    return TableOfContents(chapters=list(chapters.values()))
+
+
+class MarkdownChunker(Chunker):
+    """Chunks Mistral OCR markdown along its heading tree.
+
+    Chapters and sections come from the headings themselves, so no table of
+    contents LLM call is needed; text is split within each section and page.
+    It runs in one process and ignores `max_workers`: the sections are only
+    known once the whole book's heading tree has been read.
+    """
+
+    MIN_LENGTH_TO_BE_INCLUDED = MathematicalChunker.MIN_LENGTH_TO_BE_INCLUDED
+    CHUNK_SIZE = MathematicalChunker.CHUNK_SIZE
+    CHUNK_OVERLAP = MathematicalChunker.CHUNK_OVERLAP
+    TOKEN_CHUNK_SIZE = MathematicalChunker.TOKEN_CHUNK_SIZE
+    TOKEN_CHUNK_OVERLAP = MathematicalChunker.TOKEN_CHUNK_OVERLAP
+    MAX_MERGED_CHUNK_SIZE = MathematicalChunker.MAX_MERGED_CHUNK_SIZE
+    USES_TABLE_OF_CONTENTS = False
+
+    def chunk(
+        self,
+        book_path: Path,
+        table_of_contents: TableOfContents = None,
+        text_initial_page: int = None,
+    ) -> list[ChunkRecord]:
+        pages = MistralParser(book_path).load_pages()
+
+        page_texts = clean_pages(
+            self.config.boilerplate_patterns,
+            self.config.repeated_line_page_fraction,
+            [page.text for page in pages],
+        )
+        page_texts = [wrap_math_expressions(strip_image_references(text)) for text in page_texts]
+
+        sections = split_markdown_sections(page_texts)
+        self.derived_table_of_contents = _derive_table_of_contents(
+            sections,
+            page_labels=[page.label for page in pages],
+            text_initial_page=text_initial_page or 1,
+        )
+        chapter_titles = {chapter.number: chapter.name for chapter in self.derived_table_of_contents.chapters}
+
+        # Front matter (preface, contents...) sits before the first chapter heading.
+        if chapter_titles:
+            sections = [section for section in sections if section.chapter_number > 0]
+
+        chunk_size, chunk_overlap = self.get_chunk_size_and_overlap()
+        text_splitter = create_text_splitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            tokenizer_path=self.config.tokenizer_path,
+        )
+
+        # Span pages index `sections`; merging keeps the section of the first span.
+        math_safe_spans: list[TextSpan] = merge_math_aware_spans(
+            list(text_splitter.split_pages(section.text for section in sections)),
+            max_merged_length=self.config.max_merged_chunk_size or self.MAX_MERGED_CHUNK_SIZE,
+        )
+
+        spans = [span for span in math_safe_spans if len(span.text) >= self.MIN_LENGTH_TO_BE_INCLUDED]
+        parsed_text = [span.text for span in spans]
+
+        if self.config.near_duplicate_threshold:
+            kept, _ = NearDuplicateFilter(self.config.near_duplicate_threshold).filter(parsed_text)
+            spans = [spans[index] for index in kept]
+            parsed_text = [parsed_text[index] for index in kept]
+
+        print(f"Getting embeddings from {len(spans)} documents...\n")
+
+        embeddings = get_embeddings(
+            texts=parsed_text,
+            provider=self.config.embedding_provider,
+            model_name=self.config.embedding_model_name,
+            reusable=self.reusable_embeddings,
+        )
+
+        chunks: list[ChunkRecord] = []
+        for span, embedding in zip(spans, embeddings):
+            if len(embedding) == 0:
+                continue
+
+            section = sections[span.page]
+            chunk = SpanMapper.map(
+                text=span.text,
+                page_label=pages[section.page].label,
+                content_embedding=embedding,
+                chapter_number=section.chapter_number,
+                text_initial_page=text_initial_page or 1,
+                chapter_title=chapter_titles.get(section.chapter_number),
+                section_title=section.section_title,
+            )
+            chunks.append(chunk)
+
+        if not chunks:
+            raise EmptyChunkerResponse(book_path, self.config)
+
+        return chunks
@@ -0,0 +1,233 @@
+import logging
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from multiprocessing.context import BaseContext
+from typing import Sequence
+
+from src.domain.entities.table_of_contents import ChapterIndex
+from src.infrastructure.preprocessing.boilerplate import BoilerplateStripper
+from src.infrastructure.preprocessing.math_expressions import wrap_math_expressions
+from src.infrastructure.preprocessing.repeated_lines import RepeatedLineStripper
+from src.infrastructure.splitter.text_splitter import RecursiveTextSplitter, TextSpan, create_text_splitter
+
+
+IMAGE_REFERENCE_PATTERN = re.compile(r"!\[[^\]]*\]\([^)]+\)")
+MATH_TAG_PATTERN = re.compile(r"</?math>")
+
+
+def strip_image_references(text: str) -> str:
+    return IMAGE_REFERENCE_PATTERN.sub("", text)
+
+
+def _update_math_balance(balance: int, text: str) -> int:
+    for tag in MATH_TAG_PATTERN.finditer(text):
+        if tag.group(0) == "<math>":
+            balance += 1
+        else:
+            # A stray closing tag (usually an OCR error) can never be balanced
+            # by a later opening one, so it must not keep the buffer open.
+            balance = max(balance - 1, 0)
+    return balance
+
+
+def merge_math_aware_spans(
+    spans: list[TextSpan],
+    max_merged_length: int | None = None,
+) -> list[TextSpan]:
+    """Merges consecutive spans so that no <math> block is cut in half.
+
+    Text is accumulated in a list and joined once per merged span, which keeps
+    the page and start of its first span and the end of its last one; when the
+    merge crosses pages, `end_page` says which page that end offset is on. When an unbalanced tag
+    would grow the buffer past `max_merged_length` characters, the buffer is
+    flushed anyway so one OCR error cannot swallow the book.
+    """
+    merged_spans: list[TextSpan] = []
+    buffer_parts: list[str] = []
+    buffer_length = 0
+    first_span: TextSpan | None = None
+    last_span: TextSpan | None = None
+    math_balance = 0
+    forced_splits = 0
+
+    def flush() -> None:
+        nonlocal buffer_parts, buffer_length, first_span
+        end_page = last_span.last_page
+        merged_spans.append(
+            TextSpan(
+                page=first_span.page,
+                start=first_span.start,
+                end=last_span.end,
+                text="".join(buffer_parts),
+                end_page=end_page if end_page != first_span.page else None,
+            )
+        )
+        buffer_parts = []
+        buffer_length = 0
+        first_span = None
+
+    for span in spans:
+        content = span.text
+
+        if (
+            buffer_parts
+            and max_merged_length is not None
+            and buffer_length + len(content) > max_merged_length
+        ):
+            flush()
+            math_balance = 0
+            forced_splits += 1
+
+        if first_span is None:
+            first_span = span
+        last_span = span
+
+        buffer_parts.append(content)
+        buffer_length += len(content)
+        math_balance = _update_math_balance(math_balance, content)
+
+        if math_balance == 0:
+            flush()
+
+    if buffer_parts:
+        flush()
+
+    if forced_splits:
+        logging.warning(
+            "Forced %d splits of unbalanced <math> blocks longer than %d characters.",
+            forced_splits,
+            max_merged_length,
+        )
+
+    return merged_spans
+
+
+@dataclass(frozen=True)
+class PageStages:
+    """Settings of the CPU-bound per-page stages, small enough to send to worker processes."""
+
+    boilerplate_patterns: tuple[str, ...]
+    repeated_line_page_fraction: float | None
+    chunk_size: int
+    chunk_overlap: int
+    tokenizer_path: str | None = None
+    # Mathematical chunker only: drop image references and wrap math in <math> tags.
+    wrap_math: bool = False
+
+
+@lru_cache(maxsize=8)
+def _text_splitter(chunk_size: int, chunk_overlap: int, tokenizer_path: str | None) -> RecursiveTextSplitter:
+    # Cached so each worker process loads a tokenizer once, not once per chapter.
+    return create_text_splitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap, tokenizer_path=tokenizer_path)
+
+
+def _strip_boilerplate(patterns: tuple[str, ...], pages: Sequence[str]) -> list[str]:
+    stripper = BoilerplateStripper(list(patterns))
+    return [stripper.strip(page) for page in pages]
+
+
+def clean_pages(
+    boilerplate_patterns: Sequence[str],
+    repeated_line_page_fraction: float | None,
+    page_texts: Sequence[str],
+) -> list[str]:
+    """Strips boilerplate and, when enabled, repeated lines from every page, in this process.
+
+    For chunkers that split the cleaned pages themselves instead of through `run_page_stages`.
+    """
+    pages = _strip_boilerplate(tuple(boilerplate_patterns), page_texts)
+    if repeated_line_page_fraction:
+        pages, _ = RepeatedLineStripper(repeated_line_page_fraction).strip(pages)
+    return pages
+
+
+def _process_pages(
+    stages: PageStages,
+    page_texts: Sequence[str],
+    repeated: dict[str, str],
+) -> tuple[list[TextSpan], Counter[str]]:
+    """Every per-page stage, from the raw page texts to spans, so a page is sent to a worker once."""
+    pages = _strip_boilerplate(stages.boilerplate_patterns, page_texts)
+
+    removed: Counter[str] = Counter()
+    if stages.repeated_line_page_fraction:
+        pages, removed = RepeatedLineStripper(stages.repeated_line_page_fraction).remove(pages, repeated)
+
+    if stages.wrap_math:
+        pages = [wrap_math_expressions(strip_image_references(page)) for page in pages]
+
+    text_splitter = _text_splitter(stages.chunk_size, stages.chunk_overlap, stages.tokenizer_path)
+    return list(text_splitter.split_pages(pages)), removed
+
+
+def chapter_partitions(page_numbers: Sequence[int], chapter_index: ChapterIndex, min_partitions: int = 1) -> list[range]:
+    """Cuts page indices into contiguous runs that share a chapter.
+
+    When the book has fewer chapters than `min_partitions` (e.g. no table of
+    contents), the pages are cut into `min_partitions` equal runs instead.
+    """
+    partitions: list[range] = []
+    start = 0
+    for index in range(1, len(page_numbers) + 1):
+        if index == len(page_numbers) or (
+            chapter_index.chapter_for_page(page_numbers[index])
+            != chapter_index.chapter_for_page(page_numbers[index - 1])
+        ):
+            partitions.append(range(start, index))
+            start = index
+
+    if 0 < len(partitions) < min_partitions:
+        size = -(-len(page_numbers) // min_partitions)
+        partitions = [range(start, min(start + size, len(page_numbers))) for start in range(0, len(page_numbers), size)]
+
+    return partitions
+
+
+def run_page_stages(
+    stages: PageStages,
+    page_texts: Sequence[str],
+    page_numbers: Sequence[int],
+    chapter_index: ChapterIndex,
+    max_workers: int | None = None,
+    mp_context: BaseContext | None = None,
+) -> list[TextSpan]:
+    """Cleans and splits every page; returns the spans in book order, with offsets into the cleaned pages.
+
+    With `max_workers` above one, chapters are processed in a process pool,
+    each page being sent to it once. Only repeated-line detection needs the
+    whole book; when enabled, it runs here first, on its own boilerplate-free
+    copy of the pages, so the output is identical to the serial one whatever
+    the start method of the workers (`mp_context`, the platform default if None).
+    """
+    stripper = RepeatedLineStripper(stages.repeated_line_page_fraction) if stages.repeated_line_page_fraction else None
+    repeated = stripper.detect(_strip_boilerplate(stages.boilerplate_patterns, page_texts)) if stripper else {}
+
+    if not max_workers or max_workers <= 1:
+        spans, removed = _process_pages(stages, page_texts, repeated)
+        if stripper:
+            stripper.summarize(len(page_texts), removed)
+        return spans
+
+    partitions = chapter_partitions(page_numbers, chapter_index, min_partitions=max_workers)
+
+    spans: list[TextSpan] = []
+    removed: Counter[str] = Counter()
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+        results = pool.map(
+            _process_pages,
+            [stages] * len(partitions),
+            [page_texts[partition.start:partition.stop] for partition in partitions],
+            [repeated] * len(partitions),
+        )
+        for partition, (partition_spans, partition_removed) in zip(partitions, results):
+            for span in partition_spans:
+                span.page += partition.start
+            spans.extend(partition_spans)
+            removed.update(partition_removed)
+
+    if stripper:
+        stripper.summarize(len(page_texts), removed)
+    return spans
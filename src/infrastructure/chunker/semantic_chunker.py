@@ -0,0 +1,229 @@
+import logging
+import re
+from pathlib import Path
+from typing import Callable, Sequence
+
+import numpy as np
+from langchain_community.document_loaders import PyPDFLoader
+
+from src.application.mappers.span_mapper import SpanMapper
+from src.domain.entities.chunk import ChunkRecord, compute_content_hash
+from src.domain.entities.chunker import Chunker, EmptyChunkerResponse
+from src.domain.entities.table_of_contents import ChapterIndex, TableOfContents
+from src.infrastructure.chunker.page_stages import clean_pages
+from src.infrastructure.embedder.embedding_router import get_embeddings
+from src.infrastructure.parser.pages import pages_from_documents
+from src.infrastructure.preprocessing.near_duplicates import NearDuplicateFilter
+from src.infrastructure.splitter.text_splitter import create_text_splitter
+from src.infrastructure.splitter.tokenizer import CachedTokenCounter, load_tokenizer
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+
+
+def _split_sentences(text: str) -> list[str]:
+    return [sentence.strip() for sentence in SENTENCE_BOUNDARY_PATTERN.split(text) if sentence.strip()]
+
+
+def _adjacent_cosine_distances(embeddings: np.ndarray) -> np.ndarray:
+    """Cosine distance between each row and the next one, computed in a single pass."""
+    if len(embeddings) < 2:
+        return np.zeros(0, dtype=np.float32)
+
+    norms = np.linalg.norm(embeddings, axis=1)
+    dots = np.einsum("ij,ij->i", embeddings[:-1], embeddings[1:])
+    denominators = norms[:-1] * norms[1:]
+    # Zero rows come from failed embedding requests; they give no evidence of a topic change.
+    similarities = np.divide(dots, denominators, out=np.ones_like(dots), where=denominators > 0)
+    return 1.0 - similarities
+
+
+def _semantic_groups(
+    distances: np.ndarray,
+    lengths: Sequence[int],
+    breakpoint_percentile: float,
+    max_chunk_size: int,
+    forced_breaks: np.ndarray | None = None,
+) -> list[tuple[int, int]]:
+    """Groups consecutive sentences into `[start, end)` ranges.
+
+    A new group starts after every distance at or above the percentile threshold, wherever
+    `forced_breaks` is set, and before a sentence that would push the group past
+    `max_chunk_size` (the space joining two sentences counts as one unit).
+    """
+    if not lengths:
+        return []
+
+    is_break = np.zeros(len(lengths), dtype=bool)
+    if len(distances):
+        threshold = np.percentile(distances, breakpoint_percentile)
+        # Ties at the threshold break too, unless every distance is the same.
+        is_break[1:] = (distances >= threshold) & (distances > distances.min())
+    if forced_breaks is not None:
+        is_break[1:] |= forced_breaks
+
+    groups: list[tuple[int, int]] = []
+    start = 0
+    size = lengths[0]
+    for index in range(1, len(lengths)):
+        length = lengths[index]
+        if is_break[index] or size + 1 + length > max_chunk_size:
+            groups.append((start, index))
+            start = index
+            size = length
+        else:
+            size += 1 + length
+    groups.append((start, len(lengths)))
+
+    return groups
+
+
+class SemanticChunker(Chunker):
+    """Cuts text where adjacent sentence embeddings drift apart instead of at fixed sizes."""
+
+    # Size caps; the overlap is unused because groups end at topic changes.
+    CHUNK_SIZE = 1500
+    TOKEN_CHUNK_SIZE = 384
+    BREAKPOINT_PERCENTILE = 90
+    EMBEDDING_BATCH_SIZE = 256
+
+    def _embed_sentences(self, sentences: list[str]) -> np.ndarray:
+        """Embeds the sentences, reusing the vectors of an incremental run and recording them for the next one."""
+        embeddings: list[np.ndarray] = []
+        dimension = 0
+        self.sentence_embeddings = {}
+
+        for index in range(0, len(sentences), self.EMBEDDING_BATCH_SIZE):
+            batch_sentences = sentences[index:index + self.EMBEDDING_BATCH_SIZE]
+            batch = get_embeddings(
+                batch_sentences,
+                provider=self.config.embedding_provider,
+                model_name=self.config.embedding_model_name,
+                reusable=self.reusable_embeddings,
+            )
+            for sentence, embedding in zip(batch_sentences, batch):
+                dimension = dimension or len(embedding)
+                embeddings.append(np.asarray(embedding, dtype=np.float32))
+                if len(embedding):
+                    self.sentence_embeddings[compute_content_hash(sentence)] = embedding
+
+        matrix = np.zeros((len(sentences), dimension), dtype=np.float32)
+        for row, embedding in enumerate(embeddings):
+            if len(embedding) == dimension:
+                matrix[row] = embedding
+        return matrix
+
+    def chunk(
+        self,
+        book_path: Path,
+        table_of_contents: TableOfContents,
+        text_initial_page: int = None,
+        min_length_to_be_included: int = 10,
+    ) -> list[ChunkRecord]:
+        pages = pages_from_documents(PyPDFLoader(book_path).load())
+
+        page_of_initial_chapter = (
+            table_of_contents.chapters[0].start_page + text_initial_page
+            if table_of_contents.chapters and text_initial_page
+            else 0
+        )
+
+        page_texts = clean_pages(
+            self.config.boilerplate_patterns,
+            self.config.repeated_line_page_fraction,
+            [page.text for page in pages],
+        )
+
+        max_chunk_size, _ = self.get_chunk_size_and_overlap()
+        length_function: Callable[[str], int] = len
+        if self.config.tokenizer_path:
+            length_function = CachedTokenCounter(load_tokenizer(self.config.tokenizer_path))
+        # Sentences longer than the cap are cut with the recursive splitter first.
+        long_sentence_splitter = create_text_splitter(
+            chunk_size=max_chunk_size,
+            chunk_overlap=0,
+            tokenizer_path=self.config.tokenizer_path,
+        )
+        chapter_index = ChapterIndex(table_of_contents, text_initial_page)
+
+        sentences: list[str] = []
+        sentence_pages: list[int] = []
+        sentence_chapters: list[int] = []
+        lengths: list[int] = []
+
+        for page, text in enumerate(page_texts):
+            doc_page = pages[page].label
+            if doc_page < page_of_initial_chapter - 1:
+                continue
+            chapter_number = chapter_index.chapter_for_page(doc_page)
+
+            for sentence in _split_sentences(text):
+                length = length_function(sentence)
+                pieces = [sentence]
+                if length > max_chunk_size:
+                    pieces = [span.text for span in long_sentence_splitter.split_text(sentence)]
+
+                for piece in pieces:
+                    sentences.append(piece)
+                    sentence_pages.append(page)
+                    sentence_chapters.append(chapter_number)
+                    lengths.append(length if len(pieces) == 1 else length_function(piece))
+
+        print(f"Getting embeddings from {len(sentences)} sentences...\n")
+
+        distances = _adjacent_cosine_distances(self._embed_sentences(sentences))
+        groups = _semantic_groups(
+            distances,
+            lengths,
+            breakpoint_percentile=self.BREAKPOINT_PERCENTILE,
+            max_chunk_size=max_chunk_size,
+            forced_breaks=np.diff(np.asarray(sentence_chapters, dtype=np.int64)) != 0,
+        )
+        logger.info("Grouped %d sentences into %d semantic chunks", len(sentences), len(groups))
+
+        group_pages: list[int] = []
+        group_chapters: list[int] = []
+        parsed_text: list[str] = []
+
+        for start, end in groups:
+            page_content = " ".join(sentences[start:end])
+            if len(page_content) < min_length_to_be_included:
+                continue
+
+            group_pages.append(sentence_pages[start])
+            group_chapters.append(sentence_chapters[start])
+            parsed_text.append(page_content)
+
+        if self.config.near_duplicate_threshold:
+            kept, _ = NearDuplicateFilter(self.config.near_duplicate_threshold).filter(parsed_text)
+            group_pages = [group_pages[index] for index in kept]
+            group_chapters = [group_chapters[index] for index in kept]
+            parsed_text = [parsed_text[index] for index in kept]
+
+        print(f"Getting embeddings from {len(parsed_text)} documents...\n")
+
+        embeddings = get_embeddings(
+            parsed_text,
+            provider=self.config.embedding_provider,
+            model_name=self.config.embedding_model_name,
+            reusable=self.reusable_embeddings,
+        )
+        chunks: list[ChunkRecord] = [
+            SpanMapper.map(
+                text=text,
+                page_label=pages[page].label,
+                content_embedding=embedding,
+                chapter_number=chapter_number,
+                text_initial_page=text_initial_page,
+            )
+            for text, page, chapter_number, embedding in zip(parsed_text, group_pages, group_chapters, embeddings)
+        ]
+
+        if not chunks:
+            raise EmptyChunkerResponse(book_path, self.config)
+
+        return chunks
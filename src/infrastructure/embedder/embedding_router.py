@@ -1,11 +1,16 @@
-from typing import Protocol
+import logging
+from typing import Mapping, Protocol
 
-from src.config.settings import settings
+from src.config.settings import get_settings
+from src.domain.entities.chunk import compute_content_hash
 from src.domain.entities.chunker import EmbedderProvider
 from src.infrastructure.embedder.ollama_embedder import get_embedding_client as get_ollama_embedding_client
 from src.infrastructure.embedder.together_embedder import get_embedding_client as get_together_embedding_client
 
 
+logger = logging.getLogger(__name__)
+
+
 class EmbeddingClient(Protocol):
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         ...
@@ -33,7 +38,7 @@ def get_embedding_client(
     if resolved_provider == EmbedderProvider.TOGETHER:
         return get_together_embedding_client(
             model_name=model_name,
-            api_key=settings.TOGETHER_AI_API_KEY,
+            api_key=get_settings().TOGETHER_AI_API_KEY,
         )
 
     raise ValueError(f"Unsupported embedding provider: {resolved_provider}")
@@ -45,7 +50,26 @@ def get_embeddings(
     provider: EmbedderProvider | str | None = None,
     model_name: str | None = None,
     base_url: str | None = None,
+    reusable: Mapping[str, list[float]] | None = None,
 ) -> list[list[float]]:
+    """Embeds `texts`, skipping those whose content hash has a vector in `reusable`."""
+    if reusable:
+        hashes = [compute_content_hash(text) for text in texts]
+        missing = [index for index, content_hash in enumerate(hashes) if content_hash not in reusable]
+        logger.info("Reusing %d stored embeddings, embedding %d new texts", len(texts) - len(missing), len(missing))
+
+        embeddings = [reusable.get(content_hash) for content_hash in hashes]
+        if missing:
+            new_embeddings = get_embeddings(
+                [texts[index] for index in missing],
+                provider=provider,
+                model_name=model_name,
+                base_url=base_url,
+            )
+            for index, embedding in zip(missing, new_embeddings):
+                embeddings[index] = embedding
+        return embeddings
+
     client = get_embedding_client(
         provider=provider,
         model_name=model_name,
@@ -0,0 +1,252 @@
+import gzip
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable
+
+from pydantic import BaseModel
+
+from src.domain.entities.book import OutputCompression
+from src.domain.entities.chunk import ChunkRecord
+
+
+# Sections written before the chunks; any other payload keys follow them.
+HEADER_SECTIONS = ("resource", "class", "subject", "table_of_contents", "chunker_config")
+
+COMPRESSION_SUFFIXES = {
+    OutputCompression.GZIP: ".gz",
+    OutputCompression.ZSTD: ".zst",
+}
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError(
+            "zstd output needs the 'zstandard' package. Install it with `pip install zstandard`."
+        ) from exc
+    return zstandard
+
+
+def _import_orjson():
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def chunk_to_dict(chunk: ChunkRecord | BaseModel | dict[str, Any]) -> dict[str, Any]:
+    if isinstance(chunk, ChunkRecord):
+        return chunk.to_dict()
+    if isinstance(chunk, BaseModel):
+        return chunk.model_dump()
+    return chunk
+
+
+def encode_compact(value: Any) -> bytes:
+    """Compact JSON as UTF-8 bytes, with orjson when it is installed."""
+    orjson = _import_orjson()
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def compressed_output_path(output_path: Path, compression: OutputCompression = OutputCompression.NONE) -> Path:
+    """Returns `output_path` with the suffix of `compression` appended (`book.json` -> `book.json.zst`)."""
+    output_path = Path(output_path)
+    suffix = COMPRESSION_SUFFIXES.get(OutputCompression(compression), "")
+    return output_path.with_name(output_path.name + suffix) if suffix else output_path
+
+
+def output_stem(output_path: Path) -> Path:
+    """`output_path` without its `.json` and compression suffixes (`out/book.json.zst` -> `out/book`)."""
+    output_path = Path(output_path)
+    name = output_path.name
+    for suffix in (*COMPRESSION_SUFFIXES.values(), ".json"):
+        name = name.removesuffix(suffix)
+    return output_path.with_name(name)
+
+
+def json_index_path(output_path: Path) -> Path:
+    """Sidecar offset table of a JSON output (`book.json` -> `book.index.json`)."""
+    stem = output_stem(output_path)
+    return stem.with_name(f"{stem.name}.index.json")
+
+
+def open_for_writing(path: Path, compression: OutputCompression = OutputCompression.NONE) -> BinaryIO:
+    if compression == OutputCompression.GZIP:
+        # Level 6 is zlib's default; 9 is several times slower for a few percent.
+        return io.BufferedWriter(gzip.open(path, "wb", compresslevel=6), WRITE_BUFFER_SIZE)
+    if compression == OutputCompression.ZSTD:
+        zstandard = _import_zstandard()
+        return io.BufferedWriter(zstandard.ZstdCompressor(level=3).stream_writer(path.open("wb")), WRITE_BUFFER_SIZE)
+    return path.open("wb", buffering=WRITE_BUFFER_SIZE)
+
+
+def open_json_output(path: Path) -> BinaryIO:
+    """Opens a pipeline output for reading, decompressing gzip or zstd files by their magic bytes."""
+    handle = Path(path).open("rb")
+    magic = handle.peek(4)[:4]
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=handle)
+    if magic == ZSTD_MAGIC:
+        return io.BufferedReader(_import_zstandard().ZstdDecompressor().stream_reader(handle, closefd=True))
+    return handle
+
+
+def read_json_output(path: Path) -> dict[str, Any]:
+    """Loads a (possibly compressed) JSON output, with orjson when it is installed."""
+    with open_json_output(path) as handle:
+        data = handle.read()
+    orjson = _import_orjson()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+class StreamingJsonWriter:
+    """Writes a pipeline payload as one JSON object, serializing chunks one at a time.
+
+    Only a single chunk is ever held in serialized form, instead of the whole
+    book. The file is written next to `output_path` and moved into place on a
+    clean close, so a failed run never leaves a truncated output behind.
+    `indent=None` writes compact JSON; `indent=4` matches `json.dump(payload, indent=4)`.
+
+    `backend="auto"` serializes compact output with orjson when it is installed
+    (several times faster than `json.dumps`, and it takes NumPy arrays as is);
+    pretty output always uses the stdlib for its exact layout. `compression`
+    gzip- or zstd-compresses the file as it is written; `output_path` is used
+    as given, see `compressed_output_path`.
+
+    With `index_path`, the byte offset and length of every chunk (in the
+    uncompressed stream) and its chapter and page numbers are written to that
+    sidecar too, for `src.infrastructure.output.reader`.
+    """
+
+    BACKENDS = ("auto", "orjson", "json")
+
+    def __init__(
+        self,
+        output_path: Path,
+        indent: int | None = None,
+        compression: OutputCompression = OutputCompression.NONE,
+        backend: str = "auto",
+        index_path: Path | None = None,
+    ):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown JSON backend '{backend}'. Use one of: {', '.join(self.BACKENDS)}.")
+
+        self.output_path = Path(output_path)
+        self.indent = indent
+        self.compression = OutputCompression(compression)
+        self._orjson = _import_orjson() if backend != "json" and indent is None else None
+        if backend == "orjson" and self._orjson is None:
+            raise ImportError("The orjson backend needs the 'orjson' package and compact output (indent=None).")
+
+        self._temporary_path = self.output_path.with_name(f".{self.output_path.name}.partial")
+        self._handle: BinaryIO | None = None
+        self._sections_written = 0
+        self._position = 0
+        self.index_path = Path(index_path) if index_path else None
+        self.index: dict[str, Any] | None = None
+
+    def __enter__(self) -> "StreamingJsonWriter":
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open_for_writing(self._temporary_path, self.compression)
+        self._write("{")
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self._write(self._newline(0) + "}" if self._sections_written else "}")
+        self._handle.close()
+
+        if exc_type is None:
+            os.replace(self._temporary_path, self.output_path)
+            if self.index_path is not None and self.index is not None:
+                # Lets readers notice an output rewritten without its index.
+                self.index["output_bytes"] = self.output_path.stat().st_size
+                self._write_index()
+        else:
+            self._temporary_path.unlink(missing_ok=True)
+
+    def _write_index(self) -> None:
+        temporary_path = self.index_path.with_name(f".{self.index_path.name}.partial")
+        with temporary_path.open("w", encoding="utf-8") as handle:
+            json.dump(self.index, handle)
+        os.replace(temporary_path, self.index_path)
+
+    def _write(self, text: str | bytes) -> None:
+        data = text.encode("utf-8") if isinstance(text, str) else text
+        self._handle.write(data)
+        self._position += len(data)
+
+    def _newline(self, depth: int) -> str:
+        return "" if self.indent is None else "\n" + " " * (self.indent * depth)
+
+    def _dumps(self, value: Any, depth: int) -> str | bytes:
+        value = chunk_to_dict(value)
+        if self._orjson is not None:
+            return self._orjson.dumps(value, option=self._orjson.OPT_SERIALIZE_NUMPY)
+        separators = (",", ":") if self.indent is None else (",", ": ")
+        text = json.dumps(value, ensure_ascii=False, indent=self.indent, separators=separators)
+        return text if self.indent is None else text.replace("\n", self._newline(depth))
+
+    def _start_section(self, key: str) -> None:
+        separator = "," if self._sections_written else ""
+        colon = ":" if self.indent is None else ": "
+        self._write(f"{separator}{self._newline(1)}{json.dumps(key)}{colon}")
+        self._sections_written += 1
+
+    def write_section(self, key: str, value: Any) -> None:
+        self._start_section(key)
+        self._write(self._dumps(value, 1))
+
+    def write_chunks(self, chunks: Iterable[ChunkRecord | BaseModel | dict[str, Any]], key: str = "chunks") -> int:
+        """Streams `chunks` (records, models or dicts, any iterable) as a JSON array; returns how many were written."""
+        self._start_section(key)
+        # Only the first chunk array is indexed.
+        index = None
+        if self.index is None:
+            index = self.index = {
+                "chunks_start": self._position,
+                "offsets": [],
+                "lengths": [],
+                "chapter_numbers": [],
+                "page_numbers": [],
+            }
+        self._write("[")
+
+        count = 0
+        for chunk in chunks:
+            chunk = chunk_to_dict(chunk)
+            if count:
+                self._write(",")
+            self._write(self._newline(2))
+            start = self._position
+            self._write(self._dumps(chunk, 2))
+            if index is not None:
+                index["offsets"].append(start)
+                index["lengths"].append(self._position - start)
+                index["chapter_numbers"].append(chunk.get("chapter_number"))
+                index["page_numbers"].append(chunk.get("page_number"))
+            count += 1
+
+        self._write((self._newline(1) if count else "") + "]")
+        if index is not None:
+            index["chunks_end"] = self._position
+        return count
+
+    def write_payload(self, payload: dict[str, Any]) -> None:
+        for key in HEADER_SECTIONS:
+            if key in payload:
+                self.write_section(key, payload[key])
+        if "chunks" in payload:
+            self.write_chunks(payload["chunks"])
+        for key, value in payload.items():
+            if key not in HEADER_SECTIONS and key != "chunks":
+                self.write_section(key, value)
@@ -0,0 +1,180 @@
+import json
+import logging
+import math
+import os
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+from pydantic import BaseModel
+
+from src.domain.entities.chunk import ChunkRecord
+
+from src.infrastructure.output.json_writer import HEADER_SECTIONS, chunk_to_dict
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_ROW_GROUP_SIZE = 4096
+DEFAULT_PARQUET_COMPRESSION = "zstd"
+CHUNK_COLUMNS = ("content", "page_number", "chapter_number", "chapter_title", "section_title", "content_hash")
+
+
+def import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet output needs the 'pyarrow' package. Install it with `pip install pyarrow`."
+        ) from exc
+    return pa, pq
+
+
+def parquet_output_paths(output_path: Path) -> tuple[Path, Path]:
+    """Returns the chunk table path (`.parquet`) and its JSON metadata sidecar (`.metadata.json`)."""
+    output_path = Path(output_path)
+    return output_path.with_suffix(".parquet"), output_path.with_suffix(".metadata.json")
+
+
+def _chunk_schema(pa, embedding_dimension: int):
+    # Parquet cannot round-trip zero-size lists; a book without any embedding gets a plain list column.
+    embedding_type = pa.list_(pa.float32(), embedding_dimension) if embedding_dimension else pa.list_(pa.float32())
+    return pa.schema(
+        [
+            ("content", pa.string()),
+            ("page_number", pa.int32()),
+            ("chapter_number", pa.int32()),
+            ("chapter_title", pa.string()),
+            ("section_title", pa.string()),
+            ("content_hash", pa.string()),
+            ("embedding", embedding_type),
+        ]
+    )
+
+
+def _batches(chunks: Iterable[ChunkRecord | BaseModel | dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    iterator = map(chunk_to_dict, chunks)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _embedding_matrix(rows: list[dict[str, Any]], embedding_dimension: int) -> np.ndarray:
+    # pyarrow cannot read back null fixed-size lists, so a failed embedding is stored as a NaN row.
+    matrix = np.full((len(rows), embedding_dimension), np.nan, dtype=np.float32)
+    for row_number, row in enumerate(rows):
+        embedding = row["embedding"]
+        if len(embedding) == embedding_dimension:
+            matrix[row_number] = embedding
+        elif len(embedding):
+            raise ValueError(
+                f"Chunk on page {row.get('page_number')} has a {len(embedding)}-dimension embedding, "
+                f"expected {embedding_dimension}"
+            )
+    return matrix
+
+
+def restore_missing_embeddings(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Turns the NaN rows written for failed embeddings back into empty lists, as in JSON outputs."""
+    for row in rows:
+        embedding = row["embedding"]
+        if not embedding or math.isnan(embedding[0]):
+            row["embedding"] = []
+    return rows
+
+
+def _record_batch(pa, schema, rows: list[dict[str, Any]], embedding_dimension: int):
+    if embedding_dimension:
+        embeddings = _embedding_matrix(rows, embedding_dimension).reshape(-1)
+        embedding_column = pa.FixedSizeListArray.from_arrays(pa.array(embeddings), embedding_dimension)
+    else:
+        embedding_column = pa.array([[] for _ in rows], type=schema.field("embedding").type)
+    columns = [pa.array([row.get(name) for row in rows], type=schema.field(name).type) for name in CHUNK_COLUMNS]
+    return pa.RecordBatch.from_arrays([*columns, embedding_column], schema=schema)
+
+
+def write_parquet_output(
+    output_path: Path,
+    payload: dict[str, Any],
+    *,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = DEFAULT_PARQUET_COMPRESSION,
+) -> tuple[Path, Path]:
+    """Writes chunks to a Parquet table and the remaining sections to a JSON sidecar.
+
+    Chunks are consumed in row groups of `row_group_size`, so only one group is
+    materialized at a time. Embeddings are stored as `FixedSizeList<float32>`,
+    so readers can view them as a matrix without parsing text. The dimension
+    comes from the first chunk with an embedding; chunks whose embedding
+    failed are kept, with a NaN vector, so the table matches the JSON output.
+    """
+    pa, pq = import_pyarrow()
+    chunks_path, sidecar_path = parquet_output_paths(output_path)
+    chunks_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = chunks_path.with_name(f".{chunks_path.name}.partial")
+
+    writer = None
+    schema = None
+    embedding_dimension = 0
+    chunk_count = 0
+    missing_count = 0
+    # Rows wait here until a chunk with an embedding fixes the column's dimension.
+    pending: list[dict[str, Any]] = []
+
+    try:
+        for rows in _batches(payload.get("chunks", []), row_group_size):
+            chunk_count += len(rows)
+            missing_count += sum(1 for row in rows if not len(row["embedding"]))
+            if writer is None:
+                pending.extend(rows)
+                embedding_dimension = next((len(row["embedding"]) for row in pending if len(row["embedding"])), 0)
+                if not embedding_dimension:
+                    continue
+                schema = _chunk_schema(pa, embedding_dimension)
+                writer = pq.ParquetWriter(temporary_path, schema, compression=compression)
+                rows, pending = pending, []
+
+            for start in range(0, len(rows), row_group_size):
+                group = rows[start:start + row_group_size]
+                writer.write_batch(_record_batch(pa, schema, group, embedding_dimension), row_group_size=row_group_size)
+
+        if writer is None:
+            schema = _chunk_schema(pa, 0)
+            table = pa.Table.from_batches([_record_batch(pa, schema, pending, 0)] if pending else [], schema=schema)
+            pq.write_table(table, temporary_path, compression=compression)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+    if writer is not None:
+        writer.close()
+    os.replace(temporary_path, chunks_path)
+
+    if missing_count:
+        logger.warning("Wrote %d chunks without an embedding to %s as NaN rows", missing_count, chunks_path.name)
+
+    sidecar = {key: payload[key] for key in HEADER_SECTIONS if key in payload}
+    sidecar["chunks_file"] = chunks_path.name
+    sidecar["chunk_count"] = chunk_count
+    sidecar["embedding_dimension"] = embedding_dimension
+    sidecar.update({key: value for key, value in payload.items() if key not in HEADER_SECTIONS and key != "chunks"})
+    with sidecar_path.open("w", encoding="utf-8") as handle:
+        json.dump(sidecar, handle, ensure_ascii=False)
+
+    return chunks_path, sidecar_path
+
+
+def read_parquet_output(output_path: Path) -> dict[str, Any]:
+    """Loads a Parquet output back into the JSON payload layout (chunks as dicts)."""
+    _, pq = import_pyarrow()
+    chunks_path, sidecar_path = parquet_output_paths(output_path)
+
+    with sidecar_path.open("r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+
+    payload["chunks"] = restore_missing_embeddings(pq.read_table(chunks_path).to_pylist())
+    return payload
@@ -0,0 +1,263 @@
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Sequence
+
+import numpy as np
+
+from src.domain.entities.book import OutputFormat
+from src.infrastructure.output.json_writer import (
+    COMPRESSION_SUFFIXES,
+    compressed_output_path,
+    json_index_path,
+    open_json_output,
+)
+from src.infrastructure.output.parquet_writer import import_pyarrow, parquet_output_paths, restore_missing_embeddings
+from src.infrastructure.output.sharded_writer import MANIFEST_NAME, sharded_output_dir
+
+
+SKIP_SIZE = 1 << 20
+
+
+class OutputReader(ABC):
+    """Random access to the chunks of a pipeline output without loading the whole file.
+
+    Chapter and page numbers of every chunk come from the output's offset
+    table, so selecting chunks never parses the ones that are not returned.
+    Chunks come back as dicts in the layout of `Chunk.model_dump()`, in book
+    order (chapter order for sharded outputs).
+    """
+
+    metadata: dict[str, Any]
+    chapter_numbers: np.ndarray
+    page_numbers: np.ndarray
+
+    def __enter__(self) -> "OutputReader":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return len(self.chapter_numbers)
+
+    def chapters(self) -> list[int]:
+        return sorted(set(self.chapter_numbers.tolist()))
+
+    def select(self, *, chapter_number: int | None = None, page_number: int | None = None) -> np.ndarray:
+        """Positions of the chunks in a chapter and/or on a page."""
+        mask = np.ones(len(self), dtype=bool)
+        if chapter_number is not None:
+            mask &= self.chapter_numbers == chapter_number
+        if page_number is not None:
+            mask &= self.page_numbers == page_number
+        return np.flatnonzero(mask)
+
+    def iter_chunks(self, *, chapter_number: int | None = None, page_number: int | None = None) -> Iterator[dict[str, Any]]:
+        return self.read(self.select(chapter_number=chapter_number, page_number=page_number))
+
+    def embeddings(self, *, chapter_number: int | None = None, page_number: int | None = None) -> np.ndarray:
+        """Embeddings of the selected chunks as a float32 matrix, one row per chunk (NaN where embedding failed)."""
+        vectors = [chunk["embedding"] for chunk in self.iter_chunks(chapter_number=chapter_number, page_number=page_number)]
+        dimension = max((len(vector) for vector in vectors), default=0)
+        # Chunks whose embedding failed get a NaN row, as in Parquet outputs.
+        matrix = np.full((len(vectors), dimension), np.nan, dtype=np.float32)
+        for row, vector in enumerate(vectors):
+            if len(vector):
+                matrix[row] = vector
+        return matrix
+
+    @abstractmethod
+    def read(self, positions: Sequence[int]) -> Iterator[dict[str, Any]]:
+        """Yields the chunks at `positions` (ascending)."""
+
+
+def _seek_forward(handle: BinaryIO, position: int, offset: int) -> None:
+    """Moves from `position` to `offset`; zstd streams cannot seek, so the bytes in between are skipped."""
+    if handle.seekable():
+        handle.seek(offset)
+        return
+    while position < offset:
+        skipped = len(handle.read(min(offset - position, SKIP_SIZE)))
+        if not skipped:
+            raise EOFError(f"Offset {offset} is past the end of the output")
+        position += skipped
+
+
+def _read_slices(path: Path, slices: Iterator[tuple[int, int]]) -> Iterator[bytes]:
+    """Reads ascending `(offset, length)` slices of a possibly compressed file.
+
+    Plain files seek directly; gzip and zstd streams only move forward, by
+    decompressing and discarding what lies in between.
+    """
+    position = 0
+    with open_json_output(path) as handle:
+        for offset, length in slices:
+            _seek_forward(handle, position, offset)
+            data = handle.read(length)
+            position = offset + len(data)
+            yield data
+
+
+class JsonOutputReader(OutputReader):
+    """Reads a JSON output through its `<stem>.index.json` offset table."""
+
+    def __init__(self, path: Path, index_path: Path):
+        self.path = Path(path)
+        with Path(index_path).open("r", encoding="utf-8") as handle:
+            self._index = json.load(handle)
+        output_bytes = self._index.get("output_bytes")
+        if output_bytes is not None and output_bytes != self.path.stat().st_size:
+            raise ValueError(
+                f"{index_path} does not match {self.path}, which was written again without an offset table."
+            )
+
+        self._offsets = self._index["offsets"]
+        self._lengths = self._index["lengths"]
+        self.chapter_numbers = np.asarray(self._index["chapter_numbers"], dtype=np.int64)
+        self.page_numbers = np.asarray(self._index["page_numbers"], dtype=np.int64)
+        self.metadata = self._read_metadata()
+
+    def _read_metadata(self) -> dict[str, Any]:
+        # Everything but the chunk array: the bytes before it, an empty array, the bytes after it.
+        start, end = self._index["chunks_start"], self._index["chunks_end"]
+        with open_json_output(self.path) as handle:
+            head = handle.read(start)
+            _seek_forward(handle, start, end)
+            tail = handle.read()
+        metadata = json.loads(head + b"[]" + tail)
+        metadata.pop("chunks", None)
+        return metadata
+
+    def read(self, positions: Sequence[int]) -> Iterator[dict[str, Any]]:
+        slices = ((self._offsets[position], self._lengths[position]) for position in positions)
+        for data in _read_slices(self.path, slices):
+            yield json.loads(data)
+
+
+class ShardedOutputReader(OutputReader):
+    """Reads a sharded output through the offsets in its manifest, opening only the shards it needs."""
+
+    def __init__(self, output_path: Path):
+        output_path = Path(output_path)
+        self.output_dir = output_path.parent if output_path.name == MANIFEST_NAME else sharded_output_dir(output_path)
+        with (self.output_dir / MANIFEST_NAME).open("r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        self._shards: list[dict[str, Any]] = manifest.pop("shards")
+        self.metadata = manifest
+
+        self._shard_of = np.repeat(np.arange(len(self._shards)), [shard["chunk_count"] for shard in self._shards])
+        self.chapter_numbers = np.repeat(
+            np.asarray([shard["chapter_number"] for shard in self._shards], dtype=np.int64),
+            [shard["chunk_count"] for shard in self._shards],
+        )
+        self.page_numbers = np.asarray(
+            [page for shard in self._shards for page in shard["page_numbers"]], dtype=np.int64
+        )
+        self._first_position = np.concatenate([[0], np.cumsum([shard["chunk_count"] for shard in self._shards])])
+
+    def read(self, positions: Sequence[int]) -> Iterator[dict[str, Any]]:
+        positions = np.asarray(positions, dtype=np.int64)
+        for shard_number in np.unique(self._shard_of[positions]):
+            shard = self._shards[shard_number]
+            local = positions[self._shard_of[positions] == shard_number] - self._first_position[shard_number]
+            ends = shard["offsets"][1:] + [shard["bytes"]]
+            slices = ((shard["offsets"][line], ends[line] - shard["offsets"][line]) for line in local)
+            for data in _read_slices(self.output_dir / shard["file"], slices):
+                yield json.loads(data)
+
+
+class ParquetOutputReader(OutputReader):
+    """Reads a Parquet output; embeddings come straight from the memory-mapped column."""
+
+    def __init__(self, output_path: Path):
+        _, pq = import_pyarrow()
+        chunks_path, sidecar_path = parquet_output_paths(output_path)
+        with sidecar_path.open("r", encoding="utf-8") as handle:
+            self.metadata = json.load(handle)
+
+        self._table = pq.read_table(chunks_path, memory_map=True)
+        self.chapter_numbers = self._table.column("chapter_number").to_numpy()
+        self.page_numbers = self._table.column("page_number").to_numpy()
+
+    def read(self, positions: Sequence[int]) -> Iterator[dict[str, Any]]:
+        yield from restore_missing_embeddings(self._table.take(np.asarray(positions, dtype=np.int64)).to_pylist())
+
+    def embeddings(self, *, chapter_number: int | None = None, page_number: int | None = None) -> np.ndarray:
+        positions = self.select(chapter_number=chapter_number, page_number=page_number)
+        dimension = self.metadata.get("embedding_dimension")
+        if not len(positions) or not dimension:
+            return np.zeros((len(positions), 0), dtype=np.float32)
+
+        # Each row group is viewed in place (memory-mapped, no copy); only the
+        # selected rows are copied, once, into the returned matrix.
+        matrix = np.empty((len(positions), dimension), dtype=np.float32)
+        row_group_start = 0
+        for row_group in self._table.column("embedding").chunks:
+            row_group_end = row_group_start + len(row_group)
+            first, last = np.searchsorted(positions, [row_group_start, row_group_end])
+            if first < last:
+                view = row_group.flatten().to_numpy(zero_copy_only=True).reshape(-1, dimension)
+                matrix[first:last] = view[positions[first:last] - row_group_start]
+            row_group_start = row_group_end
+        return matrix
+
+
+def _json_output_files(output_path: Path) -> list[Path]:
+    """The JSON outputs on disk for `output_path`, plain or compressed, newest first."""
+    candidates = [output_path] + [compressed_output_path(output_path, compression) for compression in COMPRESSION_SUFFIXES]
+    existing = [candidate for candidate in candidates if candidate.exists()]
+    return sorted(existing, key=lambda path: path.stat().st_mtime_ns, reverse=True)
+
+
+def _detect_output_format(output_path: Path) -> OutputFormat:
+    """The format of a written file path, or of the newest output written for `output_path`."""
+    if output_path.name == MANIFEST_NAME:
+        return OutputFormat.SHARDED
+    if output_path.suffix == ".parquet":
+        return OutputFormat.PARQUET
+    if output_path.suffix in COMPRESSION_SUFFIXES.values():
+        return OutputFormat.JSON
+
+    # A book switched to another format keeps its older files around, so the
+    # most recently written output wins, not the first one found.
+    written = {
+        OutputFormat.PARQUET: [parquet_output_paths(output_path)[0]],
+        OutputFormat.SHARDED: [sharded_output_dir(output_path) / MANIFEST_NAME],
+        OutputFormat.JSON: _json_output_files(output_path),
+    }
+    modified: dict[OutputFormat, int] = {}
+    for output_format, paths in written.items():
+        existing = [path for path in paths if path.exists()]
+        if existing:
+            modified[output_format] = max(path.stat().st_mtime_ns for path in existing)
+    return max(modified, key=modified.get, default=OutputFormat.JSON)
+
+
+def open_output(output_path: Path, output_format: OutputFormat | None = None) -> OutputReader:
+    """Opens the output written by `write_output(output_path, ...)`.
+
+    `output_path` is the path given to `write_output` or one of the files it
+    wrote (`book.parquet`, `book/manifest.json`, `book.json.zst`). Unless
+    `output_format` is given, the format comes from that file or, for the
+    former, from the most recently written output on disk.
+    """
+    output_path = Path(output_path)
+    if output_format is None:
+        output_format = _detect_output_format(output_path)
+
+    if output_format == OutputFormat.PARQUET:
+        return ParquetOutputReader(output_path)
+    if output_format == OutputFormat.SHARDED:
+        return ShardedOutputReader(output_path)
+
+    path = next(iter(_json_output_files(output_path)), output_path)
+    index_path = json_index_path(output_path)
+    if not index_path.exists():
+        raise FileNotFoundError(
+            f"No offset table at {index_path}; outputs written before the reader existed must be written again."
+        )
+    return JsonOutputReader(path, index_path)
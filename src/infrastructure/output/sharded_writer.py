@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+from src.domain.entities.book import OutputCompression
+from src.infrastructure.output.json_writer import (
+    COMPRESSION_SUFFIXES,
+    HEADER_SECTIONS,
+    chunk_to_dict,
+    encode_compact,
+    open_for_writing,
+    open_json_output,
+    output_stem,
+)
+
+
+MANIFEST_NAME = "manifest.json"
+
+
+def sharded_output_dir(output_path: Path) -> Path:
+    """Directory holding the shards and manifest of `output_path` (`book.json` -> `book/`).
+
+    A path without a `.json` or compression suffix would be its own directory,
+    replacing the file at that path, so it gets `book.shards/` instead.
+    """
+    output_path = Path(output_path)
+    stem = output_stem(output_path)
+    return stem if stem != output_path else output_path.with_name(f"{output_path.name}.shards")
+
+
+def shard_file_name(chapter_number: int, compression: OutputCompression = OutputCompression.NONE) -> str:
+    return f"chapter_{chapter_number:03d}.jsonl" + COMPRESSION_SUFFIXES.get(OutputCompression(compression), "")
+
+
+class _ShardWriter:
+    """Appends chunks to one chapter's JSON Lines file and records where each one starts."""
+
+    def __init__(self, directory: Path, chapter_number: int, compression: OutputCompression):
+        self.chapter_number = chapter_number
+        self.file_name = shard_file_name(chapter_number, compression)
+        self.offsets: list[int] = []
+        self.page_numbers: list[int] = []
+        self.size = 0
+        self._content_hashes = hashlib.sha256()
+        self._handle: BinaryIO = open_for_writing(directory / self.file_name, compression)
+
+    def write(self, chunk: dict[str, Any]) -> None:
+        line = encode_compact(chunk) + b"\n"
+        self._handle.write(line)
+        self.offsets.append(self.size)
+        self.page_numbers.append(chunk["page_number"])
+        self.size += len(line)
+        self._content_hashes.update(chunk["content_hash"].encode("ascii") + b"\n")
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def manifest_entry(self) -> dict[str, Any]:
+        return {
+            "chapter_number": self.chapter_number,
+            "file": self.file_name,
+            "chunk_count": len(self.offsets),
+            "bytes": self.size,
+            # Digest of the chunk content hashes in order: equal digests mean an unchanged chapter.
+            "content_hash": self._content_hashes.hexdigest(),
+            "offsets": self.offsets,
+            "page_numbers": self.page_numbers,
+        }
+
+
+def write_sharded_output(
+    output_path: Path,
+    payload: dict[str, Any],
+    *,
+    compression: OutputCompression = OutputCompression.NONE,
+) -> Path:
+    """Writes one JSON Lines file per chapter plus a manifest; returns the manifest path.
+
+    Chunks are streamed into the shard of their `chapter_number`. The manifest
+    holds the header sections, any trailing sections (`changes`), and for every
+    shard its chunk count, size, the byte offset (in the uncompressed shard)
+    and page number of each chunk line, and a digest of its content hashes. The directory is
+    built next to its final location and swapped in once complete.
+    """
+    output_dir = sharded_output_dir(output_path)
+    temporary_dir = output_dir.with_name(f".{output_dir.name}.partial")
+    shutil.rmtree(temporary_dir, ignore_errors=True)
+    temporary_dir.mkdir(parents=True)
+
+    shards: dict[int, _ShardWriter] = {}
+    try:
+        try:
+            for chunk in payload.get("chunks", []):
+                row = chunk_to_dict(chunk)
+                shard = shards.get(row["chapter_number"])
+                if shard is None:
+                    shard = shards[row["chapter_number"]] = _ShardWriter(
+                        temporary_dir, row["chapter_number"], compression
+                    )
+                shard.write(row)
+        finally:
+            for shard in shards.values():
+                shard.close()
+
+        manifest = {key: payload[key] for key in HEADER_SECTIONS if key in payload}
+        manifest["chunk_count"] = sum(len(shard.offsets) for shard in shards.values())
+        manifest["shards"] = [shards[number].manifest_entry() for number in sorted(shards)]
+        manifest.update({key: value for key, value in payload.items() if key not in HEADER_SECTIONS and key != "chunks"})
+        with (temporary_dir / MANIFEST_NAME).open("w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, ensure_ascii=False)
+    except BaseException:
+        shutil.rmtree(temporary_dir, ignore_errors=True)
+        raise
+
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    os.replace(temporary_dir, output_dir)
+    return output_dir / MANIFEST_NAME
+
+
+def read_manifest(output_path: Path) -> dict[str, Any]:
+    with (sharded_output_dir(output_path) / MANIFEST_NAME).open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def iter_shard_chunks(output_path: Path, shard: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yields the chunks of one manifest shard, one line at a time."""
+    with open_json_output(sharded_output_dir(output_path) / shard["file"]) as handle:
+        for line in handle:
+            yield json.loads(line)
+
+
+def read_sharded_output(output_path: Path) -> dict[str, Any]:
+    """Loads a sharded output back into the JSON payload layout, chapter by chapter."""
+    payload = read_manifest(output_path)
+    payload["chunks"] = [chunk for shard in payload["shards"] for chunk in iter_shard_chunks(output_path, shard)]
+    return payload
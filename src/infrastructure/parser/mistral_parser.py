@@ -1,17 +1,29 @@
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from langchain_core.documents import Document
-import mistralai
 
-from src.config.settings import settings
+from src.config.settings import get_settings
+from src.domain.entities.page import Page
+
+if TYPE_CHECKING:
+    import mistralai
 
 
 class MistralParser():
     def __init__(self, book_path: Path):
-        self.client = mistralai.Mistral(api_key=settings.MISTRAL_API_KEY)
+        import mistralai
+
+        self.client = mistralai.Mistral(api_key=get_settings().MISTRAL_API_KEY)
         self.book_path = Path(book_path)
 
     def load(self) -> list[Document]:
+        return self.response_to_documents(ocr_response=self._process())
+
+    def load_pages(self) -> list[Page]:
+        return self.response_to_pages(ocr_response=self._process())
+
+    def _process(self) -> "mistralai.models.ocrresponse.OCRResponse":
         uploaded_pdf = self.client.files.upload(
             file={
                 "file_name": self.book_path.name,
@@ -31,11 +43,20 @@ class MistralParser():
             include_image_base64=True
         )
 
-        return self.response_to_documents(ocr_response=ocr_response)
+        return ocr_response
+
+    @staticmethod
+    def response_to_pages(
+        ocr_response: "mistralai.models.ocrresponse.OCRResponse"
+    ) -> list[Page]:
+        return [
+            Page(index=index, label=index + 1, text=page.markdown + "\n")
+            for index, page in enumerate(ocr_response.pages)
+        ]
 
     @staticmethod
     def response_to_documents(
-        ocr_response: mistralai.models.ocrresponse.OCRResponse
+        ocr_response: "mistralai.models.ocrresponse.OCRResponse"
     ) -> list[Document]:    
         docs = []
         for i, page in enumerate(ocr_response.pages, start=1):
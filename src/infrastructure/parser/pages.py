@@ -0,0 +1,14 @@
+from typing import Iterable
+
+from langchain_core.documents import Document
+
+from src.domain.entities.page import Page
+
+
+def pages_from_documents(documents: Iterable[Document]) -> list[Page]:
+    """Converts LangChain loader output to pages, dropping the per-page metadata dicts."""
+    return [
+        Page(index=index, label=int(document.metadata["page_label"]), text=document.page_content)
+        for index, document in enumerate(documents)
+    ]
+
@@ -0,0 +1,38 @@
+import re
+from typing import Iterable
+
+
+DEFAULT_BOILERPLATE_PATTERNS = (
+    "FOR ONLINE USE ONLY",
+    "DO NOT DUPLICATE",
+    "PROPERTY OF THE UNITED REPUBLIC OF TANZANIA GOBVERNMENT",
+    "Ministry of Education, Science and Technology",
+    "For Online Use Only",
+)
+
+
+class BoilerplateStripper:
+    """Removes watermark strings from page text with a single compiled matcher.
+
+    The shared defaults are always applied; book-specific strings (running
+    titles, series names...) come from `book_config.boilerplate_patterns`
+    in the book's `info.yaml`.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        unique_patterns = dict.fromkeys(
+            pattern for pattern in (*DEFAULT_BOILERPLATE_PATTERNS, *patterns) if pattern
+        )
+
+        # Longest first, so a pattern that contains another one is removed whole.
+        self.patterns: tuple[str, ...] = tuple(sorted(unique_patterns, key=len, reverse=True))
+        self._matcher = (
+            re.compile("|".join(re.escape(pattern) for pattern in self.patterns))
+            if self.patterns
+            else None
+        )
+
+    def strip(self, text: str) -> str:
+        if self._matcher is None:
+            return text
+        return self._matcher.sub("", text)
@@ -0,0 +1,125 @@
+import re
+from dataclasses import dataclass
+from typing import Sequence
+
+
+HEADING_PATTERN = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t#]*$", re.MULTILINE)
+CHAPTER_HEADING_PATTERN = re.compile(
+    r"^(?:chapter|unit|sura(?:\s+ya)?)\s+(\w+)\b[\s:.\-–—]*(.*)$",
+    re.IGNORECASE,
+)
+EMPHASIS_PATTERN = re.compile(r"[*_`]+")
+
+NUMBER_WORDS = {
+    word: number
+    for number, word in enumerate(
+        [
+            "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
+            "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen",
+            "eighteen", "nineteen", "twenty",
+        ],
+        start=1,
+    )
+}
+ROMAN_NUMERAL_PATTERN = re.compile(r"^(x{0,3})(ix|iv|v?i{0,3})$")
+ROMAN_VALUES = {"i": 1, "v": 5, "x": 10}
+
+
+@dataclass(slots=True)
+class MarkdownSection:
+    """A run of text on one page under a single chapter and section heading."""
+
+    page: int
+    chapter_number: int
+    chapter_title: str | None
+    section_title: str | None
+    text: str
+
+
+def parse_chapter_number(token: str) -> int | None:
+    """Reads "4", "IV" or "Four" as 4; returns None for anything else."""
+    token = token.casefold()
+    if token.isdigit():
+        return int(token)
+    if token in NUMBER_WORDS:
+        return NUMBER_WORDS[token]
+    if token and ROMAN_NUMERAL_PATTERN.match(token):
+        values = [ROMAN_VALUES[char] for char in token]
+        return sum(-value if value < following else value for value, following in zip(values, values[1:] + [0]))
+    return None
+
+
+def _clean_heading(title: str) -> str:
+    return EMPHASIS_PATTERN.sub("", title).strip()
+
+
+def _chapter_heading(title: str) -> tuple[int, str] | None:
+    match = CHAPTER_HEADING_PATTERN.match(title)
+    if not match:
+        return None
+    number = parse_chapter_number(match.group(1))
+    if number is None:
+        return None
+    return number, match.group(2).strip()
+
+
+def split_markdown_sections(pages: Sequence[str]) -> list[MarkdownSection]:
+    """Walks the markdown headings of every page once and tags each text run.
+
+    Chapters start at headings such as "Chapter 4", "Unit IV" or "Sura ya 4",
+    at the shallowest level where such a heading occurs; deeper ones ("## Chapter
+    2 review questions") are sections. The chapter title is the rest of that
+    heading or, when it is empty, the heading right after it unless that one is
+    nested deeper. A repeated heading for the current chapter (a running header)
+    does not start a new one. Books without such headings fall back to treating
+    every heading at the shallowest level used as a new, sequentially numbered
+    chapter, unless it repeats the current chapter's title. Other headings become
+    the section title. Text before the first chapter is tagged with chapter 0.
+    """
+    segments: list[tuple[int, tuple[int, str] | None, str]] = []
+    for page, text in enumerate(pages):
+        matches = list(HEADING_PATTERN.finditer(text))
+        if not matches or matches[0].start() > 0:
+            segments.append((page, None, text[:matches[0].start() if matches else len(text)]))
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(text)
+            segments.append((page, (len(match.group(1)), _clean_heading(match.group(2))), text[match.start():end]))
+
+    headings = [heading for _, heading, _ in segments if heading is not None]
+    chapter_heading_levels = [level for level, title in headings if _chapter_heading(title)]
+    uses_chapter_headings = bool(chapter_heading_levels)
+    chapter_level = min(chapter_heading_levels or [level for level, _ in headings], default=0)
+
+    sections: list[MarkdownSection] = []
+    chapter_number = 0
+    chapter_title: str | None = None
+    section_title: str | None = None
+    # Heading level of a chapter heading still waiting for its title, if any.
+    title_level: int | None = None
+
+    for page, heading, text in segments:
+        if heading is not None:
+            level, title = heading
+            chapter = None
+            if level == chapter_level and uses_chapter_headings:
+                chapter = _chapter_heading(title)
+            elif level == chapter_level:
+                repeats_chapter = chapter_title is not None and title.casefold() == chapter_title.casefold()
+                chapter = (chapter_number if repeats_chapter else chapter_number + 1, title)
+
+            if chapter is not None and chapter[0] != chapter_number:
+                chapter_number, chapter_title = chapter
+                chapter_title = chapter_title or None
+                title_level = level if chapter_title is None else None
+                section_title = None
+            elif chapter is None and title_level is not None and level <= title_level:
+                chapter_title = title
+                title_level = None
+            elif chapter is None:
+                section_title = title
+                title_level = None
+
+        if text.strip():
+            sections.append(MarkdownSection(page, chapter_number, chapter_title, section_title, text))
+
+    return sections
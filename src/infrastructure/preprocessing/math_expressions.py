@@ -0,0 +1,149 @@
+import re
+from typing import Iterator
+
+
+MATH_ENVIRONMENT_NAMES = (
+    "align",
+    "align*",
+    "equation",
+    "equation*",
+    "gather",
+    "gather*",
+    "multline",
+    "multline*",
+)
+
+_BEGIN_ENVIRONMENT = "\\begin{"
+_MAX_ENVIRONMENT_NAME_LENGTH = max(len(name) for name in MATH_ENVIRONMENT_NAMES)
+_MATH_ENVIRONMENTS = frozenset(MATH_ENVIRONMENT_NAMES)
+
+_CANDIDATE_PATTERN = re.compile(r"[\\$]")
+_DOLLAR_PATTERN = re.compile(r"\$")
+
+
+class _ForwardFinder:
+    """`str.find` for queries at non-decreasing start positions.
+
+    The previous answer stays valid while it is at or after the new start
+    (and "not found" stays "not found"), so each needle is searched for at
+    most once per occurrence instead of once per opener.
+    """
+
+    def __init__(self, text: str, needle: str):
+        self.text = text
+        self.needle = needle
+        self._found: int | None = None
+
+    def find(self, start: int) -> int:
+        if self._found is not None and (self._found == -1 or self._found >= start):
+            return self._found
+        self._found = self.text.find(self.needle, start)
+        return self._found
+
+
+def _unescaped_dollar_positions(text: str) -> list[int]:
+    """Positions of `$` not consumed by a preceding backslash escape.
+
+    An inline `$...$` body pairs every backslash with the next character, so
+    a `$` closes it exactly when the run of backslashes right before it has
+    even length.
+    """
+    positions = []
+    for match in _DOLLAR_PATTERN.finditer(text):
+        position = match.start()
+        backslashes = 0
+        while position - backslashes - 1 >= 0 and text[position - backslashes - 1] == "\\":
+            backslashes += 1
+        if backslashes % 2 == 0:
+            positions.append(position)
+    return positions
+
+
+def find_math_expressions(text: str) -> Iterator[tuple[int, int]]:
+    """Yields the (start, end) offsets of LaTeX math expressions in a single forward pass.
+
+    Recognises `\\begin{env}...\\end{env}` for `MATH_ENVIRONMENT_NAMES`,
+    `$$...$$`, `\\[...\\]`, `\\(...\\)` and inline `$...$`, with the same
+    leftmost, shortest-closing matches as a lazy regex alternation but
+    without backtracking on stray or unterminated delimiters.
+    """
+    finders: dict[str, _ForwardFinder] = {}
+
+    def find(needle: str, start: int) -> int:
+        finder = finders.get(needle)
+        if finder is None:
+            finder = finders[needle] = _ForwardFinder(text, needle)
+        return finder.find(start)
+
+    dollars = _unescaped_dollar_positions(text)
+    next_dollar = 0
+
+    position = 0
+    length = len(text)
+
+    while position < length:
+        candidate = _CANDIDATE_PATTERN.search(text, position)
+        if candidate is None:
+            return
+
+        start = candidate.start()
+        end = -1
+
+        if text.startswith(_BEGIN_ENVIRONMENT, start):
+            name_start = start + len(_BEGIN_ENVIRONMENT)
+            name_end = text.find("}", name_start, name_start + _MAX_ENVIRONMENT_NAME_LENGTH + 1)
+            if name_end != -1 and text[name_start:name_end] in _MATH_ENVIRONMENTS:
+                closing = "\\end{" + text[name_start:name_end] + "}"
+                found = find(closing, name_end + 1)
+                if found != -1:
+                    end = found + len(closing)
+
+        elif text.startswith("$$", start):
+            found = find("$$", start + 2)
+            if found != -1:
+                end = found + 2
+
+        elif text.startswith("\\[", start):
+            found = find("\\]", start + 2)
+            if found != -1:
+                end = found + 2
+
+        elif text.startswith("\\(", start):
+            found = find("\\)", start + 2)
+            if found != -1:
+                end = found + 2
+
+        elif text[start] == "$":
+            while next_dollar < len(dollars) and dollars[next_dollar] <= start:
+                next_dollar += 1
+            # "$$" is handled above, so the body is never empty here.
+            if next_dollar < len(dollars):
+                end = dollars[next_dollar] + 1
+
+        if end == -1:
+            position = start + 1
+            continue
+
+        yield start, end
+        position = end
+
+
+def wrap_math_expressions(text: str) -> str:
+    """Wraps every math expression in `<math>` tags, leaving already tagged ones untouched."""
+    parts: list[str] = []
+    position = 0
+
+    for start, end in find_math_expressions(text):
+        expression = text[start:end]
+        parts.append(text[position:start])
+        if "<math>" in expression or "</math>" in expression:
+            parts.append(expression)
+        else:
+            parts.append(f"<math>{expression}</math>")
+        position = end
+
+    if not parts:
+        return text
+
+    parts.append(text[position:])
+    return "".join(parts)
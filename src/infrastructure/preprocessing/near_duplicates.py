@@ -0,0 +1,142 @@
+import logging
+import re
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Sequence
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+DEFAULT_NEAR_DUPLICATE_THRESHOLD = 0.85
+
+# Universal hashing (a * x + b) mod p over 32-bit shingle hashes; p is the first
+# prime above 2**32 and a, b < 2**32, so the products fit in uint64.
+_PRIME = np.uint64(4294967311)
+
+
+def _choose_bands(num_perm: int, threshold: float, false_positive_weight: float = 0.2) -> tuple[int, int]:
+    """Picks `bands * rows == num_perm` minimizing the weighted LSH miss and false-hit areas.
+
+    Candidates are verified against their full signatures, so a false positive only
+    costs a comparison while a false negative keeps a duplicate; misses weigh more.
+    """
+    similarities = np.linspace(0, 1, 1001)
+    below = similarities < threshold
+
+    def cost(bands: int) -> float:
+        rows = num_perm // bands
+        probabilities = 1 - (1 - similarities**rows) ** bands
+        false_positives = probabilities[below].sum()
+        false_negatives = (1 - probabilities[~below]).sum()
+        return false_positive_weight * false_positives + (1 - false_positive_weight) * false_negatives
+
+    bands = min((bands for bands in range(1, num_perm + 1) if num_perm % bands == 0), key=cost)
+    return bands, num_perm // bands
+
+
+@dataclass
+class NearDuplicateReport:
+    input_count: int
+    # Index of each dropped text -> index of the kept text it duplicates.
+    dropped: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def dropped_count(self) -> int:
+        return len(self.dropped)
+
+
+class NearDuplicateFilter:
+    """Drops texts whose estimated Jaccard similarity to an earlier kept text reaches `threshold`.
+
+    Texts are normalized, cut into character shingles and summarized by MinHash
+    signatures. LSH banding only compares texts that share a band bucket, so the
+    cost grows with the number of texts rather than the number of pairs. Texts
+    are visited in order and compared against kept texts only, so the first
+    occurrence is the representative and similarity never chains across a
+    cluster.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_NEAR_DUPLICATE_THRESHOLD,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        seed: int = 1,
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _choose_bands(num_perm, threshold)
+
+        generator = np.random.default_rng(seed)
+        self._a = generator.integers(1, 2**32, size=(num_perm, 1), dtype=np.uint64)
+        self._b = generator.integers(0, 2**32, size=(num_perm, 1), dtype=np.uint64)
+
+    def _shingle_hashes(self, text: str) -> np.ndarray:
+        normalized = WHITESPACE_PATTERN.sub(" ", text).strip().casefold()
+        size = self.shingle_size
+        shingles = {normalized[index:index + size] for index in range(max(len(normalized) - size + 1, 1))}
+        return np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = self._shingle_hashes(text)
+        return ((self._a * hashes[np.newaxis, :] + self._b) % _PRIME).min(axis=1)
+
+    def filter(self, texts: Sequence[str]) -> tuple[list[int], NearDuplicateReport]:
+        """Returns the indices of the texts to keep, in order, and what was dropped."""
+        report = NearDuplicateReport(input_count=len(texts))
+        buckets: list[dict[bytes, list[int]]] = [defaultdict(list) for _ in range(self.bands)]
+        signatures: dict[int, np.ndarray] = {}
+        kept: list[int] = []
+
+        for index, text in enumerate(texts):
+            signature = self.signature(text)
+            band_keys = [
+                signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)
+            ]
+
+            representative = None
+            seen: set[int] = set()
+            for band_buckets, key in zip(buckets, band_keys):
+                for candidate in band_buckets.get(key, ()):
+                    if candidate in seen:
+                        continue
+                    seen.add(candidate)
+                    if np.mean(signatures[candidate] == signature) >= self.threshold:
+                        representative = candidate
+                        break
+                if representative is not None:
+                    break
+
+            if representative is not None:
+                report.dropped[index] = representative
+                continue
+
+            kept.append(index)
+            signatures[index] = signature
+            for band_buckets, key in zip(buckets, band_keys):
+                band_buckets[key].append(index)
+
+        if report.dropped:
+            logger.info(
+                "Dropped %d of %d chunks as near-duplicates (threshold %.2f): %s",
+                report.dropped_count,
+                report.input_count,
+                self.threshold,
+                [texts[index][:60] for index in list(report.dropped)[:5]],
+            )
+
+        return kept, report
@@ -0,0 +1,142 @@
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Sequence
+
+
+logger = logging.getLogger(__name__)
+
+
+DIGITS_PATTERN = re.compile(r"\d+")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+MARKDOWN_HEADING_PATTERN = re.compile(r"^\s*#{1,6}\s")
+
+DEFAULT_REPEATED_LINE_PAGE_FRACTION = 0.5
+DEFAULT_REPEATED_HEADING_PAGE_FRACTION = 0.9
+
+
+def normalize_line(line: str) -> str:
+    """Collapses whitespace, case and digit runs so "Page 12" and "page 13" compare equal."""
+    line = WHITESPACE_PATTERN.sub(" ", line).strip().casefold()
+    return DIGITS_PATTERN.sub("#", line)
+
+
+@dataclass
+class RepeatedLineReport:
+    page_count: int
+    # Representative line text -> number of pages it was removed from.
+    removed_lines: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def removed_occurrences(self) -> int:
+        return sum(self.removed_lines.values())
+
+
+class RepeatedLineStripper:
+    """Detects running headers, footers and watermarks by cross-page frequency.
+
+    A line is treated as boilerplate when, after normalizing page numbers out,
+    it appears on at least `min_page_fraction` of the pages. Lines are counted
+    by their normalized text in a single pass over the page texts; lines
+    without letters (table rules, math delimiters...) and very short lines are
+    never removed. Markdown headings carry the chapter and section structure,
+    so they are only removed when they repeat on `min_heading_page_fraction`
+    of the pages, like a running title the OCR rendered as a heading.
+    """
+
+    def __init__(
+        self,
+        min_page_fraction: float = DEFAULT_REPEATED_LINE_PAGE_FRACTION,
+        min_pages: int = 3,
+        min_line_length: int = 4,
+        min_heading_page_fraction: float = DEFAULT_REPEATED_HEADING_PAGE_FRACTION,
+    ):
+        if not 0 < min_page_fraction <= 1:
+            raise ValueError(f"min_page_fraction must be in (0, 1], got {min_page_fraction}")
+        if not 0 < min_heading_page_fraction <= 1:
+            raise ValueError(f"min_heading_page_fraction must be in (0, 1], got {min_heading_page_fraction}")
+
+        self.min_page_fraction = min_page_fraction
+        self.min_heading_page_fraction = max(min_heading_page_fraction, min_page_fraction)
+        self.min_pages = min_pages
+        self.min_line_length = min_line_length
+
+    def _line_key(self, line: str) -> str | None:
+        # The normalized text itself, not hash(): keys from `detect` are sent to
+        # worker processes, where str hashes differ under spawn or forkserver.
+        normalized = normalize_line(line)
+        if len(normalized) < self.min_line_length or not any(char.isalpha() for char in normalized):
+            return None
+        return normalized
+
+    def detect(self, pages: Sequence[str]) -> dict[str, str]:
+        """Returns the normalized repeated lines mapped to a representative line."""
+        page_counts: Counter[str] = Counter()
+        examples: dict[str, str] = {}
+        # Keys seen at least once as a plain line, not a heading.
+        plain_keys: set[str] = set()
+
+        for page in pages:
+            page_keys: set[str] = set()
+            for line in page.splitlines():
+                key = self._line_key(line)
+                if key is None:
+                    continue
+                # Checked on the raw line: normalizing turns a leading page number into "#".
+                if not MARKDOWN_HEADING_PATTERN.match(line):
+                    plain_keys.add(key)
+                if key in page_keys:
+                    continue
+                page_keys.add(key)
+                examples.setdefault(key, line.strip())
+            page_counts.update(page_keys)
+
+        threshold = max(self.min_pages, self.min_page_fraction * len(pages))
+        heading_threshold = max(self.min_pages, self.min_heading_page_fraction * len(pages))
+        return {
+            key: examples[key]
+            for key, count in page_counts.items()
+            if count >= (threshold if key in plain_keys else heading_threshold)
+        }
+
+    def remove(self, pages: Sequence[str], repeated: dict[str, str]) -> tuple[list[str], Counter[str]]:
+        """Removes lines detected as repeated; returns the pages and removals per representative line.
+
+        Pages are handled independently, so the pages can be processed in
+        separate runs (or processes) as long as `repeated` comes from `detect`
+        over the whole book.
+        """
+        removed: Counter[str] = Counter()
+        if not repeated:
+            return list(pages), removed
+
+        stripped_pages: list[str] = []
+        for page in pages:
+            kept_lines: list[str] = []
+            for line in page.splitlines(keepends=True):
+                key = self._line_key(line)
+                if key is not None and key in repeated:
+                    removed[repeated[key]] += 1
+                    continue
+                kept_lines.append(line)
+            stripped_pages.append("".join(kept_lines))
+
+        return stripped_pages, removed
+
+    def summarize(self, page_count: int, removed: Counter[str]) -> RepeatedLineReport:
+        report = RepeatedLineReport(page_count=page_count, removed_lines=dict(removed.most_common()))
+
+        if removed:
+            logger.warning(
+                "Removed %d repeated header/footer lines from %d pages: %s",
+                report.removed_occurrences,
+                report.page_count,
+                list(report.removed_lines),
+            )
+
+        return report
+
+    def strip(self, pages: Sequence[str]) -> tuple[list[str], RepeatedLineReport]:
+        stripped_pages, removed = self.remove(pages, self.detect(pages))
+        return stripped_pages, self.summarize(len(pages), removed)
@@ -0,0 +1,259 @@
+import logging
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Sequence
+
+from src.infrastructure.splitter.tokenizer import CachedTokenCounter, load_tokenizer
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_SEPARATORS = ("\n\n", "\n", " ", "")
+
+
+@dataclass(slots=True)
+class TextSpan:
+    """A chunk of text located by its source page index and character offsets.
+
+    `end` is an offset into `end_page`, which is only set (to a later page)
+    for spans merged across pages; otherwise it is an offset into `page`.
+    """
+
+    page: int
+    start: int
+    end: int
+    text: str
+    end_page: int | None = None
+
+    @property
+    def last_page(self) -> int:
+        return self.page if self.end_page is None else self.end_page
+
+
+class RecursiveTextSplitter:
+    """Streaming equivalent of LangChain's `RecursiveCharacterTextSplitter`.
+
+    Implements the same `chunk_size`, `chunk_overlap` and separator semantics
+    (with `keep_separator=False` and whitespace stripping), but works on
+    offsets into the page text instead of substrings. Chunks are sliced out of
+    the page once, and every chunk carries its (page, start, end) location.
+    """
+
+    def __init__(
+        self,
+        separators: Sequence[str] = DEFAULT_SEPARATORS,
+        chunk_size: int = 4000,
+        chunk_overlap: int = 200,
+        length_function: Callable[[str], int] | None = None,
+        strip_whitespace: bool = True,
+    ):
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be > 0, got {chunk_size}")
+        if chunk_overlap < 0:
+            raise ValueError(f"chunk_overlap must be >= 0, got {chunk_overlap}")
+        if chunk_overlap > chunk_size:
+            raise ValueError(
+                f"Got a larger chunk overlap ({chunk_overlap}) than chunk size ({chunk_size}), should be smaller."
+            )
+
+        self.separators = list(separators)
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.strip_whitespace = strip_whitespace
+        # None means plain character counts, taken straight from the offsets.
+        self._length_function = length_function
+        self._separator_patterns = {
+            separator: re.compile(re.escape(separator)) for separator in self.separators if separator
+        }
+
+    def split_text(self, text: str) -> list[TextSpan]:
+        return self._split_range(0, text, 0, len(text), self.separators)
+
+    def split_pages(self, pages: Iterable[str]) -> Iterator[TextSpan]:
+        for page_index, text in enumerate(pages):
+            yield from self._split_range(page_index, text, 0, len(text), self.separators)
+
+    def _length(self, text: str, start: int, end: int) -> int:
+        if self._length_function is None:
+            return end - start
+        return self._length_function(text[start:end])
+
+    def _separator_length(self, separator: str) -> int:
+        if self._length_function is None:
+            return len(separator)
+        return self._length_function(separator)
+
+    def _split_range(
+        self,
+        page: int,
+        text: str,
+        start: int,
+        end: int,
+        separators: list[str],
+    ) -> list[TextSpan]:
+        separator = separators[-1]
+        remaining_separators: list[str] = []
+
+        for index, candidate in enumerate(separators):
+            if not candidate:
+                separator = candidate
+                break
+            if self._separator_patterns[candidate].search(text, start, end):
+                separator = candidate
+                remaining_separators = separators[index + 1:]
+                break
+
+        pieces = self._split_pieces(text, start, end, separator)
+
+        spans: list[TextSpan] = []
+        good_pieces: list[tuple[int, int]] = []
+        good_lengths: list[int] = []
+
+        for piece_start, piece_end in pieces:
+            piece_length = self._length(text, piece_start, piece_end)
+
+            if piece_length < self.chunk_size:
+                good_pieces.append((piece_start, piece_end))
+                good_lengths.append(piece_length)
+                continue
+
+            if good_pieces:
+                spans.extend(self._merge_pieces(page, text, good_pieces, good_lengths, separator))
+                good_pieces = []
+                good_lengths = []
+
+            if not remaining_separators:
+                spans.append(TextSpan(page, piece_start, piece_end, text[piece_start:piece_end]))
+            else:
+                spans.extend(self._split_range(page, text, piece_start, piece_end, remaining_separators))
+
+        if good_pieces:
+            spans.extend(self._merge_pieces(page, text, good_pieces, good_lengths, separator))
+
+        return spans
+
+    def _split_pieces(self, text: str, start: int, end: int, separator: str) -> list[tuple[int, int]]:
+        if not separator:
+            return [(position, position + 1) for position in range(start, end)]
+
+        pieces: list[tuple[int, int]] = []
+        position = start
+        for match in self._separator_patterns[separator].finditer(text, start, end):
+            if match.start() > position:
+                pieces.append((position, match.start()))
+            position = match.end()
+
+        if end > position:
+            pieces.append((position, end))
+
+        return pieces
+
+    def _merge_pieces(
+        self,
+        page: int,
+        text: str,
+        pieces: list[tuple[int, int]],
+        lengths: list[int],
+        separator: str,
+    ) -> list[TextSpan]:
+        separator_length = self._separator_length(separator)
+
+        spans: list[TextSpan] = []
+        # The current chunk is pieces[head:index].
+        head = 0
+        total = 0
+
+        for index, piece_length in enumerate(lengths):
+            current_count = index - head
+
+            if total + piece_length + (separator_length if current_count > 0 else 0) > self.chunk_size:
+                if total > self.chunk_size:
+                    logger.warning(
+                        "Created a chunk of size %d, which is longer than the specified %d",
+                        total,
+                        self.chunk_size,
+                    )
+
+                if current_count > 0:
+                    span = self._join_pieces(page, text, pieces, head, index, separator)
+                    if span is not None:
+                        spans.append(span)
+
+                    while total > self.chunk_overlap or (
+                        total + piece_length + (separator_length if index - head > 0 else 0) > self.chunk_size
+                        and total > 0
+                    ):
+                        total -= lengths[head] + (separator_length if index - head > 1 else 0)
+                        head += 1
+
+            total += piece_length + (separator_length if index + 1 - head > 1 else 0)
+
+        span = self._join_pieces(page, text, pieces, head, len(pieces), separator)
+        if span is not None:
+            spans.append(span)
+
+        return spans
+
+    def _join_pieces(
+        self,
+        page: int,
+        text: str,
+        pieces: list[tuple[int, int]],
+        first: int,
+        last: int,
+        separator: str,
+    ) -> TextSpan | None:
+        if first >= last:
+            return None
+
+        start = pieces[first][0]
+        end = pieces[last - 1][1]
+        separator_length = len(separator)
+
+        contiguous = all(
+            pieces[index + 1][0] - pieces[index][1] == separator_length for index in range(first, last - 1)
+        )
+
+        if contiguous:
+            # Pieces separated by exactly one separator: the chunk is a plain slice.
+            chunk_text = text[start:end]
+        else:
+            # Runs of separators between pieces collapse to one, as in LangChain.
+            chunk_text = separator.join(text[piece_start:piece_end] for piece_start, piece_end in pieces[first:last])
+
+        if self.strip_whitespace:
+            if contiguous:
+                stripped_text = chunk_text.strip()
+                start += len(chunk_text) - len(chunk_text.lstrip())
+                end = start + len(stripped_text)
+            else:
+                source = text[start:end]
+                end = start + len(source.rstrip())
+                start += len(source) - len(source.lstrip())
+                stripped_text = chunk_text.strip()
+            chunk_text = stripped_text
+
+        if not chunk_text:
+            return None
+
+        return TextSpan(page, start, end, chunk_text)
+
+
+def create_text_splitter(
+    chunk_size: int,
+    chunk_overlap: int,
+    tokenizer_path: str | None = None,
+    separators: Sequence[str] = DEFAULT_SEPARATORS,
+) -> RecursiveTextSplitter:
+    """Builds a splitter measuring sizes in characters, or in tokens when a tokenizer file is given."""
+    length_function = None
+    if tokenizer_path:
+        length_function = CachedTokenCounter(load_tokenizer(tokenizer_path))
+
+    return RecursiveTextSplitter(
+        separators=separators,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=length_function,
+    )
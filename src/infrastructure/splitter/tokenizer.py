@@ -0,0 +1,56 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Protocol
+
+
+class Tokenizer(Protocol):
+    def count_tokens(self, text: str) -> int:
+        ...
+
+
+class HuggingFaceTokenizer:
+    """Counts tokens with a `tokenizer.json` file loaded from disk (no network access)."""
+
+    def __init__(self, path: Path):
+        try:
+            from tokenizers import Tokenizer as _Tokenizer
+        except ImportError as exc:
+            raise ImportError(
+                "Token-based chunk sizing needs the 'tokenizers' package. Install it with `pip install tokenizers`."
+            ) from exc
+
+        self.path = Path(path)
+        self._tokenizer = _Tokenizer.from_file(str(self.path))
+
+    def count_tokens(self, text: str) -> int:
+        return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+class CachedTokenCounter:
+    """Memoizes token counts so repeated pieces and separators are tokenized once."""
+
+    def __init__(self, tokenizer: Tokenizer, max_entries: int = 2**16):
+        self.tokenizer = tokenizer
+        self._count = lru_cache(maxsize=max_entries)(tokenizer.count_tokens)
+
+    def __call__(self, text: str) -> int:
+        return self._count(text)
+
+    def cache_info(self):
+        return self._count.cache_info()
+
+
+def load_tokenizer(path: str | Path) -> Tokenizer:
+    """Loads a local tokenizer from a `tokenizer.json` file or a directory containing one."""
+    resolved_path = Path(path)
+
+    if resolved_path.is_dir():
+        resolved_path = resolved_path / "tokenizer.json"
+
+    if not resolved_path.is_file():
+        raise FileNotFoundError(f"Tokenizer file not found: {resolved_path}")
+
+    if resolved_path.suffix != ".json":
+        raise ValueError(f"Unsupported tokenizer file '{resolved_path.name}'. Expected a tokenizer.json file.")
+
+    return HuggingFaceTokenizer(resolved_path)
@@ -1,14 +1,9 @@
 import logging
 from pathlib import Path
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
-from pypdf import PdfReader
 from pydantic import SecretStr
-from together import Together
 
-from src.config.settings import settings
+from src.config.settings import get_settings
 from src.domain.entities.table_of_contents import (
     TableOfContents,
     TableOfContentsParserConfig,
@@ -35,6 +30,8 @@ def get_raw_page_text(pdf_path: Path, toc_page_number: int | list[int]):
         str: Extracted text from the specified page(s).
     """
 
+    from pypdf import PdfReader
+
     reader = PdfReader(pdf_path)
 
     if isinstance(toc_page_number, int):
@@ -67,6 +64,8 @@ def get_table_of_contents(
         logging.warning("Table of contents parsing disabled; no table of contents will be obtained from the book.")
         return TableOfContents(chapters=[])
 
+    from langchain_core.messages import HumanMessage, SystemMessage
+
     toc = get_raw_page_text(pdf_path, toc_page_number)
     messages = [
         SystemMessage(content=toc_system_prompt),
@@ -87,9 +86,12 @@ def _select_structured_toc_llm(parser_config: TableOfContentsParserConfig):
 
 
 def _get_structured_toc_llm_gemini():
+    settings = get_settings()
     if not settings.GOOGLE_AI_API_KEY:
         raise ValueError("GOOGLE_AI_API_KEY is not configured.")
 
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
     llm = ChatGoogleGenerativeAI(
         model="gemini-2.5-flash",
         temperature=0,
@@ -99,9 +101,13 @@ def _get_structured_toc_llm_gemini():
 
 
 def _get_structured_toc_llm_together():
+    settings = get_settings()
     if not settings.TOGETHER_AI_API_KEY:
         raise ValueError("TOGETHER_AI_API_KEY is not configured.")
 
+    from langchain_core.messages import HumanMessage, SystemMessage
+    from together import Together
+
     class _TogetherStructuredTOC:
         def __init__(self):
             self.client = Together(api_key=settings.TOGETHER_AI_API_KEY)
@@ -143,6 +149,8 @@ def _get_structured_toc_llm_ollama(parser_config: TableOfContentsParserConfig):
         else "ollama"
     )
 
+    from langchain_openai import ChatOpenAI
+
     llm = ChatOpenAI(
         api_key=SecretStr(api_key),
         model=model_name,
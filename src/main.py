@@ -10,6 +10,7 @@ from src.application.pipeline_runner import (
     run_pipeline,
     write_output,
 )
+from src.domain.entities.book import OutputCompression, OutputFormat
 from src.domain.entities.chunker import ChunkerType, EmbedderProvider
 
 
@@ -23,8 +24,10 @@ def main() -> None:
         choices=[
             ChunkerType.LANGCHAIN,
             ChunkerType.MATHEMATICAL,
+            ChunkerType.SEMANTIC,
+            ChunkerType.MARKDOWN,
         ],
-        help="Specify which chunker to use (langchain or mathematical).",
+        help="Specify which chunker to use (langchain, mathematical, semantic or markdown).",
     )
     parser.add_argument(
         "--input_dir",
@@ -76,6 +79,85 @@ def main() -> None:
         required=False,
         help="Batch size of chunked pages when using the LLM chunker.",
     )
+    parser.add_argument(
+        "--tokenizer_path",
+        type=str,
+        default=None,
+        required=False,
+        help="Local tokenizer.json (or directory containing it). When set, chunk sizes are measured in tokens.",
+    )
+    parser.add_argument(
+        "--chunk_size",
+        type=int,
+        default=None,
+        required=False,
+        help="Override the chunker's default chunk size (characters, or tokens with --tokenizer_path).",
+    )
+    parser.add_argument(
+        "--chunk_overlap",
+        type=int,
+        default=None,
+        required=False,
+        help="Override the chunker's default chunk overlap (characters, or tokens with --tokenizer_path).",
+    )
+    parser.add_argument(
+        "--max_merged_chunk_size",
+        type=int,
+        default=None,
+        required=False,
+        help="Characters after which the mathematical chunker force-splits an unbalanced <math> block.",
+    )
+    parser.add_argument(
+        "--near_duplicate_threshold",
+        type=float,
+        default=None,
+        required=False,
+        help="Drop chunks whose estimated Jaccard similarity to an earlier chunk reaches this value (e.g. 0.85).",
+    )
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=None,
+        required=False,
+        help="Clean and split chapters in this many worker processes (langchain and mathematical chunkers).",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse embeddings from the existing output file for unchanged chunks and report what changed.",
+    )
+    parser.add_argument(
+        "--pretty_output",
+        action="store_true",
+        help="Write indented JSON instead of the compact default.",
+    )
+    parser.add_argument(
+        "--output_format",
+        type=OutputFormat,
+        default=OutputFormat.JSON,
+        required=False,
+        choices=[
+            OutputFormat.JSON,
+            OutputFormat.PARQUET,
+            OutputFormat.SHARDED,
+        ],
+        help=(
+            "Write a JSON file, a Parquet chunk table plus a JSON metadata sidecar, "
+            "or one JSON Lines file per chapter plus a manifest (json, parquet or sharded)."
+        ),
+    )
+    parser.add_argument(
+        "--output_compression",
+        type=OutputCompression,
+        default=OutputCompression.NONE,
+        required=False,
+        choices=[
+            OutputCompression.NONE,
+            OutputCompression.GZIP,
+            OutputCompression.ZSTD,
+        ],
+        help="Compress the JSON output or shards, appending .gz or .zst to their names (none, gzip or zstd).",
+    )
 
     args = parser.parse_args()
 
@@ -94,10 +176,26 @@ def main() -> None:
         embedding_model_name=args.embedding_model,
         embedding_provider=args.embedding_provider,
         page_batch_size=args.page_batch_size,
+        tokenizer_path=args.tokenizer_path,
+        chunk_size=args.chunk_size,
+        chunk_overlap=args.chunk_overlap,
+        max_merged_chunk_size=args.max_merged_chunk_size,
+        near_duplicate_threshold=args.near_duplicate_threshold,
+        max_workers=args.max_workers,
+        incremental=args.incremental,
+        pretty_output=args.pretty_output,
+        output_format=args.output_format,
+        output_compression=args.output_compression,
     )
 
     output_payload = run_pipeline(config)
-    write_output(config.output_path, output_payload)
+    write_output(
+        config.output_path,
+        output_payload,
+        pretty=config.pretty_output,
+        output_format=config.output_format,
+        compression=config.output_compression,
+    )
 
 
 if __name__ == "__main__":
@@ -2,6 +2,8 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+
 
 os.environ.setdefault("INPUT_BOOKS_PATH", "/tmp")
 os.environ.setdefault("OUTPUT_BOOKS_PATH", "/tmp")
@@ -9,3 +11,50 @@ os.environ.setdefault("OUTPUT_BOOKS_PATH", "/tmp")
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.domain.entities.chunk import Chunk, ChunkRecord  # noqa: E402
+
+
+def _build_payload(
+    chunk_count: int = 10,
+    *,
+    chapters: dict[int, list[str]] | None = None,
+    model: bool = False,
+) -> dict:
+    """A pipeline payload with every section the writers handle.
+
+    Chunk `index` reads "Seli {index} — ñ" and sits on page 3 + index // 2 of
+    chapter 1 + index // 4; `chapters` gives the chapter numbers and texts
+    instead. Chunks are `ChunkRecord`s, or `Chunk` models with `model`.
+    """
+    if chapters is None:
+        chapters = {}
+        for index in range(chunk_count):
+            chapters.setdefault(1 + index // 4, []).append(f"Seli {index} — ñ")
+
+    chunk_type = Chunk if model else ChunkRecord
+    positions = [(chapter, text) for chapter, texts in chapters.items() for text in texts]
+    return {
+        "resource": {"name": "Biolojia", "authors": ["Taasisi ya Elimu"]},
+        "class": {"name": "Form 2"},
+        "subject": {"name": "Biology"},
+        "table_of_contents": {"chapters": [{"name": "Seli", "number": 1, "start_page": 3}]},
+        "chunker_config": {"chunker_type": "langchain", "embedding_model_name": "e5"},
+        "chunks": [
+            chunk_type(
+                content=text,
+                embedding=[float(index), 0.25, -1.0],
+                page_number=3 + index // 2,
+                chapter_number=chapter,
+                section_title="Muundo" if index % 2 else None,
+            )
+            for index, (chapter, text) in enumerate(positions)
+        ],
+        "changes": {"added": ["a"], "removed": [], "unchanged": 0},
+    }
+
+
+@pytest.fixture
+def make_payload():
+    """Factory for the payloads written by the output tests, see `_build_payload`."""
+    return _build_payload
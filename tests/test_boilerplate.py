@@ -0,0 +1,33 @@
+from src.infrastructure.preprocessing.boilerplate import (
+    DEFAULT_BOILERPLATE_PATTERNS,
+    BoilerplateStripper,
+)
+
+
+def test_strip_removes_default_watermarks() -> None:
+    stripper = BoilerplateStripper()
+
+    text = "FOR ONLINE USE ONLY\nPhotosynthesis happens in leaves.DO NOT DUPLICATE"
+
+    assert stripper.strip(text) == "\nPhotosynthesis happens in leaves."
+
+
+def test_strip_applies_book_specific_patterns_with_defaults() -> None:
+    stripper = BoilerplateStripper(["Geography for Secondary Schools", "Student’s Book Form Two"])
+
+    text = "Geography for Secondary Schools Student’s Book Form Two\nRivers erode. For Online Use Only"
+
+    assert stripper.strip(text) == " \nRivers erode. "
+    assert set(DEFAULT_BOILERPLATE_PATTERNS) <= set(stripper.patterns)
+
+
+def test_longer_pattern_wins_over_its_prefix() -> None:
+    stripper = BoilerplateStripper(["Form Two", "Form Two Edition"])
+
+    assert stripper.strip("Form Two Edition text") == " text"
+
+
+def test_special_characters_are_matched_literally() -> None:
+    stripper = BoilerplateStripper(["(c) 2020 TIE.*"])
+
+    assert stripper.strip("a(c) 2020 TIE.*b (c) 2020 TIEXX") == "ab (c) 2020 TIEXX"
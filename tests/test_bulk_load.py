@@ -0,0 +1,137 @@
+import asyncio
+import struct
+
+import numpy as np
+import pytest
+
+from scripts.bulk_load import (
+    CHUNK_COLUMNS,
+    HnswIndex,
+    add_content_hash_column,
+    build_index,
+    content_hash,
+    copy_chunks,
+    decode_vector,
+    encode_vector,
+    stage_chunks,
+    sync_chunks,
+)
+from src.domain.entities.chunk import compute_content_hash
+
+
+class RecordingConnection:
+    def __init__(self, fetched=None):
+        self.copies = []
+        self.statements = []
+        self.fetched = fetched
+
+    async def fetchval(self, statement, *args):
+        return self.fetched
+
+    async def execute(self, statement, *args):
+        self.statements.append((" ".join(statement.split()), args))
+        if statement.lstrip().startswith("DELETE"):
+            return "DELETE 2"
+        if statement.lstrip().startswith("INSERT"):
+            return "INSERT 0 1"
+        return "OK"
+
+    async def copy_records_to_table(self, table_name, *, records, columns):
+        self.copies.append((table_name, list(records), columns))
+
+
+def test_encode_vector_uses_pgvector_binary_layout() -> None:
+    data = encode_vector([1.0, -2.5, 0.25])
+
+    assert struct.unpack(">HH", data[:4]) == (3, 0)
+    assert struct.unpack(">3f", data[4:]) == (1.0, -2.5, 0.25)
+    np.testing.assert_array_equal(decode_vector(data), np.asarray([1.0, -2.5, 0.25], dtype=np.float32))
+
+
+def test_copy_chunks_streams_rows_in_batches() -> None:
+    connection = RecordingConnection()
+    rows = ((1, f"chunk {index}", index, "TEXT", [0.0], "1", "Intro", str(index)) for index in range(7))
+
+    copied = asyncio.run(copy_chunks(connection, rows, batch_size=3, total=7))
+
+    assert copied == 7
+    assert [len(records) for _, records, _ in connection.copies] == [3, 3, 1]
+    assert all(table == "chunks" and columns == CHUNK_COLUMNS for table, _, columns in connection.copies)
+    assert connection.copies[2][1][0][1] == "chunk 6"
+
+
+def test_build_index_applies_settings_before_create() -> None:
+    connection = RecordingConnection()
+    index = HnswIndex(m=24, ef_construction=128, maintenance_work_mem="2GB", parallel_workers=4)
+
+    asyncio.run(build_index(connection, index))
+
+    assert [statement for statement, _ in connection.statements] == [
+        "SET maintenance_work_mem = '2GB'",
+        "SET max_parallel_maintenance_workers = 4",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS chunk_embedding_idx ON chunks "
+        "USING hnsw (embedding vector_cosine_ops) WITH (m = 24, ef_construction = 128)",
+        "RESET maintenance_work_mem",
+        "RESET max_parallel_maintenance_workers",
+    ]
+
+
+def test_build_index_drops_an_invalid_index_left_by_a_failed_build() -> None:
+    connection = RecordingConnection(fetched=False)
+
+    asyncio.run(build_index(connection, HnswIndex()))
+
+    statements = [statement for statement, _ in connection.statements]
+    assert statements[0] == "DROP INDEX IF EXISTS chunk_embedding_idx"
+    assert statements[1].startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS chunk_embedding_idx")
+
+
+def test_default_index_matches_model_and_rejects_bad_memory_setting() -> None:
+    assert HnswIndex().settings_sql() == []
+    assert "WITH (m = 16, ef_construction = 64)" in HnswIndex().create_sql()
+    with pytest.raises(ValueError):
+        HnswIndex(maintenance_work_mem="2GB'; DROP TABLE chunks; --")
+
+
+def test_content_hash_matches_the_pipeline() -> None:
+    assert content_hash("Seli — ñ") == compute_content_hash("Seli — ñ")
+
+
+def test_sync_chunks_stages_rows_then_deletes_and_inserts_by_hash() -> None:
+    connection = RecordingConnection()
+    rows = [(5, text, 1, "TEXT", [0.0], "1", None, content_hash(text)) for text in ["Seli", "Tishu", "Viungo"]]
+
+    counts = asyncio.run(sync_chunks(connection, rows, resource_id=5))
+
+    assert counts == (1, 2, 2)
+    assert [table for table, _, _ in connection.copies] == ["chunks_staging"]
+    create, delete, insert = connection.statements
+    assert create[0].startswith("CREATE TEMP TABLE chunks_staging ON COMMIT DROP")
+    assert delete[0].startswith("DELETE FROM chunks") and delete[1] == (5,)
+    assert insert[0].startswith("INSERT INTO chunks") and insert[1] == (5,)
+    # Repeated texts are matched copy by copy, not collapsed into one row.
+    assert "row_number() OVER (PARTITION BY content_hash" in insert[0]
+    assert "s.copies >= c.copy" in delete[0]
+
+
+@pytest.mark.parametrize(("has_column", "statements"), [(True, 0), (False, 2)])
+def test_add_content_hash_column_only_alters_an_old_table(has_column: bool, statements: int) -> None:
+    connection = RecordingConnection(fetched=has_column)
+
+    added = asyncio.run(add_content_hash_column(connection))
+
+    assert added is not has_column
+    assert len(connection.statements) == statements
+
+
+def test_stage_chunks_copies_into_staging_then_inserts_once() -> None:
+    connection = RecordingConnection()
+    rows = [(5, text, 1, "TEXT", [0.0], "1", None, content_hash(text)) for text in ["Seli", "Tishu", "Viungo"]]
+
+    staged = asyncio.run(stage_chunks(connection, rows, batch_size=2))
+
+    assert staged == 3
+    assert [table for table, _, _ in connection.copies] == ["chunks_staging", "chunks_staging"]
+    create, insert = (statement for statement, _ in connection.statements)
+    assert create.startswith("CREATE TEMP TABLE chunks_staging ON COMMIT DROP")
+    assert insert.startswith("INSERT INTO chunks (") and insert.endswith("FROM chunks_staging")
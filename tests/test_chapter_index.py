@@ -0,0 +1,54 @@
+import random
+
+from src.domain.entities.table_of_contents import Chapter, ChapterIndex, TableOfContents
+
+
+def _linear_scan_chapter(doc_page: int, text_initial_page: int, table_of_contents: TableOfContents) -> int:
+    doc_chapter = 0
+    for chapter in table_of_contents.chapters:
+        if doc_page < chapter.start_page + text_initial_page - 1:
+            break
+        doc_chapter = chapter.number
+    return doc_chapter
+
+
+def _toc(start_pages: list[int]) -> TableOfContents:
+    return TableOfContents(
+        chapters=[
+            Chapter(name=f"Chapter {number}", number=number, start_page=start_page)
+            for number, start_page in enumerate(start_pages, start=1)
+        ]
+    )
+
+
+def test_chapter_for_page_uses_shifted_boundaries() -> None:
+    index = ChapterIndex(_toc([1, 10, 25]), text_initial_page=5)
+
+    assert index.first_chapter_page == 5
+    assert index.chapter_for_page(4) == 0
+    assert index.chapter_for_page(5) == 1
+    assert index.chapter_for_page(13) == 1
+    assert index.chapter_for_page(14) == 2
+    assert index.chapter_for_page(29) == 3
+    assert index.chapter_for_page(500) == 3
+
+
+def test_empty_table_of_contents_maps_everything_to_chapter_zero() -> None:
+    index = ChapterIndex(TableOfContents(chapters=[]), text_initial_page=3)
+
+    assert index.first_chapter_page is None
+    assert index.chapter_for_page(1) == 0
+    assert ChapterIndex(None, text_initial_page=3).chapter_for_page(10) == 0
+
+
+def test_chapter_for_page_matches_linear_scan_on_unsorted_tables() -> None:
+    rng = random.Random(1234)
+
+    for _ in range(200):
+        start_pages = [rng.randint(1, 120) for _ in range(rng.randint(1, 12))]
+        text_initial_page = rng.randint(1, 15)
+        toc = _toc(start_pages)
+        index = ChapterIndex(toc, text_initial_page)
+
+        for page in range(0, 140):
+            assert index.chapter_for_page(page) == _linear_scan_chapter(page, text_initial_page, toc)
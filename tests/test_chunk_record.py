@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+from src.domain.entities.chunk import Chunk, ChunkRecord
+from src.infrastructure.output.json_writer import StreamingJsonWriter
+
+
+FIELDS = {
+    "content": "Seli ni kitengo cha msingi cha uhai.",
+    "embedding": [0.25, -1.0, 3.5],
+    "page_number": 4,
+    "chapter_number": 1,
+    "section_title": "Muundo wa seli",
+}
+
+
+def _record() -> ChunkRecord:
+    return ChunkRecord(**FIELDS)
+
+
+def test_record_matches_the_pydantic_model() -> None:
+    record = _record()
+    model = Chunk(**FIELDS)
+
+    assert isinstance(model, Chunk)
+    assert record.to_dict() == model.model_dump()
+    assert list(record.to_dict()) == list(model.model_dump())
+    assert record.content_hash == model.content_hash
+
+
+def test_record_keeps_the_embedding_by_reference() -> None:
+    embedding = [0.5] * 1024
+    record = ChunkRecord(content="x", embedding=embedding, page_number=1, chapter_number=1)
+
+    assert record.embedding is embedding
+    assert not hasattr(record, "__dict__")
+
+
+def test_records_and_models_write_the_same_json(tmp_path: Path) -> None:
+    outputs = []
+    for index, chunk in enumerate([_record(), Chunk(**FIELDS)]):
+        output_path = tmp_path / f"book_{index}.json"
+        with StreamingJsonWriter(output_path, backend="json") as writer:
+            writer.write_chunks([chunk])
+        outputs.append(json.loads(output_path.read_text(encoding="utf-8")))
+
+    assert outputs[0] == outputs[1]
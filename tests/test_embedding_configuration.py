@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from src.application.pipeline_runner import (
     DEFAULT_EMBEDDING_MODEL,
     DEFAULT_EMBEDDING_PROVIDER,
@@ -85,3 +87,50 @@ def test_build_book_config_defaults_toc_parser_to_ollama_for_ollama_provider(tmp
     )
 
     assert output.table_of_contents_parser.parser_type == TableOfContentsParserType.OLLAMA
+
+
+def test_build_book_config_reads_boilerplate_patterns(tmp_path: Path) -> None:
+    info_path = tmp_path / "info.yaml"
+    _write_info_yaml(info_path)
+    info_path.write_text(
+        info_path.read_text(encoding="utf-8")
+        + '\n  boilerplate_patterns:\n    - "Biology for Secondary Schools"\n',
+        encoding="utf-8",
+    )
+
+    output = build_book_config(
+        info_path=info_path,
+        input_path=tmp_path / "input.pdf",
+        output_path=tmp_path / "output.json",
+        chunker_type=ChunkerType.LANGCHAIN,
+    )
+
+    assert output.chunker_config.boilerplate_patterns == ["Biology for Secondary Schools"]
+
+
+def test_build_book_config_rejects_overlap_not_smaller_than_chunk_size(tmp_path: Path) -> None:
+    info_path = tmp_path / "info.yaml"
+    _write_info_yaml(info_path)
+
+    with pytest.raises(ValueError, match="chunk_overlap"):
+        build_book_config(
+            info_path=info_path,
+            input_path=tmp_path / "input.pdf",
+            output_path=tmp_path / "output.json",
+            chunker_type=ChunkerType.MATHEMATICAL,
+            chunk_size=100,
+            chunk_overlap=100,
+        )
+
+
+def test_build_book_config_strips_repeated_lines_only_when_enabled(tmp_path: Path) -> None:
+    info_path = tmp_path / "info.yaml"
+    _write_info_yaml(info_path)
+    options = dict(input_path=tmp_path / "input.pdf", output_path=tmp_path / "output.json", chunker_type=ChunkerType.LANGCHAIN)
+
+    assert build_book_config(info_path=info_path, **options).chunker_config.repeated_line_page_fraction is None
+
+    info_path.write_text(
+        info_path.read_text(encoding="utf-8") + "\n  repeated_line_page_fraction: true\n", encoding="utf-8"
+    )
+    assert build_book_config(info_path=info_path, **options).chunker_config.repeated_line_page_fraction == 0.5
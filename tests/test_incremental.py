@@ -0,0 +1,142 @@
+from pathlib import Path
+
+import pytest
+
+from src.application import pipeline_runner
+from src.domain.entities.book import OutputCompression, OutputFormat
+from src.domain.entities.chunk import ChunkRecord, compute_content_hash
+from src.domain.entities.chunker import Chunker, ChunkerType
+from src.infrastructure.embedder.embedding_router import get_embeddings
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+class _FakeChunker(Chunker):
+    texts: list[str] = []
+
+    def chunk(self, book_path, table_of_contents, text_initial_page) -> list[ChunkRecord]:
+        embeddings = get_embeddings(self.texts, reusable=self.reusable_embeddings)
+        return [
+            ChunkRecord(content=text, embedding=embedding, page_number=1, chapter_number=1)
+            for text, embedding in zip(self.texts, embeddings)
+        ]
+
+
+def _config(tmp_path: Path, incremental: bool, **output_options):
+    info_path = tmp_path / "info.yaml"
+    info_path.write_text(
+        "resource: {name: Book}\nclass: {name: Form 1}\nsubject: {name: Biology}\n"
+        "book_config: {table_of_contents_page_number: 3, first_page_number: 1, table_of_contents_parser: none}\n"
+    )
+    return pipeline_runner.build_book_config(
+        info_path,
+        tmp_path / "book.pdf",
+        tmp_path / "out.json",
+        chunker_type=ChunkerType.LANGCHAIN,
+        incremental=incremental,
+        **output_options,
+    )
+
+
+def _patch(monkeypatch, client: _RecordingClient, texts: list[str]) -> None:
+    monkeypatch.setattr("src.infrastructure.embedder.embedding_router.get_embedding_client", lambda **kwargs: client)
+    monkeypatch.setattr(_FakeChunker, "texts", texts)
+    monkeypatch.setattr(
+        pipeline_runner.ChunkerFactory,
+        "get_chunker",
+        lambda self: _FakeChunker(self.config),
+    )
+
+
+def test_get_embeddings_only_embeds_texts_without_stored_vectors(monkeypatch) -> None:
+    client = _RecordingClient()
+    monkeypatch.setattr("src.infrastructure.embedder.embedding_router.get_embedding_client", lambda **kwargs: client)
+
+    embeddings = get_embeddings(["kept", "new text"], reusable={compute_content_hash("kept"): [9.0]})
+
+    assert embeddings == [[9.0], [8.0]]
+    assert client.calls == [["new text"]]
+
+
+@pytest.mark.parametrize(
+    "output_options",
+    [
+        {},
+        {"output_compression": OutputCompression.GZIP},
+        {"output_format": OutputFormat.SHARDED},
+        {"output_format": OutputFormat.PARQUET},
+    ],
+)
+def test_incremental_run_reuses_vectors_and_reports_changes(monkeypatch, tmp_path: Path, output_options: dict) -> None:
+    if output_options.get("output_format") == OutputFormat.PARQUET:
+        pytest.importorskip("pyarrow")
+    client = _RecordingClient()
+    _patch(monkeypatch, client, ["alpha", "beta", "gamma"])
+    first_payload = pipeline_runner.run_pipeline(_config(tmp_path, incremental=False))
+    pipeline_runner.write_output(
+        tmp_path / "out.json",
+        first_payload,
+        output_format=output_options.get("output_format", OutputFormat.JSON),
+        compression=output_options.get("output_compression", OutputCompression.NONE),
+    )
+
+    assert "changes" not in first_payload
+    assert first_payload["chunks"][0].content_hash == compute_content_hash("alpha")
+
+    client.calls.clear()
+    _patch(monkeypatch, client, ["alpha", "beta v2", "gamma"])
+    payload = pipeline_runner.run_pipeline(_config(tmp_path, incremental=True, **output_options))
+
+    assert client.calls == [["beta v2"]]
+    assert [chunk.embedding for chunk in payload["chunks"]] == [[5.0], [7.0], [5.0]]
+    assert payload["changes"] == {
+        "added": [compute_content_hash("beta v2")],
+        "removed": [compute_content_hash("beta")],
+        "unchanged": 2,
+    }
+
+
+def test_incremental_run_re_embeds_everything_after_a_model_change(monkeypatch, tmp_path: Path) -> None:
+    client = _RecordingClient()
+    _patch(monkeypatch, client, ["alpha"])
+    payload = pipeline_runner.run_pipeline(_config(tmp_path, incremental=False))
+    payload["chunker_config"]["embedding_model_name"] = "another-model"
+    pipeline_runner.write_output(tmp_path / "out.json", payload)
+
+    client.calls.clear()
+    pipeline_runner.run_pipeline(_config(tmp_path, incremental=True))
+
+    assert client.calls == [["alpha"]]
+
+
+class _SentenceChunker(_FakeChunker):
+    def chunk(self, book_path, table_of_contents, text_initial_page) -> list[ChunkRecord]:
+        sentences = [f"{text} sentence" for text in self.texts]
+        self.sentence_embeddings = {
+            compute_content_hash(sentence): embedding
+            for sentence, embedding in zip(sentences, get_embeddings(sentences, reusable=self.reusable_embeddings))
+        }
+        return super().chunk(book_path, table_of_contents, text_initial_page)
+
+
+def test_incremental_run_reuses_sentence_vectors(monkeypatch, tmp_path: Path) -> None:
+    client = _RecordingClient()
+    _patch(monkeypatch, client, ["alpha", "beta"])
+    monkeypatch.setattr(pipeline_runner.ChunkerFactory, "get_chunker", lambda self: _SentenceChunker(self.config))
+    pipeline_runner.write_output(tmp_path / "out.json", pipeline_runner.run_pipeline(_config(tmp_path, incremental=False)))
+
+    assert pipeline_runner.sentence_embeddings_path(tmp_path / "out.json").exists()
+
+    client.calls.clear()
+    _patch(monkeypatch, client, ["alpha", "beta v2"])
+    monkeypatch.setattr(pipeline_runner.ChunkerFactory, "get_chunker", lambda self: _SentenceChunker(self.config))
+    pipeline_runner.run_pipeline(_config(tmp_path, incremental=True))
+
+    assert client.calls == [["beta v2 sentence"], ["beta v2"]]
@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.domain.entities.book import OutputCompression
+from src.infrastructure.output.json_writer import (
+    StreamingJsonWriter,
+    compressed_output_path,
+    read_json_output,
+)
+
+
+def _dumped(payload: dict) -> dict:
+    return {**payload, "chunks": [chunk.model_dump() for chunk in payload["chunks"]]}
+
+
+@pytest.mark.parametrize("chunk_count", [0, 1, 3])
+def test_pretty_output_matches_json_dump(tmp_path: Path, chunk_count: int, make_payload) -> None:
+    payload = make_payload(chunk_count, model=True)
+    output_path = tmp_path / "book.json"
+
+    with StreamingJsonWriter(output_path, indent=4, backend="auto") as writer:
+        writer.write_payload(payload)
+
+    assert output_path.read_text(encoding="utf-8") == json.dumps(_dumped(payload), ensure_ascii=False, indent=4)
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_compact_output_round_trips_and_streams_generators(tmp_path: Path, backend: str, make_payload) -> None:
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    payload = make_payload(3, model=True)
+    output_path = tmp_path / "nested" / "book.json"
+
+    with StreamingJsonWriter(output_path, backend=backend) as writer:
+        writer.write_payload({**payload, "chunks": (chunk for chunk in payload["chunks"])})
+
+    text = output_path.read_text(encoding="utf-8")
+    assert "\n" not in text
+    assert json.loads(text) == _dumped(payload)
+    assert list(json.loads(text)) == ["resource", "class", "subject", "table_of_contents", "chunker_config", "chunks", "changes"]
+
+
+def test_failed_write_keeps_previous_output(tmp_path: Path, make_payload) -> None:
+    output_path = tmp_path / "book.json"
+    output_path.write_text("previous")
+
+    def failing_chunks():
+        yield make_payload(1, model=True)["chunks"][0]
+        raise RuntimeError("embedding failed")
+
+    with pytest.raises(RuntimeError):
+        with StreamingJsonWriter(output_path) as writer:
+            writer.write_chunks(failing_chunks())
+
+    assert output_path.read_text() == "previous"
+    assert list(tmp_path.iterdir()) == [output_path]
+
+
+@pytest.mark.parametrize("compression", [OutputCompression.GZIP, OutputCompression.ZSTD])
+def test_compressed_output_round_trips(tmp_path: Path, compression: OutputCompression, make_payload) -> None:
+    if compression == OutputCompression.ZSTD:
+        pytest.importorskip("zstandard")
+    payload = make_payload(3, model=True)
+    output_path = compressed_output_path(tmp_path / "book.json", compression)
+
+    with StreamingJsonWriter(output_path, compression=compression) as writer:
+        writer.write_payload(payload)
+
+    assert output_path.name == {OutputCompression.GZIP: "book.json.gz", OutputCompression.ZSTD: "book.json.zst"}[compression]
+    assert read_json_output(output_path) == _dumped(payload)
+
+
+def test_numpy_embeddings_serialize_with_orjson(tmp_path: Path) -> None:
+    pytest.importorskip("orjson")
+    np = pytest.importorskip("numpy")
+    output_path = tmp_path / "book.json"
+
+    with StreamingJsonWriter(output_path, backend="orjson") as writer:
+        writer.write_chunks([{"content": "Seli", "embedding": np.array([0.5, -1.0], dtype=np.float32)}])
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == {"chunks": [{"content": "Seli", "embedding": [0.5, -1.0]}]}
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.application.factories.chunker_factory import ChunkerFactory, load_chunker_class
+from src.domain.entities.chunker import ChunkerConfig, ChunkerType
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_cli_import_does_not_load_provider_sdks_or_settings() -> None:
+    env = {key: value for key, value in os.environ.items() if not key.endswith(("_API_KEY", "_BOOKS_PATH"))}
+    script = (
+        "import sys, src.main\n"
+        "lazy = ['langchain_community', 'langchain_google_genai', 'langchain_openai', 'together', 'mistralai', 'pypdf']\n"
+        "print([name for name in lazy if name in sys.modules])\n"
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        env={**env, "PYTHONPATH": str(PROJECT_ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == "[]"
+
+
+def test_factory_loads_selected_chunker_on_demand() -> None:
+    chunker = ChunkerFactory(ChunkerConfig(chunker_type=ChunkerType.LANGCHAIN)).get_chunker()
+
+    assert type(chunker).__name__ == "LangchainChunker"
+    assert "src.infrastructure.chunker.langchain_chunker" in sys.modules
+
+
+@pytest.mark.parametrize("chunker_type", [ChunkerType.LLM, ChunkerType.UNSTRUCTURED])
+def test_factory_rejects_deprecated_chunkers(chunker_type: ChunkerType) -> None:
+    with pytest.raises(ValueError, match="deprecated"):
+        load_chunker_class(chunker_type)
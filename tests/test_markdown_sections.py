@@ -0,0 +1,128 @@
+from pathlib import Path
+
+import pytest
+
+from src.application import pipeline_runner
+from src.domain.entities.chunker import ChunkerType
+from src.domain.entities.table_of_contents import Chapter, TableOfContents
+from src.infrastructure.chunker.markdown_chunker import _derive_table_of_contents
+from src.infrastructure.preprocessing.markdown_sections import parse_chapter_number, split_markdown_sections
+
+
+def _tags(pages: list[str]) -> list[tuple[int, int, str | None, str | None]]:
+    return [
+        (section.page, section.chapter_number, section.chapter_title, section.section_title)
+        for section in split_markdown_sections(pages)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    [("4", 4), ("IV", 4), ("four", 4), ("xii", 12), ("Cells", None), ("vix", None)],
+)
+def test_parse_chapter_number(token: str, expected: int | None) -> None:
+    assert parse_chapter_number(token) == expected
+
+
+def test_chapter_headings_define_chapters_and_sections() -> None:
+    pages = [
+        "# Preface\nWelcome.\n",
+        "# CHAPTER ONE\n# **Cell biology**\nIntro.\n## 1.1 Cells\nCells are units.\n",
+        "# Chapter One\nRunning header repeated.\n## 1.2 Tissues\nGroups of cells.\n",
+        "# Chapter 2: Energy\nBody.\n",
+    ]
+
+    assert _tags(pages) == [
+        (0, 0, None, "Preface"),
+        (1, 1, None, None),
+        (1, 1, "Cell biology", None),
+        (1, 1, "Cell biology", "1.1 Cells"),
+        (2, 1, "Cell biology", "1.1 Cells"),
+        (2, 1, "Cell biology", "1.2 Tissues"),
+        (3, 2, "Energy", None),
+    ]
+
+
+def test_text_before_first_heading_continues_previous_section() -> None:
+    sections = split_markdown_sections(["# Unit 3 Forces\n## Friction\nStart", "continues here.\n"])
+
+    assert sections[-1].text == "continues here.\n"
+    assert (sections[-1].chapter_number, sections[-1].section_title) == (3, "Friction")
+
+
+def test_falls_back_to_shallowest_heading_level() -> None:
+    pages = ["## Front\nx\n", "# Algebra\n### Terms\ny\n# Geometry\nz\n"]
+
+    assert _tags(pages) == [
+        (0, 0, None, "Front"),
+        (1, 1, "Algebra", None),
+        (1, 1, "Algebra", "Terms"),
+        (1, 2, "Geometry", None),
+    ]
+
+
+def test_deeper_chapter_like_heading_is_a_section() -> None:
+    pages = [
+        "# Chapter 1: Cells\nIntro.\n## Chapter 2 review questions\nQ1.\n",
+        "# Chapter 2: Tissues\nBody.\n",
+    ]
+
+    assert _tags(pages) == [
+        (0, 1, "Cells", None),
+        (0, 1, "Cells", "Chapter 2 review questions"),
+        (1, 2, "Tissues", None),
+    ]
+
+
+def test_fallback_ignores_repeated_running_header() -> None:
+    pages = [
+        "# Biology Form Two\n## Cells\nx\n",
+        "# Biology Form Two\ny\n",
+        "# biology form two\nz\n",
+    ]
+
+    assert _tags(pages) == [
+        (0, 1, "Biology Form Two", None),
+        (0, 1, "Biology Form Two", "Cells"),
+        (1, 1, "Biology Form Two", "Cells"),
+        (2, 1, "Biology Form Two", "Cells"),
+    ]
+
+def test_derived_table_of_contents_uses_book_page_numbers() -> None:
+    sections = split_markdown_sections(["# Preface\n", "# Chapter 1\n# Motion\nx\n", "y\n# Chapter 2\nz\n"])
+
+    toc = _derive_table_of_contents(sections, page_labels=[1, 2, 3], text_initial_page=2)
+
+    assert [(chapter.number, chapter.name, chapter.start_page) for chapter in toc.chapters] == [
+        (1, "Motion", 1),
+        (2, "Chapter 2", 2),
+    ]
+
+
+def test_run_pipeline_skips_table_of_contents_call_for_markdown_chunker(monkeypatch, tmp_path: Path) -> None:
+    info_path = tmp_path / "info.yaml"
+    info_path.write_text(
+        "resource: {name: Book}\nclass: {name: Form 1}\nsubject: {name: Biology}\n"
+        "book_config: {table_of_contents_page_number: 3, first_page_number: 1}\n"
+    )
+    config = pipeline_runner.build_book_config(
+        info_path,
+        tmp_path / "book.pdf",
+        tmp_path / "out.json",
+        chunker_type=ChunkerType.MARKDOWN,
+    )
+    derived = TableOfContents(chapters=[Chapter(name="Motion", number=1, start_page=1)])
+
+    def fail(**kwargs):
+        raise AssertionError("table of contents LLM call should be skipped")
+
+    def fake_chunk(self, book_path, table_of_contents, text_initial_page):
+        self.derived_table_of_contents = derived
+        return []
+
+    monkeypatch.setattr(pipeline_runner, "get_table_of_contents", fail)
+    monkeypatch.setattr("src.infrastructure.chunker.markdown_chunker.MarkdownChunker.chunk", fake_chunk)
+
+    payload = pipeline_runner.run_pipeline(config)
+
+    assert payload["table_of_contents"] == derived.model_dump()
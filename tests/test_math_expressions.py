@@ -0,0 +1,88 @@
+import random
+import re
+
+import pytest
+
+from src.infrastructure.preprocessing.math_expressions import (
+    MATH_ENVIRONMENT_NAMES,
+    find_math_expressions,
+    wrap_math_expressions,
+)
+
+
+# The backtracking regex previously used by MathematicalChunker, kept as the reference.
+# The environment names are escaped here: unescaped, "align*" was read as "alig" +
+# "n*", so the starred environments were never recognised by the old pattern.
+LEGACY_MATH_EXPRESSION_PATTERN = re.compile(
+    r"""
+    (\\begin\{(?P<env>""" + "|".join(re.escape(name) for name in MATH_ENVIRONMENT_NAMES) + r""")\}.*?\\end\{(?P=env)\})
+    |
+    (\$\$.*?\$\$)
+    |
+    (\\\[.*?\\\])
+    |
+    (\\\(.*?\\\))
+    |
+    (\$(?:\\.|[^$\\])+\$)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+
+def _legacy_wrap_math_expressions(text: str) -> str:
+    def replacer(match: re.Match) -> str:
+        expression = match.group(0)
+        if "<math>" in expression or "</math>" in expression:
+            return expression
+        return f"<math>{expression}</math>"
+
+    return LEGACY_MATH_EXPRESSION_PATTERN.sub(replacer, text)
+
+
+OCR_PAGES = [
+    "## 2.3 Quadratic equations\n\nSolve $x^2 - 5x + 6 = 0$.\n\n$$\nx = \\frac{-b \\pm \\sqrt{b^2-4ac}}{2a}\n$$\n",
+    "The cost is 500 shillings and $3 more.\n\\begin{align*}\na &= b \\\\\nc &= d\n\\end{align*}\nExercise 2.1",
+    "Let \\( f(x) = 2x \\) and \\[ g(x) = x^2 \\] then $f(g(x)) = 2x^2$ while $$ unterminated",
+    "Prices: \\$5 and \\$10, total $\\$15$. ![img-0.jpeg](img-0.jpeg) \\begin{equation} E = mc^2",
+    "Already tagged <math>$y = mx + c$</math> and $<math>z</math>$ plus \\begin{alignat}{2} x \\end{alignat}",
+    "$\\\\$ $a\\$b$ $\\",
+]
+
+FUZZ_TOKENS = [
+    "$", "$", "$$", "\\", "\\\\", "\\$", "\\(", "\\)", "\\[", "\\]",
+    "\\begin{align}", "\\end{align}", "\\begin{align*}", "\\end{align*}",
+    "\\begin{equation}", "\\end{equation}", "\\begin{gather*}", "\\end{gather}",
+    "\\begin{", "}", "x", "y = 2", " ", "\n", "<math>", "</math>",
+]
+
+
+@pytest.mark.parametrize("page", OCR_PAGES)
+def test_matches_legacy_regex_on_ocr_pages(page: str) -> None:
+    assert wrap_math_expressions(page) == _legacy_wrap_math_expressions(page)
+
+
+def test_matches_legacy_regex_on_random_inputs() -> None:
+    rng = random.Random(2024)
+
+    for _ in range(3000):
+        text = "".join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(0, 40)))
+        expected = [match.span() for match in LEGACY_MATH_EXPRESSION_PATTERN.finditer(text)]
+
+        assert list(find_math_expressions(text)) == expected, text
+        assert wrap_math_expressions(text) == _legacy_wrap_math_expressions(text)
+
+
+def test_wraps_each_supported_delimiter() -> None:
+    text = "a $x$ b $$y$$ c \\(z\\) d \\[w\\] e \\begin{gather}v\\end{gather} f \\begin{align*}u\\end{align*}"
+
+    assert wrap_math_expressions(text) == (
+        "a <math>$x$</math> b <math>$$y$$</math> c <math>\\(z\\)</math> "
+        "d <math>\\[w\\]</math> e <math>\\begin{gather}v\\end{gather}</math> "
+        "f <math>\\begin{align*}u\\end{align*}</math>"
+    )
+
+
+def test_stray_delimiters_on_large_pages_are_left_alone() -> None:
+    text = "cost $5 " * 20000 + "\\begin{align} " * 5000 + "$$ " + "\\( " * 5000
+
+    assert wrap_math_expressions(text) == _legacy_wrap_math_expressions(text)
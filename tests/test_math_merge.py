@@ -0,0 +1,52 @@
+from src.infrastructure.chunker.page_stages import _update_math_balance, merge_math_aware_spans
+from src.infrastructure.splitter.text_splitter import TextSpan
+
+
+def _spans(*contents: str) -> list[TextSpan]:
+    return [TextSpan(page=index, start=0, end=len(content), text=content) for index, content in enumerate(contents)]
+
+
+def test_balanced_documents_are_left_alone() -> None:
+    merged = merge_math_aware_spans(_spans("a <math>x</math>", "b", "c"))
+
+    assert [span.text for span in merged] == ["a <math>x</math>", "b", "c"]
+
+
+def test_split_math_block_is_merged_with_first_location() -> None:
+    merged = merge_math_aware_spans(_spans("a <math>x", "+ y", "</math> b", "c"))
+
+    assert [span.text for span in merged] == ["a <math>x+ y</math> b", "c"]
+    assert (merged[0].page, merged[0].start, merged[0].end_page, merged[0].end) == (0, 0, 2, 9)
+    assert merged[1].end_page is None
+
+
+def test_merge_within_one_page_has_no_end_page() -> None:
+    spans = [TextSpan(page=4, start=0, end=9, text="a <math>x"), TextSpan(page=4, start=9, end=18, text="</math> b")]
+
+    merged = merge_math_aware_spans(spans)
+
+    assert (merged[0].page, merged[0].start, merged[0].end, merged[0].end_page) == (4, 0, 18, None)
+
+
+def test_stray_closing_tag_does_not_open_the_buffer() -> None:
+    assert _update_math_balance(0, "</math> text <math>") == 1
+    assert _update_math_balance(0, "text </math>") == 0
+
+    merged = merge_math_aware_spans(_spans("oops </math>", "b", "c"))
+
+    assert [span.text for span in merged] == ["oops </math>", "b", "c"]
+
+
+def test_unbalanced_tag_is_force_split_at_max_length() -> None:
+    spans = _spans("<math>never closed", *["x" * 10 for _ in range(100)])
+
+    merged = merge_math_aware_spans(spans, max_merged_length=50)
+
+    assert max(len(span.text) for span in merged) <= 50
+    assert "".join(span.text for span in merged) == "".join(span.text for span in spans)
+
+
+def test_unbalanced_tag_without_limit_keeps_old_behaviour() -> None:
+    merged = merge_math_aware_spans(_spans("<math>never closed", "b", "c"))
+
+    assert [span.text for span in merged] == ["<math>never closedbc"]
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from src.infrastructure.preprocessing.near_duplicates import NearDuplicateFilter, _choose_bands
+
+
+def _paragraph(seed: int, words: int = 60) -> str:
+    rng = random.Random(seed)
+    vocabulary = ["cell", "membrane", "energy", "plant", "root", "water", "light", "leaf", "oxygen", "carbon"]
+    return " ".join(f"{rng.choice(vocabulary)}{rng.randint(0, 99)}" for _ in range(words))
+
+
+def _with_ocr_noise(text: str, seed: int, edits: int = 3) -> str:
+    rng = random.Random(seed)
+    characters = list(text)
+    for _ in range(edits):
+        characters[rng.randrange(len(characters))] = rng.choice("abcdefghij")
+    return "".join(characters)
+
+
+def test_rejects_invalid_threshold() -> None:
+    with pytest.raises(ValueError):
+        NearDuplicateFilter(threshold=0)
+
+
+def test_band_choice_tracks_threshold() -> None:
+    assert _choose_bands(128, 0.5) == (32, 4)
+    assert _choose_bands(128, 0.8) == (16, 8)
+    assert _choose_bands(128, 0.95) == (4, 32)
+
+
+def test_signatures_are_deterministic() -> None:
+    text = _paragraph(1)
+
+    assert (NearDuplicateFilter().signature(text) == NearDuplicateFilter().signature(text)).all()
+
+
+def test_keeps_first_occurrence_of_each_near_duplicate_cluster() -> None:
+    originals = [_paragraph(seed) for seed in range(20)]
+    texts = originals + [_with_ocr_noise(originals[3], 1), originals[7].upper(), _with_ocr_noise(originals[3], 2)]
+
+    kept, report = NearDuplicateFilter(threshold=0.8).filter(texts)
+
+    assert kept == list(range(20))
+    assert report.input_count == 23
+    assert report.dropped == {20: 3, 21: 7, 22: 3}
+    assert report.dropped_count == 3
+
+
+def test_overlapping_windows_are_not_duplicates() -> None:
+    text = _paragraph(5, words=200)
+    windows = [text[start:start + 250] for start in range(0, len(text) - 250, 220)]
+
+    kept, report = NearDuplicateFilter(threshold=0.85).filter(windows)
+
+    assert kept == list(range(len(windows)))
+    assert report.dropped == {}
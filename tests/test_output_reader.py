@@ -0,0 +1,123 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.application.pipeline_runner import write_output
+from src.domain.entities.book import OutputCompression, OutputFormat
+from src.infrastructure.output.reader import open_output
+
+
+OUTPUTS = {
+    "json": {},
+    "pretty json": {"pretty": True},
+    "gzip json": {"compression": OutputCompression.GZIP},
+    "zstd json": {"compression": OutputCompression.ZSTD},
+    "sharded": {"output_format": OutputFormat.SHARDED},
+    "zstd sharded": {"output_format": OutputFormat.SHARDED, "compression": OutputCompression.ZSTD},
+    "parquet": {"output_format": OutputFormat.PARQUET},
+}
+
+
+@pytest.fixture(params=list(OUTPUTS))
+def output_path(request, tmp_path: Path, make_payload) -> Path:
+    options = OUTPUTS[request.param]
+    if options.get("compression") == OutputCompression.ZSTD:
+        pytest.importorskip("zstandard")
+    if options.get("output_format") == OutputFormat.PARQUET:
+        pytest.importorskip("pyarrow")
+    write_output(tmp_path / "book.json", make_payload(), **options)
+    return tmp_path / "book.json"
+
+
+def test_selects_chunks_by_chapter_and_page(output_path: Path, make_payload) -> None:
+    expected = [chunk.to_dict() for chunk in make_payload()["chunks"]]
+
+    with open_output(output_path) as reader:
+        assert len(reader) == 10
+        assert reader.chapters() == [1, 2, 3]
+        assert list(reader.iter_chunks(chapter_number=2)) == [chunk for chunk in expected if chunk["chapter_number"] == 2]
+        assert list(reader.iter_chunks(page_number=5)) == [chunk for chunk in expected if chunk["page_number"] == 5]
+        assert list(reader.iter_chunks(chapter_number=3, page_number=7)) == expected[8:10]
+        assert list(reader.iter_chunks()) == expected
+
+
+def test_reads_metadata_and_embeddings(output_path: Path, make_payload) -> None:
+    with open_output(output_path) as reader:
+        assert reader.metadata["resource"]["name"] == "Biolojia"
+        assert reader.metadata["changes"] == make_payload()["changes"]
+
+        embeddings = reader.embeddings(chapter_number=2)
+        assert embeddings.dtype == np.float32
+        np.testing.assert_array_equal(embeddings[:, 0], [4.0, 5.0, 6.0, 7.0])
+        assert reader.embeddings().shape == (10, 3)
+
+
+def test_missing_offset_table_is_reported(tmp_path: Path) -> None:
+    (tmp_path / "book.json").write_text("{}")
+
+    with pytest.raises(FileNotFoundError, match="offset table"):
+        open_output(tmp_path / "book.json")
+
+
+def test_newest_output_wins_after_switching_format(tmp_path: Path, make_payload) -> None:
+    pytest.importorskip("pyarrow")
+    stale = make_payload()
+    stale["resource"] = {"name": "Old"}
+    write_output(tmp_path / "book.json", stale, output_format=OutputFormat.PARQUET)
+    write_output(tmp_path / "book.json", make_payload())
+    os.utime(tmp_path / "book.parquet", ns=(0, 0))
+
+    with open_output(tmp_path / "book.json") as reader:
+        assert reader.metadata["resource"]["name"] == "Biolojia"
+    with open_output(tmp_path / "book.parquet") as reader:
+        assert reader.metadata["resource"] == {"name": "Old"}
+
+
+def test_opens_the_written_file_paths(tmp_path: Path, make_payload) -> None:
+    manifest_path = write_output(tmp_path / "book.json", make_payload(), output_format=OutputFormat.SHARDED)
+    gzip_path = write_output(tmp_path / "book.json", make_payload(), compression=OutputCompression.GZIP)
+
+    for path in (manifest_path, gzip_path):
+        with open_output(path) as reader:
+            assert len(reader) == 10
+
+
+def test_json_rewritten_without_offset_table_is_reported(tmp_path: Path, make_payload) -> None:
+    write_output(tmp_path / "book.json", make_payload())
+    payload = make_payload()
+    payload["chunks"] = [chunk.to_dict() for chunk in payload["chunks"][:3]]
+    (tmp_path / "book.json").write_text(json.dumps(payload, ensure_ascii=False))
+
+    with pytest.raises(ValueError, match="offset table"):
+        open_output(tmp_path / "book.json")
+
+
+def test_parquet_embeddings_span_row_groups(tmp_path: Path, make_payload) -> None:
+    pytest.importorskip("pyarrow")
+    from src.infrastructure.output.parquet_writer import write_parquet_output
+
+    write_parquet_output(tmp_path / "book.json", make_payload(), row_group_size=3)
+
+    with open_output(tmp_path / "book.json") as reader:
+        np.testing.assert_array_equal(reader.embeddings(chapter_number=2)[:, 0], [4.0, 5.0, 6.0, 7.0])
+        np.testing.assert_array_equal(reader.embeddings()[:, 0], np.arange(10, dtype=np.float32))
+
+
+@pytest.mark.parametrize("options", list(OUTPUTS.values()), ids=list(OUTPUTS))
+def test_failed_embeddings_are_nan_rows(tmp_path: Path, options: dict, make_payload) -> None:
+    if options.get("compression") == OutputCompression.ZSTD:
+        pytest.importorskip("zstandard")
+    if options.get("output_format") == OutputFormat.PARQUET:
+        pytest.importorskip("pyarrow")
+    payload = make_payload()
+    payload["chunks"][5].embedding = []
+    write_output(tmp_path / "book.json", payload, **options)
+
+    with open_output(tmp_path / "book.json") as reader:
+        embeddings = reader.embeddings(chapter_number=2)
+        assert embeddings.shape == (4, 3)
+        assert np.isnan(embeddings[1]).all() and not np.isnan(embeddings[[0, 2, 3]]).any()
+        assert list(reader.iter_chunks(page_number=5))[1]["embedding"] == []
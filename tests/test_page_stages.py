@@ -0,0 +1,79 @@
+import multiprocessing
+import random
+
+from src.domain.entities.table_of_contents import Chapter, ChapterIndex, TableOfContents
+from src.infrastructure.chunker.page_stages import PageStages, chapter_partitions, run_page_stages
+
+
+def _chapter_index() -> ChapterIndex:
+    chapters = [Chapter(name=f"C{number}", number=number, start_page=start) for number, start in [(1, 3), (2, 10), (3, 25)]]
+    return ChapterIndex(TableOfContents(chapters=chapters), text_initial_page=1)
+
+
+def _pages(count: int) -> list[str]:
+    rng = random.Random(7)
+    words = ["cell", "$x^2$", "energy", "\\(y\\)", "![img](a.png)", "DRAFT", "\n", "\n\n", "plant", "$$z$$"]
+    return [
+        f"Biology Form Two\n{' '.join(rng.choice(words) for _ in range(rng.randint(20, 200)))}\nPage {page}\n"
+        for page in range(1, count + 1)
+    ]
+
+
+def test_chapter_partitions_follow_chapter_boundaries() -> None:
+    partitions = chapter_partitions(list(range(1, 31)), _chapter_index())
+
+    assert partitions == [range(0, 2), range(2, 9), range(9, 24), range(24, 30)]
+
+
+def test_chapter_partitions_without_chapters_are_cut_evenly() -> None:
+    empty_index = ChapterIndex(TableOfContents(chapters=[]), text_initial_page=1)
+
+    assert chapter_partitions(list(range(1, 11)), empty_index, min_partitions=3) == [
+        range(0, 4),
+        range(4, 8),
+        range(8, 10),
+    ]
+
+
+def test_parallel_run_is_identical_to_serial() -> None:
+    pages = _pages(30)
+    stages = PageStages(
+        boilerplate_patterns=("DRAFT",),
+        repeated_line_page_fraction=0.5,
+        chunk_size=120,
+        chunk_overlap=20,
+        wrap_math=True,
+    )
+
+    serial = run_page_stages(stages, pages, list(range(1, 31)), _chapter_index())
+    parallel = run_page_stages(stages, pages, list(range(1, 31)), _chapter_index(), max_workers=3)
+
+    assert parallel == serial
+    assert all("Biology Form Two" not in span.text and "DRAFT" not in span.text for span in serial)
+    assert any("<math>" in span.text for span in serial)
+
+
+def test_parallel_run_with_spawned_workers_is_identical_to_serial() -> None:
+    pages = [
+        f"My Running Header Form Two\nCell {page} divides into {page * 2} cells quickly.\nPage {page}\n"
+        for page in range(1, 13)
+    ]
+    stages = PageStages(
+        boilerplate_patterns=(),
+        repeated_line_page_fraction=0.5,
+        chunk_size=200,
+        chunk_overlap=0,
+    )
+
+    serial = run_page_stages(stages, pages, list(range(1, 13)), _chapter_index())
+    parallel = run_page_stages(
+        stages,
+        pages,
+        list(range(1, 13)),
+        _chapter_index(),
+        max_workers=2,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+    assert parallel == serial
+    assert all("Running Header" not in span.text and "Page " not in span.text for span in parallel)
@@ -0,0 +1,29 @@
+from langchain_core.documents import Document
+
+from src.application.mappers.span_mapper import SpanMapper
+from src.infrastructure.parser.pages import pages_from_documents
+
+
+def test_pages_keep_index_label_and_text() -> None:
+    documents = [
+        Document(page_content="Utangulizi", metadata={"page": 0, "page_label": "7", "source": "book.pdf"}),
+        Document(page_content="Seli", metadata={"page": 1, "page_label": "8", "source": "book.pdf"}),
+    ]
+
+    pages = pages_from_documents(documents)
+
+    assert [(page.index, page.label, page.text) for page in pages] == [(0, 7, "Utangulizi"), (1, 8, "Seli")]
+    assert not hasattr(pages[0], "__dict__")
+
+
+def test_span_mapper_numbers_pages_from_the_first_text_page() -> None:
+    chunk = SpanMapper.map(
+        text="Seli ni kitengo cha msingi cha uhai.",
+        page_label=12,
+        content_embedding=[0.5],
+        chapter_number=2,
+        text_initial_page=5,
+        section_title="Muundo wa seli",
+    )
+
+    assert (chunk.page_number, chunk.chapter_number, chunk.section_title) == (8, 2, "Muundo wa seli")
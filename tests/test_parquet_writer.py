@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.infrastructure.output.parquet_writer import (
+    parquet_output_paths,
+    read_parquet_output,
+    write_parquet_output,
+)
+
+
+def test_chunks_round_trip_through_row_groups(tmp_path: Path, make_payload) -> None:
+    payload = make_payload(5, model=True)
+
+    chunks_path, sidecar_path = write_parquet_output(tmp_path / "book.json", payload, row_group_size=2)
+
+    assert (chunks_path.name, sidecar_path.name) == ("book.parquet", "book.metadata.json")
+    parquet_file = pq.ParquetFile(chunks_path)
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.schema_arrow.field("embedding").type == pa.list_(pa.float32(), 3)
+    assert parquet_file.metadata.row_group(0).column(0).compression == "ZSTD"
+
+    loaded = read_parquet_output(tmp_path / "book.json")
+    assert loaded["chunks"] == [chunk.model_dump() for chunk in payload["chunks"]]
+    assert loaded["changes"] == payload["changes"]
+    assert loaded["chunk_count"] == 5
+    assert loaded["embedding_dimension"] == 3
+
+
+def test_chunks_without_embeddings_round_trip_as_empty(tmp_path: Path, make_payload) -> None:
+    payload = make_payload(5, model=True)
+    for index in (0, 1, 3):
+        payload["chunks"][index] = payload["chunks"][index].model_copy(update={"embedding": []})
+
+    # The first row group has no embedding at all; the dimension comes from the next one.
+    write_parquet_output(tmp_path / "book.json", payload, row_group_size=2)
+
+    loaded = read_parquet_output(tmp_path / "book.json")
+    assert loaded["chunks"] == [chunk.model_dump() for chunk in payload["chunks"]]
+    assert loaded["chunk_count"] == 5
+    assert loaded["embedding_dimension"] == 3
+
+
+def test_chunks_without_any_embedding_are_kept(tmp_path: Path, make_payload) -> None:
+    payload = make_payload(2, model=True)
+    payload["chunks"] = [chunk.model_copy(update={"embedding": []}) for chunk in payload["chunks"]]
+
+    write_parquet_output(tmp_path / "book.json", payload)
+
+    loaded = read_parquet_output(tmp_path / "book.json")
+    assert [chunk["embedding"] for chunk in loaded["chunks"]] == [[], []]
+    assert loaded["embedding_dimension"] == 0
+
+
+def test_embeddings_of_another_dimension_are_rejected(tmp_path: Path, make_payload) -> None:
+    payload = make_payload(2, model=True)
+    payload["chunks"][1] = payload["chunks"][1].model_copy(update={"embedding": [1.0]})
+
+    with pytest.raises(ValueError, match="1-dimension embedding"):
+        write_parquet_output(tmp_path / "book.json", payload)
+
+
+def test_empty_payload_writes_an_empty_table(tmp_path: Path, make_payload) -> None:
+    chunks_path, _ = write_parquet_output(tmp_path / "book.json", make_payload(0, model=True))
+
+    assert pq.read_table(chunks_path).num_rows == 0
+    assert read_parquet_output(tmp_path / "book.json")["chunks"] == []
+
+
+def test_failed_write_keeps_previous_output(tmp_path: Path, make_payload) -> None:
+    chunks_path, _ = parquet_output_paths(tmp_path / "book.json")
+    write_parquet_output(tmp_path / "book.json", make_payload(1, model=True))
+    previous = chunks_path.read_bytes()
+
+    def failing_chunks():
+        yield make_payload(1, model=True)["chunks"][0]
+        raise RuntimeError("embedding failed")
+
+    with pytest.raises(RuntimeError):
+        write_parquet_output(tmp_path / "book.json", {**make_payload(0, model=True), "chunks": failing_chunks()})
+
+    assert chunks_path.read_bytes() == previous
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["book.metadata.json", "book.parquet"]
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+
+from scripts.pipeline_output import OutputChunkRows, iter_output_chunks, output_chunk_row
+from src.application.pipeline_runner import write_output
+from src.domain.entities.book import OutputCompression, OutputFormat
+from src.domain.entities.chunk import compute_content_hash
+
+
+OUTPUTS = {
+    "json": {},
+    "gzip json": {"compression": OutputCompression.GZIP},
+    "zstd sharded": {"output_format": OutputFormat.SHARDED, "compression": OutputCompression.ZSTD},
+    "parquet": {"output_format": OutputFormat.PARQUET},
+}
+
+
+@pytest.mark.parametrize("options", list(OUTPUTS.values()), ids=list(OUTPUTS))
+def test_streams_every_chunk_of_any_output_format(tmp_path: Path, options: dict, make_payload) -> None:
+    if options.get("compression") == OutputCompression.ZSTD:
+        pytest.importorskip("zstandard")
+    if options.get("output_format") == OutputFormat.PARQUET:
+        pytest.importorskip("pyarrow")
+    payload = make_payload(3)
+
+    written_path = write_output(tmp_path / "book.json", payload, **options)
+
+    expected = [chunk.to_dict() for chunk in payload["chunks"]]
+    assert list(iter_output_chunks(tmp_path / "book.json")) == expected
+    assert list(iter_output_chunks(written_path)) == expected
+
+
+def test_output_chunk_row_fills_page_and_section_index() -> None:
+    chunk = {"content": "Seli", "embedding": [0.5], "page_number": 3, "chapter_number": 12, "chapter_title": "x" * 150}
+
+    row = output_chunk_row(chunk, resource_id=7)
+
+    assert row[:4] == (7, "Seli", 3, "TEXT")
+    assert row[5] == "12"
+    assert len(row[6]) == 100
+    assert row[7] == compute_content_hash("Seli")
+    assert output_chunk_row({"content": "a", "embedding": []}, resource_id=7)[5:] == (
+        None,
+        None,
+        compute_content_hash("a"),
+    )
+
+
+def test_rows_skip_chunks_without_embedding() -> None:
+    chunks = [
+        {"content": "Seli", "embedding": [0.5]},
+        {"content": "Tishu", "embedding": []},
+        {"content": "Viungo", "embedding": [1.5]},
+    ]
+
+    rows = OutputChunkRows(iter(chunks), resource_id=7)
+
+    assert [row[1] for row in rows] == ["Seli", "Viungo"]
+    assert rows.skipped == 1
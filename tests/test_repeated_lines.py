@@ -0,0 +1,89 @@
+import logging
+
+import pytest
+
+from src.infrastructure.preprocessing.repeated_lines import (
+    RepeatedLineStripper,
+    normalize_line,
+)
+
+
+TOPICS = ["cells", "tissues", "organs", "blood", "lungs", "heart", "nerves", "bones", "skin", "teeth"]
+
+
+def _pages() -> list[str]:
+    return [
+        f"Biology Form Four  {page}\nThis page is about {topic}.\n| --- | --- |\nPage {page} of 40\n"
+        for page, topic in enumerate(TOPICS, start=1)
+    ]
+
+
+def test_normalize_line_removes_page_numbers_and_case() -> None:
+    assert normalize_line("  Page 12  of 40 ") == normalize_line("page 13 OF 41")
+
+
+def test_strip_removes_running_headers_and_footers() -> None:
+    pages, report = RepeatedLineStripper(min_page_fraction=0.5).strip(_pages())
+
+    assert pages[0] == "This page is about cells.\n| --- | --- |\n"
+    assert report.page_count == 10
+    assert report.removed_lines == {"Biology Form Four  1": 10, "Page 1 of 40": 10}
+    assert report.removed_occurrences == 20
+
+
+def test_lines_below_the_page_fraction_are_kept() -> None:
+    pages = _pages()
+    pages[3] = "A page without running header.\n"
+
+    stripped, report = RepeatedLineStripper(min_page_fraction=1.0).strip(pages)
+
+    assert stripped == pages
+    assert report.removed_lines == {}
+
+
+def test_small_books_are_left_untouched() -> None:
+    pages = ["Header\nOne", "Header\nTwo"]
+
+    stripped, report = RepeatedLineStripper(min_page_fraction=0.5, min_pages=3).strip(pages)
+
+    assert stripped == pages
+    assert report.removed_occurrences == 0
+
+
+def test_invalid_fraction_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        RepeatedLineStripper(min_page_fraction=0)
+
+
+def test_markdown_headings_are_kept_and_removals_are_warned(caplog) -> None:
+    pages = [f"## Exercise\nSolution\nQuestion {page} is about {topic}.\n" for page, topic in enumerate(TOPICS, start=1)]
+    for index in (0, 5):
+        pages[index] = pages[index].replace("## Exercise\n", "")
+
+    with caplog.at_level(logging.WARNING):
+        stripped, report = RepeatedLineStripper(min_page_fraction=0.5).strip(pages)
+
+    assert stripped[1] == "## Exercise\nQuestion 2 is about tissues.\n"
+    assert report.removed_lines == {"Solution": 10}
+    assert any(record.levelno == logging.WARNING for record in caplog.records)
+
+
+def test_running_title_rendered_as_heading_is_removed() -> None:
+    pages = [f"# Biology Form Two\nThis page is about {topic}.\n" for topic in TOPICS]
+
+    stripped, report = RepeatedLineStripper(min_page_fraction=0.5).strip(pages)
+
+    assert stripped[0] == "This page is about cells.\n"
+    assert report.removed_lines == {"# Biology Form Two": 10}
+
+
+def test_footer_starting_with_a_page_number_is_removed() -> None:
+    pages = [
+        f"This page is about {topic}.\n{page} Biology for Secondary Schools\n"
+        for page, topic in enumerate(TOPICS, start=12)
+    ]
+
+    stripped, report = RepeatedLineStripper(min_page_fraction=0.5).strip(pages)
+
+    assert stripped[0] == "This page is about cells.\n"
+    assert report.removed_lines == {"12 Biology for Secondary Schools": 10}
@@ -0,0 +1,76 @@
+import numpy as np
+
+from src.application.factories.chunker_factory import ChunkerFactory
+from src.domain.entities.chunker import ChunkerConfig, ChunkerType
+from src.infrastructure.chunker.semantic_chunker import (
+    SemanticChunker,
+    _adjacent_cosine_distances,
+    _semantic_groups,
+    _split_sentences,
+)
+
+
+def test_factory_returns_semantic_chunker() -> None:
+    chunker = ChunkerFactory(ChunkerConfig(chunker_type=ChunkerType.SEMANTIC)).get_chunker()
+
+    assert isinstance(chunker, SemanticChunker)
+
+
+def test_split_sentences_on_punctuation_and_blank_lines() -> None:
+    text = "Cells divide. Do they grow?  Yes!\n\nMitosis has phases\nand steps."
+
+    assert _split_sentences(text) == ["Cells divide.", "Do they grow?", "Yes!", "Mitosis has phases\nand steps."]
+
+
+def test_adjacent_cosine_distances_match_pairwise_loop() -> None:
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(20, 8)).astype(np.float32)
+
+    expected = [
+        1 - float(a @ b) / (np.linalg.norm(a) * np.linalg.norm(b))
+        for a, b in zip(embeddings[:-1], embeddings[1:])
+    ]
+
+    assert np.allclose(_adjacent_cosine_distances(embeddings), expected, atol=1e-5)
+
+
+def test_failed_embeddings_do_not_create_breakpoints() -> None:
+    embeddings = np.array([[1.0, 0.0], [0.0, 0.0], [0.0, 1.0]], dtype=np.float32)
+
+    assert _adjacent_cosine_distances(embeddings).tolist() == [0.0, 0.0]
+    assert _adjacent_cosine_distances(embeddings[:1]).size == 0
+
+
+def test_groups_break_at_distance_outliers() -> None:
+    distances = np.array([0.1, 0.1, 0.9, 0.1, 0.1])
+
+    groups = _semantic_groups(distances, [10] * 6, breakpoint_percentile=80, max_chunk_size=1000)
+
+    assert groups == [(0, 3), (3, 6)]
+
+
+def test_groups_break_at_every_maximum_but_not_on_uniform_distances() -> None:
+    alternating = np.array([0.0, 1.0, 0.0, 1.0, 0.0])
+
+    assert _semantic_groups(alternating, [10] * 6, breakpoint_percentile=90, max_chunk_size=1000) == [
+        (0, 2),
+        (2, 4),
+        (4, 6),
+    ]
+    assert _semantic_groups(np.full(5, 0.3), [10] * 6, breakpoint_percentile=90, max_chunk_size=1000) == [(0, 6)]
+
+
+def test_groups_respect_size_cap_and_forced_breaks() -> None:
+    distances = np.zeros(5)
+    forced_breaks = np.array([False, False, False, True, False])
+
+    groups = _semantic_groups(
+        distances,
+        [10] * 6,
+        breakpoint_percentile=90,
+        max_chunk_size=21,
+        forced_breaks=forced_breaks,
+    )
+
+    assert groups == [(0, 2), (2, 4), (4, 6)]
+    assert _semantic_groups(distances[:0], [], breakpoint_percentile=90, max_chunk_size=21) == []
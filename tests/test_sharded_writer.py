@@ -0,0 +1,94 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.domain.entities.book import OutputCompression
+from src.infrastructure.output.sharded_writer import (
+    iter_shard_chunks,
+    read_manifest,
+    read_sharded_output,
+    sharded_output_dir,
+    write_sharded_output,
+)
+
+
+def test_shards_round_trip_with_manifest(tmp_path: Path, make_payload) -> None:
+    payload = make_payload(chapters={1: ["Seli", "Tishu — ñ"], 2: ["Viungo"]})
+
+    manifest_path = write_sharded_output(tmp_path / "book.json", payload)
+
+    assert manifest_path == tmp_path / "book" / "manifest.json"
+    manifest = read_manifest(tmp_path / "book.json")
+    assert [(shard["chapter_number"], shard["file"], shard["chunk_count"]) for shard in manifest["shards"]] == [
+        (1, "chapter_001.jsonl", 2),
+        (2, "chapter_002.jsonl", 1),
+    ]
+    assert manifest["chunk_count"] == 3
+    assert manifest["changes"] == payload["changes"]
+    assert read_sharded_output(tmp_path / "book.json")["chunks"] == [chunk.to_dict() for chunk in payload["chunks"]]
+
+
+def test_offsets_point_at_each_chunk_line(tmp_path: Path, make_payload) -> None:
+    payload = make_payload(chapters={1: ["Seli", "Tishu — ñ", "Ogani"]})
+    write_sharded_output(tmp_path / "book.json", payload)
+
+    shard = read_manifest(tmp_path / "book.json")["shards"][0]
+    data = (tmp_path / "book" / shard["file"]).read_bytes()
+
+    assert shard["bytes"] == len(data)
+    for offset, chunk in zip(shard["offsets"], payload["chunks"]):
+        line = data[offset:data.index(b"\n", offset)]
+        assert json.loads(line)["content"] == chunk.content
+
+
+def test_shard_digest_changes_only_for_edited_chapters(tmp_path: Path, make_payload) -> None:
+    write_sharded_output(tmp_path / "before.json", make_payload(chapters={1: ["Seli"], 2: ["Viungo"]}))
+    write_sharded_output(tmp_path / "after.json", make_payload(chapters={1: ["Seli"], 2: ["Viungo vya mwili"]}))
+
+    before = {shard["chapter_number"]: shard["content_hash"] for shard in read_manifest(tmp_path / "before.json")["shards"]}
+    after = {shard["chapter_number"]: shard["content_hash"] for shard in read_manifest(tmp_path / "after.json")["shards"]}
+
+    assert before[1] == after[1]
+    assert before[2] != after[2]
+
+
+@pytest.mark.parametrize("compression", [OutputCompression.GZIP, OutputCompression.ZSTD])
+def test_compressed_shards_round_trip(tmp_path: Path, compression: OutputCompression, make_payload) -> None:
+    if compression == OutputCompression.ZSTD:
+        pytest.importorskip("zstandard")
+    payload = make_payload(chapters={3: ["Seli", "Tishu"]})
+
+    write_sharded_output(tmp_path / "book.json", payload, compression=compression)
+
+    shard = read_manifest(tmp_path / "book.json")["shards"][0]
+    assert shard["file"].endswith((".gz", ".zst"))
+    assert list(iter_shard_chunks(tmp_path / "book.json", shard)) == [chunk.to_dict() for chunk in payload["chunks"]]
+
+
+def test_failed_write_keeps_previous_shards(tmp_path: Path, make_payload) -> None:
+    write_sharded_output(tmp_path / "book.json", make_payload(chapters={1: ["Seli"]}))
+
+    def failing_chunks():
+        yield make_payload(chapters={1: ["Tishu"]})["chunks"][0]
+        raise RuntimeError("embedding failed")
+
+    with pytest.raises(RuntimeError):
+        write_sharded_output(tmp_path / "book.json", {"chunks": failing_chunks()})
+
+    assert [chunk["content"] for chunk in read_sharded_output(tmp_path / "book.json")["chunks"]] == ["Seli"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["book"]
+
+
+def test_output_dir_drops_json_and_compression_suffixes() -> None:
+    assert sharded_output_dir(Path("out/biology_form_4.json.zst")) == Path("out/biology_form_4")
+
+
+def test_output_dir_never_replaces_the_output_path_itself(tmp_path: Path, make_payload) -> None:
+    output_path = tmp_path / "biology_form_4"
+    output_path.write_text("notes kept next to the output")
+
+    manifest_path = write_sharded_output(output_path, make_payload(chapters={1: ["Seli"]}))
+
+    assert manifest_path.parent == tmp_path / "biology_form_4.shards"
+    assert output_path.read_text() == "notes kept next to the output"
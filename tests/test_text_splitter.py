@@ -0,0 +1,99 @@
+import random
+
+import pytest
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from src.infrastructure.splitter.text_splitter import (
+    DEFAULT_SEPARATORS,
+    RecursiveTextSplitter,
+)
+
+
+WORDS = ["the", "plant", "cell", "photosynthesis", "x" * 40, "mitochondria", "a", "$x^2$", "Tanzania"]
+GLUE = [" ", " ", " ", "\n", "\n\n", "\n\n\n", "  ", " \n "]
+
+
+def _random_text(rng: random.Random, length: int) -> str:
+    parts: list[str] = []
+    for _ in range(length):
+        parts.append(rng.choice(WORDS))
+        parts.append(rng.choice(GLUE))
+    return "".join(parts)
+
+
+@pytest.mark.parametrize(
+    "chunk_size, chunk_overlap",
+    [(250, 30), (800, 134), (40, 10), (10, 0), (25, 25)],
+)
+def test_matches_langchain_splitter(chunk_size: int, chunk_overlap: int) -> None:
+    rng = random.Random(chunk_size * 1000 + chunk_overlap)
+    reference = RecursiveCharacterTextSplitter(
+        separators=list(DEFAULT_SEPARATORS),
+        keep_separator=False,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+    )
+    splitter = RecursiveTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+    for _ in range(40):
+        text = _random_text(rng, rng.randint(0, 300))
+        assert [span.text for span in splitter.split_text(text)] == reference.split_text(text)
+
+
+def test_matches_langchain_splitter_with_custom_separators() -> None:
+    rng = random.Random(7)
+    separators = ["\n\n", ". ", "\n", " "]
+    reference = RecursiveCharacterTextSplitter(
+        separators=separators,
+        keep_separator=False,
+        chunk_size=60,
+        chunk_overlap=12,
+    )
+    splitter = RecursiveTextSplitter(separators=separators, chunk_size=60, chunk_overlap=12)
+
+    for _ in range(40):
+        text = _random_text(rng, rng.randint(0, 200)).replace("cell ", "cell. ")
+        assert [span.text for span in splitter.split_text(text)] == reference.split_text(text)
+
+
+def test_spans_point_back_to_their_page() -> None:
+    rng = random.Random(3)
+    pages = [_random_text(rng, 120) for _ in range(5)]
+    splitter = RecursiveTextSplitter(chunk_size=120, chunk_overlap=20)
+
+    spans = list(splitter.split_pages(pages))
+
+    assert {span.page for span in spans} == set(range(5))
+    for span in spans:
+        source = pages[span.page][span.start:span.end]
+        assert source.split() == span.text.split()
+        assert source == source.strip()
+
+
+def test_contiguous_chunks_are_exact_slices() -> None:
+    text = "one two three four five six seven"
+    splitter = RecursiveTextSplitter(chunk_size=10, chunk_overlap=4)
+
+    spans = splitter.split_text(text)
+
+    assert [span.text for span in spans] == ["one two", "two three", "four five", "five six", "six seven"]
+    assert all(text[span.start:span.end] == span.text for span in spans)
+
+
+def test_length_function_is_used_for_sizing() -> None:
+    splitter = RecursiveTextSplitter(chunk_size=3, chunk_overlap=0, length_function=lambda text: len(text.split()))
+    reference = RecursiveCharacterTextSplitter(
+        separators=list(DEFAULT_SEPARATORS),
+        keep_separator=False,
+        chunk_size=3,
+        chunk_overlap=0,
+        length_function=lambda text: len(text.split()),
+    )
+    text = "alpha beta gamma delta epsilon zeta eta theta"
+
+    assert [span.text for span in splitter.split_text(text)] == reference.split_text(text)
+
+
+def test_invalid_sizes_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        RecursiveTextSplitter(chunk_size=10, chunk_overlap=11)
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import pytest
+
+from src.domain.entities.chunker import ChunkerConfig, ChunkerType
+from src.infrastructure.chunker.mathematical_chunker import MathematicalChunker
+from src.infrastructure.splitter.text_splitter import create_text_splitter
+from src.infrastructure.splitter.tokenizer import CachedTokenCounter, load_tokenizer
+
+
+class _WordTokenizer:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def count_tokens(self, text: str) -> int:
+        self.calls.append(text)
+        return len(text.split())
+
+
+def _write_word_level_tokenizer(path: Path) -> Path:
+    tokenizers = pytest.importorskip("tokenizers")
+    vocabulary = {"[UNK]": 0, "cells": 1, "divide": 2, "and": 3, "grow": 4}
+    tokenizer = tokenizers.Tokenizer(tokenizers.models.WordLevel(vocab=vocabulary, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    tokenizer_path = path / "tokenizer.json"
+    tokenizer.save(str(tokenizer_path))
+    return tokenizer_path
+
+
+def test_cached_token_counter_tokenizes_each_text_once() -> None:
+    tokenizer = _WordTokenizer()
+    counter = CachedTokenCounter(tokenizer)
+
+    assert counter("cells divide") == 2
+    assert counter("cells divide") == 2
+    assert counter(" ") == 0
+
+    assert tokenizer.calls == ["cells divide", " "]
+
+
+def test_load_tokenizer_reads_local_tokenizer_json(tmp_path: Path) -> None:
+    _write_word_level_tokenizer(tmp_path)
+
+    tokenizer = load_tokenizer(tmp_path)
+
+    assert tokenizer.count_tokens("cells divide and grow fast") == 5
+
+
+def test_load_tokenizer_rejects_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        load_tokenizer(tmp_path / "missing.json")
+
+
+def test_token_mode_splits_by_token_count(tmp_path: Path) -> None:
+    tokenizer_path = _write_word_level_tokenizer(tmp_path)
+    splitter = create_text_splitter(chunk_size=3, chunk_overlap=1, tokenizer_path=str(tokenizer_path))
+
+    spans = splitter.split_text("cells divide and grow and divide")
+
+    assert [span.text for span in spans] == ["cells divide and", "and grow and", "and divide"]
+
+
+def test_chunker_uses_token_defaults_when_tokenizer_is_configured() -> None:
+    characters = MathematicalChunker(ChunkerConfig(chunker_type=ChunkerType.MATHEMATICAL))
+    tokens = MathematicalChunker(
+        ChunkerConfig(chunker_type=ChunkerType.MATHEMATICAL, tokenizer_path="tokenizer.json", chunk_overlap=10)
+    )
+
+    assert characters.get_chunk_size_and_overlap() == (MathematicalChunker.CHUNK_SIZE, MathematicalChunker.CHUNK_OVERLAP)
+    assert tokens.get_chunk_size_and_overlap() == (MathematicalChunker.TOKEN_CHUNK_SIZE, 10)
+
+
+def test_chunk_size_override_scales_the_default_overlap() -> None:
+    chunker = MathematicalChunker(ChunkerConfig(chunker_type=ChunkerType.MATHEMATICAL, chunk_size=100))
+
+    assert chunker.get_chunk_size_and_overlap() == (100, 16)
+
+
+def test_overlap_not_smaller_than_chunk_size_is_rejected() -> None:
+    chunker = MathematicalChunker(ChunkerConfig(chunker_type=ChunkerType.MATHEMATICAL, chunk_overlap=800))
+
+    with pytest.raises(ValueError, match="chunk_overlap \\(800\\) must be smaller than chunk_size \\(800\\)"):
+        chunker.get_chunk_size_and_overlap()